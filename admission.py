@@ -0,0 +1,143 @@
+"""
+요청 수 제한과 과부하 시 빠른 거절 (admission control)
+
+부하가 몰리면 모든 요청이 DB 커넥션을 기다리며(pool_timeout 30초) 사이트 전체가 함께 느려집니다.
+요청을 경로에 따라 등급으로 나누고, 등급마다 동시에 처리할 수 있는 요청 수와 기다릴 수 있는 요청 수/시간을 정해 둡니다.
+
+- 한도 안이면 바로 처리, 한도가 차면 대기열에서 순서대로 기다림
+- 대기열이 가득 찼거나 대기 시간 한도를 넘기면 `503` + `Retry-After`로 바로 거절 (처리 중인 요청은 영향 없음)
+- 등급마다 한도가 따로 있으므로 이메일 송신, 과목 일괄 반영처럼 무거운 요청이 몰려도 페이지와 일반 API는 계속 처리됨
+- `/ping`, `/metrics`, `/health`는 제한하지 않음 (부하 중에도 상태 확인이 가능하도록)
+- 등급별 한도는 ADMISSION_BUDGETS, 대기열 길이와 거절 수는 /metrics에서 확인
+"""
+# 외부 라이브러리
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Scope, Receive, Send
+# 내부 라이브러리
+import asyncio
+import math
+import re
+from collections import deque
+from typing import Optional
+# 직접 작성한 모듈
+from metrics import ADMISSION_SHED, register_admission_budgets
+from settings import ADMISSION_CONTROL, ADMISSION_BUDGETS
+
+# (등급, 메서드 (None이면 모두), 경로) - 위에서부터 처음 맞는 등급, 맞는 것이 없으면 "api"
+ROUTE_CLASSES = [
+    ("probe", None, r"/ping|/metrics|/health(/.*)?"),
+    # 외부 서비스(SMTP, OAuth provider)를 기다리는 요청
+    ("external", "POST", r"/signup/verify-email/request|/reset-password/request"),
+    ("external", "GET", r"/auth/(google|naver|kakao)/callback"),
+    # 한 요청에 쿼리/계산이 많은 요청
+    ("heavy", "PATCH", r"/courses/semester/[^/]+"),
+    ("heavy", "GET", r"/graduation/plan"),
+    # 정적 파일과 HTML 페이지 (경로가 한 단계인 GET)
+    ("page", "GET", r"/static/.*|/[a-z-]*"),
+]
+_COMPILED_CLASSES = [(name, method, re.compile(pattern)) for name, method, pattern in ROUTE_CLASSES]
+
+
+def route_class(method: str, path: str) -> str:
+    for name, class_method, pattern in _COMPILED_CLASSES:
+        if (class_method is None or class_method == method) and pattern.fullmatch(path):
+            return name
+    return "api"
+
+
+class Budget:
+    """등급 하나의 동시 처리 한도와 대기열 (이벤트 루프 안에서만 사용)"""
+
+    def __init__(self, name: str, limit: int, max_queue: int, queue_timeout: float):
+        self.name = name
+        self.limit = limit
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.retry_after = max(1, math.ceil(queue_timeout))
+        self.active = 0
+        self._waiters: deque[asyncio.Future] = deque()
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    async def acquire(self) -> Optional[str]:
+        """
+        처리 자리를 얻음
+
+        :return: 얻었으면 None, 거절이면 이유 ("queue_full" 또는 "timeout")
+        """
+        if self.active < self.limit and not self._waiters:
+            self.active += 1
+            return None
+        if len(self._waiters) >= self.max_queue:
+            return "queue_full"
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            # release()가 자리를 넘겨주면 결과가 설정됨 (active는 넘겨준 쪽에서 그대로 유지)
+            await asyncio.wait_for(waiter, self.queue_timeout)
+        except asyncio.TimeoutError:
+            self._discard(waiter)
+            return "timeout"
+        except BaseException:
+            # 연결이 끊겨 취소된 경우: 자리를 이미 넘겨받았으면 다음 요청에 넘김
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            else:
+                self._discard(waiter)
+            raise
+        return None
+
+    def _discard(self, waiter: asyncio.Future) -> None:
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+
+    def release(self) -> None:
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.active -= 1
+
+
+ADMISSION_BUDGETS_BY_CLASS = {name: Budget(name, *values) for name, values in ADMISSION_BUDGETS.items()}
+register_admission_budgets(ADMISSION_BUDGETS_BY_CLASS)
+
+
+class AdmissionMiddleware:
+    """경로 등급별 한도를 넘는 요청을 503으로 거절하는 ASGI 미들웨어"""
+
+    def __init__(self, app: ASGIApp, budgets: dict[str, Budget] = ADMISSION_BUDGETS_BY_CLASS,
+                 enabled: bool = ADMISSION_CONTROL):
+        self.app = app
+        self.budgets = budgets
+        self.enabled = enabled
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if not self.enabled or scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        name = route_class(scope["method"], scope["path"])
+        budget = self.budgets.get(name)
+        if budget is None:  # 한도가 없는 등급 (probe)
+            await self.app(scope, receive, send)
+            return
+
+        reason = await budget.acquire()
+        if reason is not None:
+            ADMISSION_SHED.inc(route_class=name, reason=reason)
+            response = JSONResponse(
+                {"detail": "요청이 많아 잠시 처리할 수 없습니다. 잠시 후 다시 시도해 주세요."},
+                status_code=503,
+                headers={"Retry-After": str(budget.retry_after)},
+            )
+            await response(scope, receive, send)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            budget.release()
@@ -2,7 +2,8 @@
 from fastapi import APIRouter, Response, status, HTTPException, Body, Depends
 from fastapi_mail import FastMail
 from pydantic import EmailStr
-from sqlmodel import Session, select, create_engine
+from sqlmodel import Session, select, insert, update, create_engine
+from sqlalchemy.exc import IntegrityError
 import itsdangerous
 # 내부 라이브러리
 from typing import Optional, Union, Annotated
@@ -13,6 +14,8 @@ from models import User, utc_now_factory, generate_verification_code
 from schemas.user import (LoginRequest, PasswordResetRequest, PasswordResetConfirm,
                           EmailVerificationRequest, EmailVerificationConfirm, SignupRequest)
 from email_utility import send_reset_email, send_signup_verification_email
+from write_coordinator import WRITE_COORDINATOR
+from tracing import traced
 from env import (DATABASE_URL, COOKIE_KEY, CODE_EXPIRE_SECONDS, MAX_VERIFICATION_TRIES,
                  VERIFICATION_DELAY)
 
@@ -48,10 +51,26 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return hash_password(plain_password) == hashed_password
 
 
+@traced()
 def get_user_by_email(session: Session, email: Union[str, EmailStr]) -> Optional[User]:
     return session.exec(select(User).where(User.email == email)).first()
 
 
+def update_user(email: str, **values):
+    """User 한 행을 values로 바꾸는 쓰기 작업 (WRITE_COORDINATOR.run에 전달)"""
+    def work(session: Session) -> None:
+        session.execute(update(User).where(User.email == email).values(**values))
+    return work
+
+
+def insert_user(**values):
+    """User 한 행을 추가하는 쓰기 작업 (WRITE_COORDINATOR.run에 전달, 나머지 열은 모델 기본값)"""
+    def work(session: Session) -> None:
+        session.execute(insert(User).values(**values))
+    return work
+
+
+@traced()
 def authenticate_user(session: Session, email: Union[str, EmailStr], password: str) -> User:
     user = get_user_by_email(session, email)
     if not (user and verify_password(password, user.password_hash)):
@@ -158,9 +177,12 @@ async def signup(signup_request: Annotated[SignupRequest, Body()], response: Res
         user: Optional[User] = get_user_by_email(session, signup_request.email)
         if user:
             raise HTTPException(status_code=400, detail="이미 등록된 이메일입니다.")
-        new_user = User(email=signup_request.email, password_hash=hash_password(signup_request.password))
-        session.add(new_user)
-        session.commit()
+        try:
+            await WRITE_COORDINATOR.run(session, insert_user(
+                email=signup_request.email, password_hash=hash_password(signup_request.password)))
+        except IntegrityError:
+            # 같은 이메일로 동시에 가입한 경우
+            raise HTTPException(status_code=400, detail="이미 등록된 이메일입니다.")
         return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
@@ -238,17 +260,16 @@ async def request_signup_email_verification(request: EmailVerificationRequest, e
                 )
         user_email = user.email
         code = generate_verification_code()
+        current_verification_try = user.email_verification_try + 1
 
-        user.verification_key = code
-        user.key_created_at = now
-        user.email_verification_try += 1
-        user.last_verification_try = now
-        user.updated_at = now
-
-        current_verification_try = user.email_verification_try
-
-        session.add(user)
-        session.commit()
+        await WRITE_COORDINATOR.run(session, update_user(
+            user_email,
+            verification_key=code,
+            key_created_at=now,
+            email_verification_try=current_verification_try,
+            last_verification_try=now,
+            updated_at=now,
+        ))
 
     await send_signup_verification_email(
         fm,
@@ -313,15 +334,15 @@ def confirm_signup_email_verification(request: EmailVerificationConfirm, engine
         if now > user.key_created_at.replace(tzinfo=timezone.utc) + timedelta(seconds=CODE_EXPIRE_SECONDS):
             raise HTTPException(status_code=400, detail="인증 코드가 만료되었습니다.")
 
-        user.is_active = True
-        user.verification_key = None
-        user.key_created_at = None
-        user.email_verification_try = 0
-        user.last_verification_try = None
-        user.updated_at = now
-
-        session.add(user)
-        session.commit()
+        WRITE_COORDINATOR.run_sync(session, update_user(
+            user.email,
+            is_active=True,
+            verification_key=None,
+            key_created_at=None,
+            email_verification_try=0,
+            last_verification_try=None,
+            updated_at=now,
+        ))
 
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
@@ -396,16 +417,16 @@ async def request_password_reset(request: PasswordResetRequest, engine = Depends
                 )
         user_email = user.email
         code = generate_verification_code()
-        user.verification_key = code
-        user.key_created_at = now
-        user.email_verification_try += 1
-        user.last_verification_try = now
-        user.updated_at = now
+        current_verification_try = user.email_verification_try + 1
 
-        current_verification_try = user.email_verification_try
-
-        session.add(user)
-        session.commit()
+        await WRITE_COORDINATOR.run(session, update_user(
+            user_email,
+            verification_key=code,
+            key_created_at=now,
+            email_verification_try=current_verification_try,
+            last_verification_try=now,
+            updated_at=now,
+        ))
 
     await send_reset_email(
         fm,
@@ -462,15 +483,15 @@ def confirm_password_reset(request: PasswordResetConfirm, response: Response, en
         if now > user.key_created_at.replace(tzinfo=timezone.utc) + timedelta(seconds=CODE_EXPIRE_SECONDS):
             raise HTTPException(status_code=400, detail="인증 코드가 만료되었습니다.")
 
-        user.password_hash = hash_password(request.new_password)
-        user.updated_at = now
-        user.verification_key = None
-        user.key_created_at = None
-        user.email_verification_try = 0
-        user.last_verification_try = None
-
-        session.add(user)
-        session.commit()
+        WRITE_COORDINATOR.run_sync(session, update_user(
+            user.email,
+            password_hash=hash_password(request.new_password),
+            updated_at=now,
+            verification_key=None,
+            key_created_at=None,
+            email_verification_try=0,
+            last_verification_try=None,
+        ))
 
     response.set_cookie(
         key='auth',
@@ -1,14 +1,22 @@
 # 외부 라이브러리
-from sqlmodel import Session, create_engine
+from sqlmodel import Session
 import itsdangerous
 from typing import Optional
 # 직접 작성한 모듈
-from env import DATABASE_URL, COOKIE_KEY
+from env import COOKIE_KEY
+from database import engine
+from tracing import traced
 
 
 def get_engine():
-    """데이터베이스 엔진 생성"""
-    return create_engine(DATABASE_URL, echo=True)
+    """애플리케이션 공용 데이터베이스 엔진"""
+    return engine
+
+
+def get_session():
+    """요청 단위 Session (요청이 끝나면 닫아서 커넥션을 풀에 반환)"""
+    with Session(engine) as session:
+        yield session
 
 
 def get_serializer():
@@ -21,6 +29,7 @@ def cookie_generate(data: str, serializer: itsdangerous.URLSafeSerializer) -> st
     return serializer.dumps(data)
 
 
+@traced()
 def cookie_load(cookie_string: str, serializer: itsdangerous.URLSafeSerializer) -> Optional[str]:
     """쿠키 복호화 및 검증"""
     try:
@@ -0,0 +1,256 @@
+"""
+과목명 자동완성 인덱스
+
+카탈로그 과목명과 학생들이 이미 등록한 과목명을 정렬된 배열 두 개로 들고, 이분 탐색으로 접두어 검색을 합니다.
+
+- 자모 인덱스: 과목명을 자모 단위로 분해한 키 ("자료구조" → "ㅈㅏㄹㅛㄱㅜㅈㅗ").
+  검색어도 똑같이 분해하므로 입력 중인 음절("잘", "자ㄹ")로도 찾을 수 있음
+- 초성 인덱스: 음절마다 초성만 남긴 키 ("자료구조" → "ㅈㄹㄱㅈ")
+- 두 인덱스 모두 각 음절에서 시작하는 접미어도 넣어서 "구조", "ㄱㅈ"로도 "자료구조"를 찾음
+
+새 과목명은 `bisect.insort`로 바로 끼워 넣으므로 인덱스 전체를 다시 만들 필요가 없습니다.
+검색 결과는 (검색어, 개수)별로 캐시하고 인덱스가 바뀌면 비웁니다.
+다른 학생이 직접 입력한 과목명은 AUTOCOMPLETE_MIN_STUDENTS명 이상이 등록해야 노출됩니다.
+"""
+# 외부 라이브러리
+from sqlalchemy import func
+from sqlmodel import Session, select
+# 내부 라이브러리
+import bisect
+import threading
+from dataclasses import dataclass
+from itertools import groupby
+from operator import itemgetter
+from typing import Iterable, Optional
+# 직접 작성한 모듈
+from catalog import CATALOG, CatalogCourse, normalize_course_name
+from models.course import Course
+from settings import AUTOCOMPLETE_MIN_STUDENTS
+
+_SYLLABLE_BASE, _SYLLABLE_LAST = 0xAC00, 0xD7A3
+_CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+_JONGSEONG = ("", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ", "ㄿ", "ㅀ",
+              "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ")
+# 겹받침/겹모음은 키보드로 두 번 누르는 자모로 풀어야 입력 중인 글자와 맞음 ("닭" 입력 중 "달" → ㄷㅏㄹ)
+_COMPOUND = {
+    "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ", "ㅝ": "ㅜㅓ", "ㅞ": "ㅜㅔ", "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ",
+    "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ", "ㄽ": "ㄹㅅ",
+    "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ",
+}
+_CHOSEONG_SET = frozenset(_CHOSEONG)
+
+# 짧은 검색어("ㅈ")가 인덱스 대부분과 맞을 때 순위 계산 전에 훑어볼 최대 항목 수
+MAX_SCAN = 2000
+# 검색 결과 캐시 크기 (인덱스가 바뀌면 비움)
+RESULT_CACHE_SIZE = 4096
+
+
+def decompose(text: str) -> str:
+    """한글 음절을 자모로 분해 (이미 정규화된 문자열 기준)"""
+    jamo = []
+    for char in text:
+        code = ord(char)
+        if _SYLLABLE_BASE <= code <= _SYLLABLE_LAST:
+            offset = code - _SYLLABLE_BASE
+            jamo.append(_CHOSEONG[offset // 588])
+            jamo.append(_COMPOUND.get(_JUNGSEONG[(offset % 588) // 28], _JUNGSEONG[(offset % 588) // 28]))
+            final = _JONGSEONG[offset % 28]
+            jamo.append(_COMPOUND.get(final, final))
+        else:
+            jamo.append(_COMPOUND.get(char, char))
+    return "".join(jamo)
+
+
+def choseong(text: str) -> str:
+    """한글 음절은 초성만, 나머지 문자는 그대로"""
+    return "".join(_CHOSEONG[(ord(char) - _SYLLABLE_BASE) // 588]
+                   if _SYLLABLE_BASE <= ord(char) <= _SYLLABLE_LAST else char
+                   for char in text)
+
+
+def is_choseong_query(text: str) -> bool:
+    """모든 한글이 초성 자음인 검색어 ("ㅈㄹㄱㅈ", "ㅇㅅsw")"""
+    return any(char in _CHOSEONG_SET for char in text) and not any(
+        _SYLLABLE_BASE <= ord(char) <= _SYLLABLE_LAST or "ㅏ" <= char <= "ㅣ" for char in text)
+
+
+@dataclass(frozen=True)
+class Suggestion:
+    name: str
+    catalog_course: Optional[CatalogCourse]
+
+
+class CourseNameIndex:
+    def __init__(self, min_students: int = AUTOCOMPLETE_MIN_STUDENTS):
+        self.min_students = min_students
+        self._lock = threading.Lock()
+        self._names: list[str] = []  # name id -> 표시할 과목명
+        self._catalog: list[Optional[CatalogCourse]] = []
+        self._ids: dict[str, int] = {}  # 정규화된 과목명 -> name id
+        self._student_ids: dict[str, set[int]] = {}  # 아직 노출되지 않은 과목명을 등록한 학생 id (같은 학생은 한 번만)
+        # (키, 시작 음절 위치, name id) 정렬 배열. 과목명 맨 앞부터의 키(prefix)와 중간 음절부터의 키(infix)를 나눠
+        # 맨 앞에서 맞은 과목명이 limit개 이상이면 infix 배열은 보지 않음
+        self._jamo_prefix: list[tuple[str, int, int]] = []
+        self._jamo_infix: list[tuple[str, int, int]] = []
+        self._choseong_prefix: list[tuple[str, int, int]] = []
+        self._choseong_infix: list[tuple[str, int, int]] = []
+        self._cache: dict[tuple[str, int], tuple[Suggestion, ...]] = {}
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def _register(self, name: str, catalog_course: Optional[CatalogCourse]) -> Optional[list]:
+        """name id를 부여하고 인덱스에 넣을 (키, 위치, id) 항목 반환 (이미 있으면 None, 잠금 안에서 호출)"""
+        normalized = normalize_course_name(name)
+        if not normalized or normalized in self._ids:
+            return None
+        name_id = len(self._names)
+        self._ids[normalized] = name_id
+        self._names.append(catalog_course.name if catalog_course else name.strip())
+        self._catalog.append(catalog_course)
+        self._student_ids.pop(normalized, None)
+        return [(normalized[start:], start, name_id) for start in range(len(normalized))]
+
+    def add(self, name: str, catalog_course: Optional[CatalogCourse] = None) -> bool:
+        """과목명 하나를 인덱스에 끼워 넣음 (이미 있으면 False)"""
+        with self._lock:
+            suffixes = self._register(name, catalog_course)
+            if suffixes is None:
+                return False
+            for suffix, start, name_id in suffixes:
+                bisect.insort(self._jamo_infix if start else self._jamo_prefix, (decompose(suffix), start, name_id))
+                bisect.insort(self._choseong_infix if start else self._choseong_prefix,
+                              (choseong(suffix), start, name_id))
+            self._cache.clear()
+            return True
+
+    def extend(self, names: Iterable[tuple[str, Optional[CatalogCourse]]]) -> int:
+        """여러 과목명을 한 번에 추가 (항목을 모두 붙인 뒤 한 번만 정렬), 추가된 개수 반환"""
+        added = 0
+        with self._lock:
+            for name, catalog_course in names:
+                suffixes = self._register(name, catalog_course)
+                if suffixes is None:
+                    continue
+                added += 1
+                for suffix, start, name_id in suffixes:
+                    (self._jamo_infix if start else self._jamo_prefix).append((decompose(suffix), start, name_id))
+                    (self._choseong_infix if start else self._choseong_prefix).append(
+                        (choseong(suffix), start, name_id))
+            if added:
+                for keys in (self._jamo_prefix, self._jamo_infix, self._choseong_prefix, self._choseong_infix):
+                    keys.sort()
+                self._cache.clear()
+        return added
+
+    def _count(self, name: str, student_ids: Iterable[int]) -> Optional[tuple[str, Optional[CatalogCourse]]]:
+        """등록한 학생 id를 모으고, 서로 다른 학생 수가 기준에 닿으면 (과목명, 카탈로그 과목) 반환"""
+        catalog_course = CATALOG.find(name)
+        if catalog_course:
+            return catalog_course.name, catalog_course
+        normalized = normalize_course_name(name)
+        if normalized in self._ids:
+            return None
+        with self._lock:
+            students = self._student_ids.setdefault(normalized, set())
+            students.update(student_ids)
+            count = len(students)
+        return (name, None) if count >= self.min_students else None
+
+    def observe(self, name: str, student_id: int) -> None:
+        """
+        학생 한 명이 과목을 등록했음을 기록 (등록한 학생 수가 기준에 닿으면 인덱스에 추가)
+
+        같은 학생이 과목을 지웠다가 다시 등록해도 한 명으로 셉니다.
+        """
+        entry = self._count(name, (student_id,))
+        if entry:
+            self.add(*entry)
+
+    def load(self, names: Iterable[str], course_students: Iterable[tuple[str, Iterable[int]]]) -> int:
+        """
+        기동 시 DB의 과목명을 한 번에 반영
+
+        :param names: 이미 기준 학생 수에 닿은 과목명 (바로 인덱스에 추가)
+        :param course_students: 아직 기준에 닿지 않은 (과목명, 등록한 학생 id 목록)
+        """
+        entries = [self._count(name, student_ids) for name, student_ids in course_students]
+        return self.extend([*((name, CATALOG.find(name)) for name in names), *(entry for entry in entries if entry)])
+
+    def clear_cache(self) -> None:
+        self._cache.clear()
+
+    def _scan(self, keys: list, query: str, best: dict) -> None:
+        index = bisect.bisect_left(keys, (query,))
+        end = min(len(keys), index + MAX_SCAN)
+        while index < end:
+            key, start, name_id = keys[index]
+            if not key.startswith(query):
+                break
+            if name_id not in best or start < best[name_id]:
+                best[name_id] = start
+            index += 1
+
+    def search(self, query: str, limit: int = 10) -> tuple[Suggestion, ...]:
+        """
+        접두어 검색
+
+        순위: 과목명 맨 앞에서 맞은 것 > 중간 음절에서 맞은 것, 같은 위치면 카탈로그 과목 > 짧은 과목명
+        """
+        normalized = normalize_course_name(query)
+        if not normalized:
+            return ()
+        cache_key = (normalized, limit)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        jamo_query = decompose(normalized)
+        choseong_query = is_choseong_query(normalized)
+        best: dict[int, int] = {}  # name id -> 가장 앞에서 맞은 음절 위치
+        self._scan(self._jamo_prefix, jamo_query, best)
+        if choseong_query:
+            self._scan(self._choseong_prefix, normalized, best)
+        if len(best) < limit:
+            self._scan(self._jamo_infix, jamo_query, best)
+            if choseong_query:
+                self._scan(self._choseong_infix, normalized, best)
+        ranked = sorted(best.items(), key=lambda item: (
+            item[1], self._catalog[item[0]] is None, len(self._names[item[0]]), self._names[item[0]]))
+        result = tuple(Suggestion(self._names[name_id], self._catalog[name_id]) for name_id, _ in ranked[:limit])
+
+        if len(self._cache) >= RESULT_CACHE_SIZE:
+            self._cache.clear()
+        self._cache[cache_key] = result
+        return result
+
+
+def build_index() -> CourseNameIndex:
+    """카탈로그 과목명으로 채운 인덱스 생성"""
+    index = CourseNameIndex()
+    index.extend((course.name, course) for course in CATALOG.courses)
+    return index
+
+
+def load_course_students(session: Session, min_students: int = AUTOCOMPLETE_MIN_STUDENTS
+                         ) -> tuple[list[str], list[tuple[str, list[int]]]]:
+    """
+    이미 등록된 과목명 (재수강 제외): (기준 학생 수에 닿은 과목명, 아직 닿지 않은 과목명별 학생 id)
+
+    학생 id는 기준에 닿지 않은 과목명만 읽음 (나중에 같은 학생이 다시 등록해도 한 명으로 세기 위해)
+    """
+    counts = (select(Course.course_name)
+              .where(Course.is_retake == False)  # noqa: E712
+              .group_by(Course.course_name))
+    names = list(session.exec(counts.having(func.count(Course.student_id) >= min_students)).all())
+    stmt = (select(Course.course_name, Course.student_id)
+            .where(Course.is_retake == False,  # noqa: E712
+                   Course.course_name.in_(counts.having(func.count(Course.student_id) < min_students)))
+            .order_by(Course.course_name))
+    return names, [(name, [student_id for _, student_id in rows])
+                   for name, rows in groupby(session.exec(stmt).all(), key=itemgetter(0))]
+
+
+# 기동 직후에는 카탈로그 과목만, lifespan에서 load로 DB의 과목명을 이어서 추가
+COURSE_NAME_INDEX = build_index()
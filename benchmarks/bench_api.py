@@ -0,0 +1,234 @@
+"""
+메인 API 부하 테스트 및 회귀 벤치마크
+
+시드 데이터가 들어간 SQLite DB를 만들고, 앱을 두 가지 방식으로 구동해 측정합니다.
+
+- `inprocess`: httpx의 ASGITransport로 앱을 같은 프로세스에서 직접 호출 (네트워크 비용 제외)
+- `socket`: uvicorn을 로컬 포트에 띄우고 실제 TCP 소켓으로 호출
+
+각 시나리오를 고정된 동시성 수준에서 실행해 RPS와 p50/p95/p99 latency를 출력하고,
+베이스라인을 저장하거나 베이스라인 대비 회귀가 있으면 종료 코드 1로 실패합니다.
+
+사용 예시 (저장소 루트에서 실행, 결과표는 stderr로 출력):
+    python -m benchmarks.bench_api --save-baseline
+    python -m benchmarks.bench_api --threshold 0.15
+"""
+# 외부 라이브러리
+import httpx
+import uvicorn
+# 내부 라이브러리
+import argparse
+import asyncio
+import itertools
+import socket
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Optional
+# 직접 작성한 모듈
+from benchmarks.common import (prepare_app_import, summarize, load_baseline, save_baseline,
+                               compare_with_baseline, print_table)
+
+BASELINE_NAME = "api"
+PASSWORD = "bench1234"
+STATIC_PAGES = ["/", "/dashboard", "/grade-management", "/graduation-calculator", "/my", "/course-management"]
+
+
+@dataclass
+class Scenario:
+    name: str
+    method: str
+    path: str
+    expected_status: int
+    # 요청마다 바뀌는 body가 필요한 시나리오 (예: POST /courses)
+    body_factory: Optional[Callable[[int], dict]] = None
+    # 쿠키 없이 호출하는 시나리오 (예: /login, 정적 페이지)
+    anonymous: bool = False
+    tags: set = field(default_factory=set)
+
+
+def seed_database(database_url: str, students: int, courses_per_student: int) -> list[str]:
+    """벤치마크용 이메일 사용자, 학생, 과목을 생성하고 이메일 목록을 반환"""
+    from benchmarks.datagen import generate
+    dataset = generate(database_url, students, courses_per_student,
+                       auth_weights={"email": 1.0}, password=PASSWORD)
+    return dataset.identities["email"]
+
+
+def build_scenarios(emails: list[str]) -> list[Scenario]:
+    counter = itertools.count()
+
+    def course_body(_: int) -> dict:
+        # uq_student_course_retake에 걸리지 않도록 매번 새 과목명 사용
+        return {"semester": "4-2", "course_name": f"벤치과목{next(counter)}",
+                "credits": 3, "grade": 4.5, "is_major": True, "is_retake": False}
+
+    def projection_body(_: int) -> dict:
+        # 한 학기 6과목, 과목마다 B0~A+ 범위
+        return {"courses": [{"course_name": f"예정과목{i}", "credits": 3, "min_grade": 3.0} for i in range(6)],
+                "target_gpa": 3.5, "scenarios": 5000}
+
+    def login_body(i: int) -> dict:
+        return {"email": emails[i], "password": PASSWORD}
+
+    scenarios = [
+        Scenario("login", "POST", "/login", 204, body_factory=login_body, anonymous=True, tags={"auth"}),
+        Scenario("student_status", "GET", "/student/status", 200, tags={"read"}),
+        Scenario("course_all", "GET", "/course/all", 200, tags={"read"}),
+        Scenario("courses_semester", "GET", "/courses/semester/2-1", 200, tags={"read"}),
+        Scenario("graduation_status", "GET", "/graduation/status", 200, tags={"read"}),
+        Scenario("gpa_projection", "POST", "/gpa/projection", 200, body_factory=projection_body, tags={"read"}),
+        Scenario("create_course", "POST", "/courses", 201, body_factory=course_body, tags={"write"}),
+    ]
+    for page in STATIC_PAGES:
+        name = "static" + (page.replace("/", "_").replace("-", "_") if page != "/" else "_index")
+        scenarios.append(Scenario(name, "GET", page, 200, anonymous=True, tags={"static"}))
+    return scenarios
+
+
+async def run_level(client: httpx.AsyncClient, scenario: Scenario, concurrency: int,
+                    total_requests: int, cookies: list[str]) -> dict:
+    """하나의 시나리오를 고정 동시성으로 total_requests번 실행"""
+    latencies: list[float] = []
+    errors = 0
+    issued = itertools.count()
+
+    async def worker():
+        nonlocal errors
+        while (i := next(issued)) < total_requests:
+            user_index = i % len(cookies)
+            headers = {} if scenario.anonymous else {"Cookie": f"auth={cookies[user_index]}"}
+            body = scenario.body_factory(user_index) if scenario.body_factory else None
+            started = time.perf_counter()
+            try:
+                response = await client.request(scenario.method, scenario.path, json=body, headers=headers)
+                ok = response.status_code == scenario.expected_status
+            except httpx.HTTPError:
+                ok = False
+            elapsed = time.perf_counter() - started
+            if ok:
+                latencies.append(elapsed)
+            else:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(latencies, time.perf_counter() - started, errors)
+
+
+async def run_suite(client: httpx.AsyncClient, mode: str, scenarios: list[Scenario],
+                    levels: list[int], requests_per_level: int, cookies: list[str]) -> dict:
+    results = {}
+    for scenario in scenarios:
+        # 워밍업 (커넥션 풀, 파일 캐시 등)
+        await run_level(client, scenario, 1, min(10, requests_per_level), cookies)
+        for concurrency in levels:
+            key = f"{mode}/{scenario.name}/c{concurrency}"
+            results[key] = await run_level(client, scenario, concurrency, requests_per_level, cookies)
+            print(f"  {key}: {results[key]['rps']} rps", file=sys.stderr)
+    return results
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+class BackgroundServer:
+    """uvicorn을 별도 스레드에서 실행 (실제 소켓 경유 측정용)"""
+
+    def __init__(self, app, port: int):
+        config = uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning",
+                                access_log=False, lifespan="on")
+        self.server = uvicorn.Server(config)
+        self.thread = threading.Thread(target=self.server.run, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        while not self.server.started:
+            time.sleep(0.01)
+        return self
+
+    def __exit__(self, *exc):
+        self.server.should_exit = True
+        self.thread.join(timeout=10)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Graduon API 부하 테스트 / 회귀 벤치마크")
+    parser.add_argument("--mode", choices=["inprocess", "socket", "both"], default="both")
+    parser.add_argument("--concurrency", default="1,8,32", help="쉼표로 구분한 동시성 수준")
+    parser.add_argument("--requests", type=int, default=200, help="동시성 수준별 요청 수")
+    parser.add_argument("--students", type=int, default=50, help="시드 학생 수")
+    parser.add_argument("--courses", type=int, default=60, help="졸업 학년 기준 학생당 평균 과목 수")
+    parser.add_argument("--only", default="", help="쉼표로 구분한 시나리오 이름 또는 태그(read, write, auth, static)")
+    parser.add_argument("--baseline", default=BASELINE_NAME, help="베이스라인 이름 (benchmarks/baselines/<name>.json)")
+    parser.add_argument("--save-baseline", action="store_true", help="이번 결과를 베이스라인으로 저장")
+    parser.add_argument("--threshold", type=float, default=0.15, help="회귀로 판단할 변화 비율")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    levels = [int(c) for c in args.concurrency.split(",") if c]
+
+    workdir = Path(tempfile.mkdtemp(prefix="graduon-bench-"))
+    database_url = f"sqlite:///{workdir / 'bench.db'}"
+    prepare_app_import(database_url)
+    emails = seed_database(database_url, args.students, args.courses)
+
+    from main import app
+    from auth_utils import get_serializer, cookie_generate
+
+    serializer = get_serializer()
+    cookies = [cookie_generate(email, serializer) for email in emails]
+
+    scenarios = build_scenarios(emails)
+    if args.only:
+        wanted = set(args.only.split(","))
+        scenarios = [s for s in scenarios if s.name in wanted or s.tags & wanted]
+
+    async def run_all() -> dict:
+        results = {}
+        limits = httpx.Limits(max_connections=max(levels), max_keepalive_connections=max(levels))
+        if args.mode in ("inprocess", "both"):
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+                results.update(await run_suite(client, "inprocess", scenarios, levels, args.requests, cookies))
+        if args.mode in ("socket", "both"):
+            port = _free_port()
+            with BackgroundServer(app, port):
+                async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", limits=limits) as client:
+                    results.update(await run_suite(client, "socket", scenarios, levels, args.requests, cookies))
+        return results
+
+    results = asyncio.run(run_all())
+
+    baseline = load_baseline(args.baseline)
+    print_table(results, baseline)
+
+    if args.save_baseline:
+        path = save_baseline(args.baseline, results)
+        print(f"베이스라인 저장: {path}", file=sys.stderr)
+        return 0
+
+    if baseline is None:
+        print("비교할 베이스라인이 없습니다. --save-baseline으로 먼저 저장하세요.", file=sys.stderr)
+        return 0
+
+    regressions = compare_with_baseline(results, baseline, args.threshold)
+    if regressions:
+        print(f"\n회귀 감지 (threshold={args.threshold:.0%}):", file=sys.stderr)
+        for line in regressions:
+            print(f"  - {line}", file=sys.stderr)
+        return 1
+    print("\n베이스라인 대비 회귀 없음", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
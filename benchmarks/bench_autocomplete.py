@@ -0,0 +1,85 @@
+"""
+과목명 자동완성 인덱스 벤치마크
+
+카탈로그 과목명 + 합성 과목명 N개로 인덱스를 만들고, 입력 중인 검색어(초성, 음절 일부, 중간 음절)로
+`CourseNameIndex.search`를 반복 호출해서 latency를 측정합니다. (cold: 매번 결과 캐시를 비움, cached: 캐시 사용)
+인덱스 생성 시간과 과목명 하나를 끼워 넣는 시간(증분 갱신)도 함께 출력합니다.
+
+사용 예시:
+    python -m benchmarks.bench_autocomplete --names 0,1000,20000 --queries 20000
+"""
+# 내부 라이브러리
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+# 직접 작성한 모듈
+from benchmarks.common import prepare_app_import, summarize, print_table
+from benchmarks.datagen import MAJOR_COURSES, GENERAL_COURSES
+
+QUERIES = ["ㅈ", "ㅈㄹ", "ㅈㄹㄱㅈ", "자", "잘", "자료", "자료구", "구조", "ㄷㅇㅌ", "데이터", "데이터베ㅇ",
+           "컴퓨터", "ㅋㅍㅌ", "sw", "프로그래밍", "ㅍㄹㄱㄹㅁ", "미적분", "대학영어", "없는과목이름"]
+SYLLABLES = "가나다라마바사아자차카타파하고노도로모보소오조초코토포호구누두루무부수우주추쿠투푸후기니디리미비시이지치키티피히"
+
+
+def synthetic_names(count: int, seed: int) -> list[str]:
+    """카탈로그/교양 과목명을 변형한 자유 입력 과목명"""
+    rng = random.Random(seed)
+    base = MAJOR_COURSES + GENERAL_COURSES
+    names = set()
+    while len(names) < count:
+        name = rng.choice(base)
+        suffix = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(1, 4)))
+        names.add(name + suffix if rng.random() < 0.7 else suffix + name)
+    return sorted(names)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="과목명 자동완성 인덱스 벤치마크")
+    parser.add_argument("--names", default="0,1000,20000", help="카탈로그 외에 추가할 과목명 수 (쉼표 구분)")
+    parser.add_argument("--queries", type=int, default=20000)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    prepare_app_import(f"sqlite:///{Path(tempfile.mkdtemp(prefix='graduon-ac-')) / 'app.db'}")
+    from autocomplete import build_index
+
+    results = {}
+    for count in [int(value) for value in args.names.split(",")]:
+        names = synthetic_names(count, args.seed)
+        started = time.perf_counter()
+        index = build_index()
+        index.min_students = 1
+        index.load(names, ())
+        build_seconds = time.perf_counter() - started
+
+        for mode in ("cold", "cached"):
+            latencies = []
+            started = time.perf_counter()
+            for i in range(args.queries):
+                query = QUERIES[i % len(QUERIES)]
+                if mode == "cold":
+                    index.clear_cache()
+                query_started = time.perf_counter()
+                index.search(query, args.limit)
+                latencies.append(time.perf_counter() - query_started)
+            results[f"search-{mode}/{len(index)}names"] = summarize(latencies, time.perf_counter() - started)
+
+        inserts = []
+        started = time.perf_counter()
+        for i in range(200):
+            insert_started = time.perf_counter()
+            index.add(f"새과목{i}{SYLLABLES[i % len(SYLLABLES)]}")
+            inserts.append(time.perf_counter() - insert_started)
+        results[f"insert/{len(index)}names"] = summarize(inserts, time.perf_counter() - started)
+        print(f"build {len(index)} names: {build_seconds * 1000:.1f}ms", file=sys.stderr)
+
+    print_table(results)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
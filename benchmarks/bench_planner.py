@@ -0,0 +1,107 @@
+"""
+남은 학기 수강 계획(학기 배치 탐색) 벤치마크
+
+실제 이수체계도 전체와, 탐색이 어려운 합성 교과과정으로 `schedule_courses`를 실행해서
+걸린 시간, 찾은 학기 수, 하한과의 차이, 최적 여부를 출력합니다.
+`--reference-ms`를 주면 시간 예산을 늘려 다시 풀어서, 예산 안에 찾은 계획이 더 긴 경우를 셉니다.
+
+- catalog: 이수체계도 전체 (신입생)
+- layered: 한 층에 여러 과목, 바로 앞 층의 1~3과목이 선수과목
+- chains: 긴 선수과목 사슬 여러 개 + 선수과목 없는 과목 다수 (학점 상한이 빠듯함)
+- dense: 앞 과목 중 아무거나 선수과목 (확률 p)
+- packing: 선수과목 없이 1~4학점 과목만 (학기 수가 사실상 bin packing으로 정해짐)
+
+사용 예시:
+    python -m benchmarks.bench_planner --sizes 40,80 --caps 10,18 --instances 20 --budget-ms 200
+    python -m benchmarks.bench_planner --caps 7 --reference-ms 5000
+"""
+# 내부 라이브러리
+import argparse
+import random
+import sys
+import tempfile
+from pathlib import Path
+# 직접 작성한 모듈
+from benchmarks.common import prepare_app_import, percentile
+
+
+def layered(rng: random.Random, size: int) -> list[tuple[str, int, tuple]]:
+    width = max(2, size // 8)
+    courses = []
+    for i in range(size):
+        layer = i // width
+        previous = [f"L{j}" for j in range((layer - 1) * width, layer * width)] if layer else []
+        prerequisites = tuple(rng.sample(previous, min(len(previous), rng.randint(1, 3)))) if previous else ()
+        courses.append((f"L{i}", rng.choice((2, 3, 3, 4)), prerequisites))
+    return courses
+
+
+def chains(rng: random.Random, size: int) -> list[tuple[str, int, tuple]]:
+    courses, chain_count = [], 4
+    length = size // (2 * chain_count)
+    for chain in range(chain_count):
+        for step in range(length):
+            courses.append((f"C{chain}-{step}", 3, (f"C{chain}-{step - 1}",) if step else ()))
+    while len(courses) < size:
+        courses.append((f"E{len(courses)}", rng.choice((1, 2, 3)), ()))
+    return courses
+
+
+def dense(rng: random.Random, size: int, probability: float = 0.1) -> list[tuple[str, int, tuple]]:
+    return [(f"D{i}", rng.choice((1, 2, 3, 3, 4)),
+             tuple(f"D{j}" for j in range(i) if rng.random() < probability)) for i in range(size)]
+
+
+def packing(rng: random.Random, size: int) -> list[tuple[str, int, tuple]]:
+    return [(f"P{i}", rng.choice((1, 2, 3, 4)), ()) for i in range(size)]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="학기 배치 탐색 벤치마크")
+    parser.add_argument("--sizes", default="40,80", help="합성 교과과정 과목 수 (쉼표 구분)")
+    parser.add_argument("--instances", type=int, default=20, help="종류/크기별 합성 교과과정 수")
+    parser.add_argument("--caps", default="10,18", help="학기당 최대 학점 (쉼표 구분, 작을수록 어려움)")
+    parser.add_argument("--budget-ms", type=float, default=200.0)
+    parser.add_argument("--reference-ms", type=float, default=0.0, help="비교용으로 다시 풀 때의 시간 예산 (0이면 생략)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    prepare_app_import(f"sqlite:///{Path(tempfile.mkdtemp(prefix='graduon-planner-')) / 'app.db'}")
+    from catalog import CATALOG
+    from course_planner import PlannerCourse, schedule_courses
+
+    cases: dict[str, list[list[PlannerCourse]]] = {
+        f"catalog/{len(CATALOG)}": [[PlannerCourse(course.code, course.credits, course.prerequisites)
+                                      for course in CATALOG.courses]],
+    }
+    rng = random.Random(args.seed)
+    for size in [int(value) for value in args.sizes.split(",")]:
+        for name, generator in (("layered", layered), ("chains", chains), ("dense", dense), ("packing", packing)):
+            cases[f"{name}/{size}"] = [[PlannerCourse(*course) for course in generator(rng, size)]
+                                       for _ in range(args.instances)]
+
+    print(f"{'case':<20}{'n':>4}{'p50_ms':>10}{'max_ms':>10}{'optimal':>10}{'gap':>6}{'worse':>7}{'explored':>10}")
+    print("-" * 77)
+    for cap in [int(value) for value in args.caps.split(",")]:
+        for name, instances in cases.items():
+            elapsed, optimal, gaps, worse, explored = [], 0, 0, 0, []
+            for courses in instances:
+                schedule = schedule_courses(courses, cap, 0, args.budget_ms)
+                elapsed.append(schedule.elapsed_ms)
+                optimal += schedule.optimal
+                gaps += len(schedule.semesters) - schedule.lower_bound
+                explored.append(schedule.explored)
+                if args.reference_ms and not schedule.optimal:
+                    reference = schedule_courses(courses, cap, 0, args.reference_ms)
+                    worse += len(schedule.semesters) > len(reference.semesters)
+            elapsed.sort()
+            print(f"{f'{name}@{cap}':<20}{len(instances):>4}{percentile(elapsed, 50):>10.1f}{elapsed[-1]:>10.1f}"
+                  f"{f'{optimal}/{len(instances)}':>10}{gaps:>6}{worse if args.reference_ms else '-':>7}"
+                  f"{max(explored):>10}")
+    print("gap: 하한보다 긴 학기 수 합계, optimal: 최적이 증명된 수, worse: 시간을 늘렸을 때 더 짧은 계획이 나온 수",
+          file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+"""
+데이터 규모별 쿼리 벤치마크
+
+학생 수를 늘려가며 합성 데이터를 만들고, 요청 경로에서 쓰이는 쿼리를 직접 호출해 시간을 잽니다.
+
+- `auth_lookup/<type>`: 쿠키 검증 후 인증 사용자 조회 (`get_user_by_email`, `get_*_user_by_*_id`)
+- `student_from_auth/<type>`: `get_student_from_auth`
+- `courses_all`, `courses_semester`: `get_student_courses` (/course/all, /courses/semester/{semester})
+- `course_summary`: 대시보드가 계산하는 학점/평점 합계를 SQL 집계로 구한 것
+
+생성한 DB는 `--data-dir`에 (학생 수, 과목 수, seed)별로 남겨 두고 다음 실행 때 재사용합니다.
+
+사용 예시:
+    python -m benchmarks.bench_queries --scales 1000,10000,100000 --save-baseline > /dev/null
+"""
+# 외부 라이브러리
+from sqlalchemy import func, case
+from sqlmodel import Session, create_engine, select
+# 내부 라이브러리
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+# 직접 작성한 모듈
+from benchmarks.common import (prepare_app_import, summarize, load_baseline, save_baseline,
+                               compare_with_baseline, print_table)
+
+BASELINE_NAME = "queries"
+
+
+def course_summary_stmt(student_pk: int):
+    """학생의 전공/교양별 이수 학점과 평점 합계"""
+    from models.course import Course
+    return (
+        select(
+            Course.is_major,
+            func.sum(Course.credits),
+            func.sum(Course.credits * Course.grade),
+            func.sum(case((Course.is_retake, 1), else_=0)),
+        )
+        .where(Course.student_id == student_pk)
+        .group_by(Course.is_major)
+    )
+
+
+def ensure_dataset(data_dir: Path, students: int, courses: int, seed: int) -> str:
+    from benchmarks.datagen import generate
+    path = data_dir / f"graduon-{students}x{courses}-s{seed}.db"
+    url = f"sqlite:///{path}"
+    if not path.exists():
+        print(f"데이터 생성 중: {path.name}", file=sys.stderr)
+        dataset = generate(url, students, courses, seed)
+        print(f"  {dataset.students}명 / 과목 {dataset.courses}건, {dataset.elapsed_seconds:.1f}초", file=sys.stderr)
+    return url
+
+
+def time_calls(fn, args_list: list) -> dict:
+    latencies = []
+    started = time.perf_counter()
+    for args in args_list:
+        t0 = time.perf_counter()
+        fn(*args)
+        latencies.append(time.perf_counter() - t0)
+    return summarize(latencies, time.perf_counter() - started)
+
+
+def bench_scale(database_url: str, samples: int, seed: int) -> dict:
+    from main import get_student_from_auth, get_student_courses
+    from auth import get_user_by_email
+    from google_auth import get_google_user_by_google_id
+    from naver_auth import get_naver_user_by_naver_id
+    from kakao_auth import get_kakao_user_by_kakao_id
+    from models.user import User
+    from models.google_user import GoogleUser
+    from models.naver_user import NaverUser
+    from models.kakao_user import KakaoUser
+    from models.student import Student
+
+    lookups = {
+        "email": (User, User.email, get_user_by_email),
+        "google": (GoogleUser, GoogleUser.google_id, get_google_user_by_google_id),
+        "naver": (NaverUser, NaverUser.naver_id, get_naver_user_by_naver_id),
+        "kakao": (KakaoUser, KakaoUser.kakao_id, get_kakao_user_by_kakao_id),
+    }
+    rng = random.Random(seed)
+    engine = create_engine(database_url)
+    results = {}
+    with Session(engine) as session:
+        total_students = session.exec(select(func.count()).select_from(Student)).one()
+        for auth_type, (model, key_column, lookup) in lookups.items():
+            count = session.exec(select(func.count()).select_from(model)).one()
+            if not count:
+                continue
+            # 무작위 표본 (PK가 1부터 연속이라고 가정하지 않도록 OFFSET으로 뽑음)
+            keys = [session.exec(select(key_column).offset(rng.randrange(count)).limit(1)).one()
+                    for _ in range(samples)]
+            results[f"auth_lookup/{auth_type}"] = time_calls(lambda k: lookup(session, k), [(k,) for k in keys])
+            users = [lookup(session, k) for k in keys]
+            results[f"student_from_auth/{auth_type}"] = time_calls(
+                lambda u: get_student_from_auth((auth_type, u), session), [(u,) for u in users])
+
+        students = [session.get(Student, rng.randint(1, total_students)) for _ in range(samples)]
+        results["courses_all"] = time_calls(lambda s: get_student_courses(session, s), [(s,) for s in students])
+        results["courses_semester"] = time_calls(
+            lambda s: get_student_courses(session, s, "2-1"), [(s,) for s in students])
+        results["course_summary"] = time_calls(
+            lambda s: session.exec(course_summary_stmt(s.id)).all(), [(s,) for s in students])
+    engine.dispose()
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Graduon 데이터 규모별 쿼리 벤치마크")
+    parser.add_argument("--scales", default="1000,10000", help="쉼표로 구분한 학생 수")
+    parser.add_argument("--courses", type=int, default=60, help="졸업 학년 기준 학생당 평균 과목 수")
+    parser.add_argument("--samples", type=int, default=300, help="쿼리별 호출 횟수")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--data-dir", default=str(Path(tempfile.gettempdir()) / "graduon-bench-data"))
+    parser.add_argument("--baseline", default=BASELINE_NAME)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--threshold", type=float, default=0.15)
+    args = parser.parse_args(argv)
+
+    data_dir = Path(args.data_dir)
+    data_dir.mkdir(parents=True, exist_ok=True)
+    # main 모듈 import용 DB (측정에는 쓰지 않음)
+    prepare_app_import(f"sqlite:///{data_dir / 'app-import.db'}")
+
+    results = {}
+    for students in (int(s) for s in args.scales.split(",") if s):
+        url = ensure_dataset(data_dir, students, args.courses, args.seed)
+        for name, summary in bench_scale(url, args.samples, args.seed).items():
+            results[f"{students}/{name}"] = summary
+
+    baseline = load_baseline(args.baseline)
+    print_table(results, baseline)
+    if args.save_baseline:
+        print(f"베이스라인 저장: {save_baseline(args.baseline, results)}", file=sys.stderr)
+        return 0
+    if baseline is None:
+        return 0
+    regressions = compare_with_baseline(results, baseline, args.threshold)
+    for line in regressions:
+        print(f"  - {line}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
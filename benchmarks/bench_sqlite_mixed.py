@@ -0,0 +1,118 @@
+"""
+SQLite 읽기/쓰기 혼합 부하 벤치마크
+
+같은 합성 데이터 DB의 복사본 두 개에 대해 엔진 프로필만 바꿔서 측정합니다.
+
+- `default`: 드라이버 기본값 (롤백 저널, 프라그마 없음, pool_size=100)
+- `tuned`: `database.create_app_engine`의 SQLite 프로필 (WAL, synchronous=NORMAL, busy_timeout 등)
+
+요청 처리와 같이 스레드마다 Session을 열고, 정해진 비율로
+과목 목록 조회(/course/all)와 과목 등록(POST /courses와 같은 SELECT 후 INSERT + COMMIT)을 섞어 실행합니다.
+`database is locked`로 실패한 작업 수도 함께 출력합니다.
+
+사용 예시:
+    python -m benchmarks.bench_sqlite_mixed --threads 16 --ops 4000 --write-ratio 0.2
+"""
+# 외부 라이브러리
+from sqlalchemy.exc import OperationalError
+from sqlmodel import Session, select
+# 내부 라이브러리
+import argparse
+import itertools
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+# 직접 작성한 모듈
+from benchmarks.common import prepare_app_import, summarize, print_table
+
+
+def run_profile(database_url: str, tuned: bool, students: int, threads: int, ops: int,
+                write_ratio: float, seed: int) -> dict:
+    from database import create_app_engine
+    from main import get_student_courses
+    from models.student import Student
+    from models.course import Course
+
+    engine = create_app_engine(database_url, sqlite_tuned=tuned)
+    counter = itertools.count()
+    lock = threading.Lock()
+    read_latencies, write_latencies = [], []
+    errors = {"locked": 0}
+
+    def one_op(i: int) -> None:
+        rng = random.Random(seed + i)
+        student_pk = rng.randint(1, students)
+        is_write = rng.random() < write_ratio
+        started = time.perf_counter()
+        try:
+            with Session(engine) as session:
+                student = session.get(Student, student_pk)
+                if is_write:
+                    name = f"혼합부하{next(counter)}"
+                    duplicate = session.exec(select(Course).where(
+                        Course.student_id == student.id, Course.course_name == name,
+                        Course.is_retake == False)).first()  # noqa: E712
+                    if duplicate is None:
+                        session.add(Course(student_id=student.id, semester="4-2", course_name=name,
+                                           credits=3, grade=4.0))
+                        session.commit()
+                else:
+                    get_student_courses(session, student)
+        except OperationalError:
+            with lock:
+                errors["locked"] += 1
+            return
+        elapsed = time.perf_counter() - started
+        with lock:
+            (write_latencies if is_write else read_latencies).append(elapsed)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(one_op, range(ops)))
+    wall = time.perf_counter() - started
+    engine.dispose()
+
+    profile = "tuned" if tuned else "default"
+    total = summarize(read_latencies + write_latencies, wall, errors["locked"])
+    return {
+        f"{profile}/all": total,
+        f"{profile}/read": summarize(read_latencies, wall),
+        f"{profile}/write": summarize(write_latencies, wall, errors["locked"]),
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="SQLite 엔진 프로필별 읽기/쓰기 혼합 벤치마크")
+    parser.add_argument("--students", type=int, default=2000)
+    parser.add_argument("--courses", type=int, default=60)
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--ops", type=int, default=4000)
+    parser.add_argument("--write-ratio", type=float, default=0.2)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    workdir = Path(tempfile.mkdtemp(prefix="graduon-sqlite-"))
+    prepare_app_import(f"sqlite:///{workdir / 'app-import.db'}")
+    from benchmarks.datagen import generate
+
+    source = workdir / "source.db"
+    generate(f"sqlite:///{source}", args.students, args.courses, args.seed)
+
+    results = {}
+    for tuned in (False, True):
+        # 프로필마다 같은 시작 상태의 복사본 사용 (WAL 설정은 DB 파일에 남으므로)
+        target = workdir / f"{'tuned' if tuned else 'default'}.db"
+        shutil.copy(source, target)
+        results.update(run_profile(f"sqlite:///{target}", tuned, args.students, args.threads,
+                                   args.ops, args.write_ratio, args.seed))
+    print_table(results)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,267 @@
+"""
+학기 배치 탐색 / 평점 예측 회귀 확인
+
+`course_planner.schedule_courses`(branch-and-bound, 하한, optimal 판정)와 `gpa_projection.project_gpa`
+(벡터화한 시나리오 계산, 재수강 대체)를 답을 아는 작은 입력으로 실행해서 결과를 assert로 확인합니다.
+벤치마크와 달리 시간을 재지 않고, 하나라도 틀리면 종료 코드 1로 끝납니다.
+
+- 학기 배치: greedy보다 짧은 최적 배치, 하한(학점 상한/과목 학점 크기/최장 경로), 시간 예산 초과 시 optimal=False,
+  작은 무작위 교과과정에서 전수 탐색(BFS)과 학기 수 비교
+- 평점 예측: "best"/"latest" 재수강 정책별 정확한 최저/최고 평점, 분포 평균, 목표 평점 경계에서의 required_grade
+
+사용 예시:
+    python -m benchmarks.check_algorithms
+    python -m benchmarks.check_algorithms --random 2000
+"""
+# 내부 라이브러리
+import argparse
+import itertools
+import math
+import random
+import sys
+import tempfile
+import traceback
+from collections import deque
+from pathlib import Path
+from types import SimpleNamespace
+# 직접 작성한 모듈
+from benchmarks.common import prepare_app_import
+
+
+def courses_of(*specs: tuple) -> list:
+    """(코드, 학점, 선수과목 코드...) -> PlannerCourse 목록"""
+    from course_planner import PlannerCourse
+    return [PlannerCourse(code, credits, tuple(prerequisites)) for code, credits, *prerequisites in specs]
+
+
+def assert_valid(courses: list, schedule, credit_cap: int, filler_credits: int = 0) -> None:
+    """모든 과목이 한 번씩, 선수과목은 앞 학기에, 학기마다 상한 이하, 자유 학점을 모두 배치했는지"""
+    semester_of = {code: number for number, codes in enumerate(schedule.semesters) for code in codes}
+    assert sum(len(codes) for codes in schedule.semesters) == len(courses) == len(semester_of), schedule
+    credits = {course.code: course.credits for course in courses}
+    for course in courses:
+        for code in course.prerequisites:
+            assert semester_of[code] < semester_of[course.code], (code, course.code, schedule)
+    for codes, filler in zip(schedule.semesters, schedule.filler_credits):
+        assert sum(credits[code] for code in codes) + filler <= credit_cap, schedule
+    assert sum(schedule.filler_credits) == filler_credits, schedule
+    assert len(schedule.semesters) >= schedule.lower_bound, schedule
+
+
+def shortest_length(courses: list, credit_cap: int) -> int:
+    """학기마다 들을 수 있는 모든 조합을 BFS로 시도한 최소 학기 수 (과목 10개 정도까지)"""
+    index = {course.code: i for i, course in enumerate(courses)}
+    prerequisites = [sum(1 << index[code] for code in course.prerequisites) for course in courses]
+    full = (1 << len(courses)) - 1
+    distance, queue = {full: 0}, deque([full])
+    while queue:
+        remaining = queue.popleft()
+        if not remaining:
+            return distance[remaining]
+        ready = [i for i in range(len(courses)) if remaining >> i & 1 and not prerequisites[i] & remaining]
+        for size in range(1, len(ready) + 1):
+            for chosen in itertools.combinations(ready, size):
+                if sum(courses[i].credits for i in chosen) > credit_cap:
+                    continue
+                following = remaining & ~sum(1 << i for i in chosen)
+                if following not in distance:
+                    distance[following] = distance[remaining] + 1
+                    queue.append(following)
+    raise AssertionError("배치할 수 없는 교과과정입니다.")
+
+
+def bound_of(courses: list, credit_cap: int, codes: tuple = ()) -> int:
+    """_Search.bound (codes가 있으면 그 과목만 남았을 때)"""
+    from course_planner import _Search, BRANCH_LIMIT
+    search = _Search(courses, credit_cap, 0, math.inf, BRANCH_LIMIT)
+    remaining = sum(1 << i for i, course in enumerate(courses) if not codes or course.code in codes)
+    return search.bound(remaining, sum(course.credits for course in courses if not codes or course.code in codes))
+
+
+def check_beats_greedy() -> None:
+    """greedy(높이, 학점 순)는 4학기지만 최적은 {A, B} {C, E} {D}의 3학기"""
+    from course_planner import _Search, BRANCH_LIMIT, schedule_courses
+    courses = courses_of(("A", 2), ("B", 2), ("C", 1), ("D", 3, "C"), ("E", 3, "A"))
+    assert len(_Search(courses, 4, 0, math.inf, BRANCH_LIMIT).greedy()) == 4
+    schedule = schedule_courses(courses, 4, 0, 5000)
+    assert_valid(courses, schedule, 4)
+    assert len(schedule.semesters) == 3 and schedule.lower_bound == 3 and schedule.optimal, schedule
+
+
+def check_bound() -> None:
+    """하한: 전체 학점 / 상한, 과목 학점 크기 (상한이 학점의 배수가 아닐 때), 최장 경로, 높이별 학점"""
+    from course_planner import schedule_courses
+    # 9학점 / 상한 5 = 2학기지만 3학점 과목은 한 학기에 하나만 들어감
+    threes = courses_of(("A", 3), ("B", 3), ("C", 3))
+    assert bound_of(threes, 5) == 3
+    assert bound_of(threes, 6) == 2
+    # 상한과 같은 학점
+    assert bound_of(courses_of(("A", 4), ("B", 4)), 4) == 2
+    # 1학점 사슬 4개는 상한과 관계없이 4학기
+    chain = courses_of(("A", 1), ("B", 1, "A"), ("C", 1, "B"), ("D", 1, "C"))
+    assert bound_of(chain, 18) == 4
+    assert bound_of(chain, 18, ("C", "D")) == 2
+    # A 뒤에 B, C, D: 하한은 max(12 / 6, 1 + 3 / 6) = 2이지만 실제로는 3학기 (탐색을 끝내서 optimal)
+    fan = courses_of(("A", 3), ("B", 3, "A"), ("C", 3, "A"), ("D", 3, "A"))
+    assert bound_of(fan, 6) == 2
+    assert bound_of(fan, 6, ("B", "C", "D")) == 2
+    schedule = schedule_courses(fan, 6, 0, 5000)
+    assert_valid(fan, schedule, 6)
+    assert len(schedule.semesters) == 3 and schedule.lower_bound == 2 and schedule.optimal, schedule
+
+
+def check_filler_and_errors() -> None:
+    """자유 학점은 앞 학기의 남는 자리부터, 잘못된 입력은 ValueError"""
+    from course_planner import schedule_courses
+    schedule = schedule_courses([], 6, 10)
+    assert schedule.semesters == ((), ()) and schedule.filler_credits == (6, 4) and schedule.optimal, schedule
+    courses = courses_of(("A", 3), ("B", 3, "A"))
+    schedule = schedule_courses(courses, 4, 2)
+    assert_valid(courses, schedule, 4, 2)
+    assert schedule.filler_credits == (1, 1) and len(schedule.semesters) == 2, schedule
+    # 남는 자리보다 자유 학점이 많으면 학기를 늘림: (6 + 3) / 4 → 3학기
+    schedule = schedule_courses(courses, 4, 3)
+    assert_valid(courses, schedule, 4, 3)
+    assert schedule.filler_credits == (1, 1, 1) and schedule.lower_bound == 3 and schedule.optimal, schedule
+    for courses, credit_cap in ((courses_of(("A", 5)), 4), (courses_of(("A", 1)), 0),
+                                (courses_of(("A", 1, "B"), ("B", 1, "A")), 6), (courses_of(("A", 1, "Z")), 6)):
+        try:
+            schedule_courses(courses, credit_cap)
+        except ValueError:
+            continue
+        raise AssertionError(f"ValueError가 나야 합니다: {courses}, {credit_cap}")
+
+
+def check_time_budget() -> None:
+    """시간 예산 0이면 첫 시간 확인에서 멈추고 optimal=False, 예산을 주면 하한에 도달"""
+    from course_planner import CLOCK_INTERVAL, schedule_courses
+    courses = courses_of(*((f"X{i}", i * 5 % 4 + 1, *(f"X{j}" for j in range(max(0, i - 6), i) if i * j % 5 == 1))
+                           for i in range(24)))
+    cut = schedule_courses(courses, 5, 0, 0)
+    assert_valid(courses, cut, 5)
+    assert not cut.optimal and cut.explored == CLOCK_INTERVAL and len(cut.semesters) > cut.lower_bound, cut
+    full = schedule_courses(courses, 5, 0, 5000)
+    assert_valid(courses, full, 5)
+    assert full.optimal and len(full.semesters) == full.lower_bound == 12 < len(cut.semesters), full
+    # 조합 수를 제한하면 탐색을 끝내도 하한에 닿지 않는 한 최적이라고 할 수 없음
+    limited = schedule_courses(courses, 5, 0, 5000, branch_limit=1)
+    assert_valid(courses, limited, 5)
+    assert limited.optimal == (len(limited.semesters) == limited.lower_bound), limited
+
+
+def check_random(instances: int, seed: int) -> None:
+    """작은 무작위 교과과정: 학기 수가 BFS 최솟값과 같고, 하한은 최솟값 이하"""
+    from course_planner import schedule_courses
+    rng = random.Random(seed)
+    for _ in range(instances):
+        size, credit_cap = rng.randint(3, 10), rng.choice((3, 4, 5, 6))
+        courses = courses_of(*((f"C{i}", rng.choice((1, 2, 3)), *(f"C{j}" for j in range(i) if rng.random() < 0.3))
+                               for i in range(size)))
+        schedule = schedule_courses(courses, credit_cap, 0, 5000)
+        assert_valid(courses, schedule, credit_cap)
+        optimum = shortest_length(courses, credit_cap)
+        assert schedule.optimal and len(schedule.semesters) == optimum >= schedule.lower_bound, (courses, schedule)
+
+
+def requirement_plan(retake_policy: str):
+    from graduation_rules import RequirementPlan
+    return RequirementPlan({"id": f"check-{retake_policy}", "title": "확인용", "retake_policy": retake_policy,
+                            "rules": []})
+
+
+def record(course_name: str, credits: int, grade: float, is_retake: bool = False) -> SimpleNamespace:
+    return SimpleNamespace(course_name=course_name, credits=credits, grade=grade, is_major=False, is_retake=is_retake)
+
+
+def check_gpa_retake() -> None:
+    """
+    A(3학점 2.0) B(2학점 4.0)를 들은 뒤 A 재수강 + C(4학점 4.5)
+
+    - A 재수강 1.0: best는 기존 2.0 인정 (6 + 8 + 18) / 9 = 3.56, latest는 1.0 인정 (3 + 8 + 18) / 9 = 3.22
+    - A 재수강 0.0~4.5 균등: 최고 (13.5 + 8 + 18) / 9 = 4.39,
+      평균은 best (3 × 25.5 / 9 + 26) / 9 = 3.833, latest (3 × 22 / 9 + 26) / 9 = 3.704
+    """
+    from gpa_projection import HypotheticalCourse, project_gpa
+    taken = [record("A", 3, 2.0), record("B", 2, 4.0)]
+    fixed = [HypotheticalCourse("A", 3, (1.0,), (1.0,)), HypotheticalCourse("C", 4, (4.5,), (1.0,))]
+    for policy, expected in (("best", 3.56), ("latest", 3.22)):
+        projection = project_gpa(requirement_plan(policy), taken, fixed, scenarios=100, seed=1)
+        assert projection.current_gpa == 2.8 and projection.current_credits == 5, projection
+        assert projection.retakes == ("A",) and projection.projected_credits == 9, projection
+        assert projection.min_gpa == projection.max_gpa == expected, (policy, projection)
+        assert projection.mean_gpa == expected and projection.std_gpa == 0.0, (policy, projection)
+        assert all(value == expected for _, value in projection.percentiles), (policy, projection)
+
+    ranged = [HypotheticalCourse.from_range("A", 3), HypotheticalCourse("C", 4, (4.5,), (1.0,))]
+    for policy, low, mean in (("best", 3.56, 3.833), ("latest", 2.89, 3.704)):
+        projection = project_gpa(requirement_plan(policy), taken, ranged, scenarios=20000, seed=7)
+        assert projection.min_gpa == low and projection.max_gpa == 4.39, (policy, projection)
+        assert abs(projection.mean_gpa - mean) < 0.01, (policy, projection)
+        assert math.isclose(sum(share for _, _, share in projection.histogram), 1.0, abs_tol=1e-3), projection
+
+    # 초수강 1번, 재수강 1번까지
+    try:
+        project_gpa(requirement_plan("best"), [*taken, record("A", 3, 3.0, is_retake=True)], fixed)
+    except ValueError:
+        return
+    raise AssertionError("이미 재수강한 과목은 ValueError가 나야 합니다.")
+
+
+def check_required_grade() -> None:
+    """
+    A(3학점 3.0) + C(3학점): 모든 예정 과목이 g이면 (9 + 3g) / 6, 목표와 정확히 같아지는 등급이 경계
+
+    가중치를 준 분포는 도달 확률/평균에 반영되고, 가중치 0인 등급은 최저/최고 평점에서 빠짐
+    """
+    from gpa_projection import HypotheticalCourse, project_gpa
+    taken = [record("A", 3, 3.0)]
+    planned = [HypotheticalCourse.from_range("C", 3)]
+    for target, expected in ((1.5, 0.0), (3.25, 3.5), (3.26, 4.0), (3.75, 4.5), (3.76, None)):
+        projection = project_gpa(requirement_plan("best"), taken, planned, scenarios=20000, target_gpa=target, seed=3)
+        assert projection.required_grade == expected, (target, projection.required_grade)
+    # 3.5, 4.0, 4.5 세 등급 (9개 중) 이면 3.25 이상
+    projection = project_gpa(requirement_plan("best"), taken, planned, scenarios=20000, target_gpa=3.25, seed=3)
+    assert abs(projection.target_probability - 3 / 9) < 0.02, projection.target_probability
+
+    # 가중치: C가 4.5(가중치 3) 또는 0.0(가중치 1), 가중치 0인 등급은 최저/최고에서 제외
+    weighted = [HypotheticalCourse("C", 3, (4.5, 0.0, 2.0), (3.0, 1.0, 0.0))]
+    projection = project_gpa(requirement_plan("best"), taken, weighted, scenarios=20000, target_gpa=3.75, seed=3)
+    assert projection.min_gpa == 1.5 and projection.max_gpa == 3.75, projection
+    assert abs(projection.target_probability - 0.75) < 0.02 and abs(projection.mean_gpa - 3.1875) < 0.02, projection
+    weighted = [HypotheticalCourse("C", 3, (0.0, 3.0, 4.5), (0.0, 1.0, 1.0))]
+    projection = project_gpa(requirement_plan("best"), taken, weighted, scenarios=1000, seed=3)
+    assert projection.min_gpa == 3.0 and projection.max_gpa == 3.75, projection
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="학기 배치 탐색 / 평점 예측 회귀 확인")
+    parser.add_argument("--random", type=int, default=300, help="BFS와 비교할 무작위 교과과정 수")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    prepare_app_import(f"sqlite:///{Path(tempfile.mkdtemp(prefix='graduon-check-')) / 'app.db'}")
+    checks = [
+        ("beats_greedy", check_beats_greedy),
+        ("bound", check_bound),
+        ("filler_and_errors", check_filler_and_errors),
+        ("time_budget", check_time_budget),
+        ("random", lambda: check_random(args.random, args.seed)),
+        ("gpa_retake", check_gpa_retake),
+        ("required_grade", check_required_grade),
+    ]
+    failed = 0
+    for name, check in checks:
+        try:
+            check()
+        except Exception:
+            failed += 1
+            print(f"FAIL {name}", file=sys.stderr)
+            traceback.print_exc()
+        else:
+            print(f"ok   {name}", file=sys.stderr)
+    print(f"{len(checks) - failed}/{len(checks)} passed", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+# 내부 라이브러리
+import json
+import math
+import os
+import platform
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+BASELINE_DIR = Path(__file__).resolve().parent / "baselines"
+
+
+def prepare_app_import(database_url: str) -> None:
+    """
+    앱 모듈을 import하기 전에 호출해야 합니다.
+
+    `main`, `auth_utils` 등은 import 시점에 `env.DATABASE_URL`을 읽으므로,
+    벤치마크용 DB를 쓰려면 그 전에 `env` 모듈의 값을 바꿔 둬야 합니다.
+    정적 파일 경로가 상대 경로이므로 작업 디렉토리도 저장소 루트로 옮깁니다.
+    """
+    os.chdir(ROOT)
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
+    import env
+    env.DATABASE_URL = database_url
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """정렬된 값에서 nearest-rank 방식으로 백분위수 계산"""
+    if not sorted_values:
+        return float("nan")
+    rank = max(1, math.ceil(q / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize(latencies: list[float], wall_seconds: float, errors: int = 0) -> dict:
+    """latency(초) 목록을 RPS, p50/p95/p99(ms) 요약으로 변환"""
+    ordered = sorted(latencies)
+    return {
+        "n": len(ordered),
+        "errors": errors,
+        "rps": round(len(ordered) / wall_seconds, 2) if wall_seconds > 0 else 0.0,
+        "p50_ms": round(percentile(ordered, 50) * 1000, 3),
+        "p95_ms": round(percentile(ordered, 95) * 1000, 3),
+        "p99_ms": round(percentile(ordered, 99) * 1000, 3),
+    }
+
+
+def baseline_path(name: str) -> Path:
+    return BASELINE_DIR / f"{name}.json"
+
+
+def load_baseline(name: str) -> Optional[dict]:
+    path = baseline_path(name)
+    if not path.exists():
+        return None
+    with path.open(encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_baseline(name: str, results: dict) -> Path:
+    """측정 결과를 실행 환경 정보와 함께 베이스라인으로 저장"""
+    BASELINE_DIR.mkdir(parents=True, exist_ok=True)
+    path = baseline_path(name)
+    payload = {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+    with path.open("w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False, indent=2, sort_keys=True)
+    return path
+
+
+def compare_with_baseline(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """
+    베이스라인 대비 회귀 항목을 찾습니다.
+
+    RPS가 `threshold` 비율 이상 떨어지거나 p95가 그만큼 늘어나면 회귀로 봅니다.
+    베이스라인에 없는 항목은 비교하지 않습니다.
+    """
+    regressions = []
+    for key, current in results.items():
+        base = baseline["results"].get(key)
+        if not base:
+            continue
+        if base["rps"] and current["rps"] < base["rps"] * (1 - threshold):
+            regressions.append(f"{key}: RPS {base['rps']} -> {current['rps']}")
+        if base["p95_ms"] and current["p95_ms"] > base["p95_ms"] * (1 + threshold):
+            regressions.append(f"{key}: p95 {base['p95_ms']}ms -> {current['p95_ms']}ms")
+        if current["errors"] > base.get("errors", 0):
+            regressions.append(f"{key}: errors {base.get('errors', 0)} -> {current['errors']}")
+    return regressions
+
+
+def print_table(results: dict, baseline: Optional[dict] = None) -> None:
+    """결과를 표 형태로 출력 (베이스라인이 있으면 RPS 변화율 함께 표시)"""
+    header = f"{'benchmark':<58} {'n':>6} {'err':>4} {'rps':>10} {'p50':>9} {'p95':>9} {'p99':>9} {'Δrps':>8}"
+    print(header, file=sys.stderr)
+    print("-" * len(header), file=sys.stderr)
+    for key in sorted(results):
+        r = results[key]
+        delta = ""
+        if baseline and key in baseline["results"] and baseline["results"][key]["rps"]:
+            base_rps = baseline["results"][key]["rps"]
+            delta = f"{(r['rps'] - base_rps) / base_rps * 100:+.1f}%"
+        print(
+            f"{key:<58} {r['n']:>6} {r['errors']:>4} {r['rps']:>10.1f} "
+            f"{r['p50_ms']:>8.2f}ms {r['p95_ms']:>7.2f}ms {r['p99_ms']:>7.2f}ms {delta:>8}",
+            file=sys.stderr,
+        )
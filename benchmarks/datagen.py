@@ -0,0 +1,205 @@
+"""
+합성 데이터 생성기
+
+실제 서비스와 비슷한 분포의 User / GoogleUser / NaverUser / KakaoUser / Student / Course 데이터를
+bulk insert로 생성합니다. 같은 seed를 주면 항상 같은 데이터가 만들어집니다.
+
+- 학번의 입학 연도에 따라 이수한 학기 수가 달라집니다.
+- 과목은 이수체계도의 전공 과목과 교양 과목에서 뽑으며, 낮은 성적을 받은 과목 일부는 재수강합니다.
+
+사용 예시:
+    python -m benchmarks.datagen sqlite:///big.db --students 100000 --courses 60
+"""
+# 외부 라이브러리
+from sqlalchemy import insert
+from sqlmodel import SQLModel, Session, create_engine
+# 내부 라이브러리
+import argparse
+import random
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Optional
+
+SEMESTERS = ["1-1", "1-2", "2-1", "2-2", "3-1", "3-2", "4-1", "4-2"]
+
+# 이수체계도(course_management.html)의 전공 과목, 권장 학기 순
+MAJOR_COURSES = [
+    "컴퓨팅사고", "컴퓨터프로그래밍", "이산수학", "컴퓨터시스템입문", "컴퓨터프로그래밍및실습", "선형대수",
+    "전자기학", "전기회로", "공업수학1", "논리회로", "자료구조", "프로그래밍이론", "오픈소스SW및실습",
+    "전자공학및실험", "공업수학2", "마이크로프로세서", "알고리즘", "객체지향프로그래밍", "웹프로그래밍",
+    "확률과통계", "제어공학", "디지털신호처리", "컴퓨터구조", "시스템프로그래밍", "데이터마이닝",
+    "컴퓨터그래픽스", "설계패턴", "데이터통신", "공학영어프레젠테이션", "전기기기", "운영체제",
+    "컴파일러구성론", "자연어처리", "기계학습", "데이터베이스", "소프트웨어공학", "컴퓨터네크워크",
+    "SW산학프로젝트", "IOT시스템", "소셜네트워크분석", "고급문제해결기법및실습", "컴퓨터비전",
+    "빅데이터처리", "데이터베이스설계", "게임프로그래밍", "캡스톤설계및실습", "멀티코어컴퓨팅",
+    "로봇공학", "인간컴퓨터상호작용", "컴퓨터보안", "모바일프로그래밍", "딥러닝", "엔터프라이즈프로그래밍",
+    "SW연구프로젝트및실습", "블록체인의이해",
+]
+GENERAL_COURSES = [
+    "대학영어", "글쓰기", "미적분학1", "미적분학2", "일반물리학1", "일반물리학2", "철학의이해",
+    "세계문화와역사", "경제학원론", "심리학개론", "통계학입문", "창업과혁신", "중국어1", "일본어1",
+    "스페인어1", "독일어1", "프랑스어1", "한국근현대사", "과학기술과사회", "체육과건강", "음악의이해",
+    "미술의이해", "리더십과소통", "진로탐색", "데이터리터러시", "인공지능과윤리", "국제관계의이해",
+    "현대사회와법", "환경과인간", "논리와비판적사고",
+]
+GRADES = [4.5, 4.0, 3.5, 3.0, 2.5, 2.0, 1.5, 1.0, 0.0]
+GRADE_WEIGHTS = [18, 22, 20, 15, 9, 6, 4, 3, 3]
+# 이 점수 이하이면 재수강 후보 (C+ 이하)
+RETAKE_GRADE_LIMIT = 2.5
+
+SURNAMES = "김이박최정강조윤장임한오서신권황안송류전홍"
+GIVEN_SYLLABLES = "민서준지현우도윤하은수연예진성훈재영유나태경주원시혜승"
+
+DEFAULT_AUTH_WEIGHTS = {"email": 0.4, "google": 0.3, "naver": 0.15, "kakao": 0.15}
+
+
+@dataclass
+class GeneratedDataset:
+    students: int = 0
+    courses: int = 0
+    # 인증 타입별 식별자 (email: 이메일, 그 외: provider id 문자열)
+    identities: dict = field(default_factory=lambda: {"email": [], "google": [], "naver": [], "kakao": []})
+    elapsed_seconds: float = 0.0
+
+
+def _name(rng: random.Random) -> str:
+    return rng.choice(SURNAMES) + rng.choice(GIVEN_SYLLABLES) + rng.choice(GIVEN_SYLLABLES)
+
+
+def _course_history(rng: random.Random, student_pk: int, courses: int, semesters_done: int, now: datetime) -> list[dict]:
+    """한 학생의 수강 이력 (초수강 + 재수강) 생성"""
+    semesters = SEMESTERS[:max(1, semesters_done)]
+    n_major = min(len(MAJOR_COURSES), int(courses * 0.6))
+    n_general = min(len(GENERAL_COURSES), courses - n_major)
+    # 전공 과목은 이수체계도 순서를 유지해야 학기 배치가 자연스러움
+    majors = sorted(rng.sample(range(len(MAJOR_COURSES)), n_major))
+    picked = [(MAJOR_COURSES[i], True, i / len(MAJOR_COURSES)) for i in majors]
+    picked += [(name, False, rng.random()) for name in rng.sample(GENERAL_COURSES, n_general)]
+
+    rows = []
+    for name, is_major, position in picked:
+        semester_index = min(len(semesters) - 1, int(position * len(semesters)))
+        grade = rng.choices(GRADES, GRADE_WEIGHTS)[0]
+        credits = 3 if is_major or rng.random() < 0.8 else rng.choice((1, 2))
+        base = {"student_id": student_pk, "course_name": name, "credits": credits, "is_major": is_major,
+                "created_at": now, "updated_at": now}
+        rows.append({**base, "semester": semesters[semester_index], "grade": grade, "is_retake": False})
+        # 낮은 성적이고 이후 학기가 남아 있으면 일정 확률로 재수강
+        if grade <= RETAKE_GRADE_LIMIT and semester_index + 1 < len(semesters) and rng.random() < 0.6:
+            retake_semester = rng.randrange(semester_index + 1, len(semesters))
+            retake_grade = rng.choices(GRADES[:6], GRADE_WEIGHTS[:6])[0]
+            rows.append({**base, "semester": semesters[retake_semester], "grade": retake_grade, "is_retake": True})
+    return rows
+
+
+def generate(database_url: str, students: int, courses_per_student: int = 60, seed: int = 42,
+             auth_weights: Optional[dict] = None, password: str = "password1234",
+             chunk_size: int = 5000, echo_progress: bool = False) -> GeneratedDataset:
+    """
+    데이터베이스에 합성 데이터를 생성합니다.
+
+    인증 사용자와 학생은 chunk_size 단위로, 과목은 해당 학생 chunk의 이력을 모아
+    Core `insert()` executemany로 넣으므로 ORM 객체를 만들지 않습니다.
+    모든 이메일 사용자의 비밀번호는 `password`로 통일합니다.
+    """
+    from models.user import User
+    from models.google_user import GoogleUser
+    from models.naver_user import NaverUser
+    from models.kakao_user import KakaoUser
+    from models.student import Student
+    from models.course import Course
+    from auth import hash_password
+
+    rng = random.Random(seed)
+    weights = auth_weights or DEFAULT_AUTH_WEIGHTS
+    auth_types, auth_probs = zip(*weights.items())
+    password_hash = hash_password(password)
+    now = datetime.now(timezone.utc)
+
+    engine = create_engine(database_url)
+    SQLModel.metadata.create_all(engine)
+    result = GeneratedDataset()
+    started = time.perf_counter()
+
+    with Session(engine) as session:
+        # provider 사용자 PK는 1부터 순서대로 부여되도록 빈 테이블을 가정
+        next_pk = {"google": 1, "naver": 1, "kakao": 1}
+        for offset in range(0, students, chunk_size):
+            size = min(chunk_size, students - offset)
+            users, googles, navers, kakaos, student_rows = [], [], [], [], []
+            for i in range(offset, offset + size):
+                auth_type = rng.choices(auth_types, auth_probs)[0]
+                name = _name(rng)
+                admission_year = rng.randint(2018, 2025)
+                row = {"student_id": f"{admission_year}{i:06d}", "name": name, "user_email": None,
+                       "google_user_id": None, "naver_user_id": None, "kakao_user_id": None,
+                       "created_at": now, "updated_at": now}
+                if auth_type == "email":
+                    email = f"user{i:06d}@example.com"
+                    users.append({"email": email, "password_hash": password_hash, "is_active": True,
+                                  "verification_key": None, "key_created_at": None, "email_verification_try": 0,
+                                  "created_at": now, "updated_at": now})
+                    row["user_email"] = email
+                    result.identities["email"].append(email)
+                else:
+                    provider_id = f"{auth_type}-{i:06d}"
+                    common = {"name": name, "picture": None, "is_active": True, "created_at": now, "updated_at": now}
+                    if auth_type == "google":
+                        googles.append({**common, "google_id": provider_id, "email": f"user{i:06d}@gmail.com"})
+                    elif auth_type == "naver":
+                        navers.append({**common, "naver_id": provider_id, "email": f"user{i:06d}@naver.com"})
+                    else:
+                        common.pop("name")
+                        kakaos.append({**common, "kakao_id": provider_id, "nickname": name})
+                    row[f"{auth_type}_user_id"] = next_pk[auth_type]
+                    next_pk[auth_type] += 1
+                    result.identities[auth_type].append(provider_id)
+                row["_semesters_done"] = min(8, (2025 - admission_year) * 2 + rng.choice((1, 2)))
+                student_rows.append(row)
+
+            for model, rows in ((User, users), (GoogleUser, googles), (NaverUser, navers), (KakaoUser, kakaos)):
+                if rows:
+                    session.execute(insert(model), rows)
+
+            semesters_done = [row.pop("_semesters_done") for row in student_rows]
+            student_pks = session.execute(
+                insert(Student).returning(Student.id, sort_by_parameter_order=True), student_rows
+            ).scalars().all()
+
+            course_rows = []
+            for pk, done in zip(student_pks, semesters_done):
+                count = max(1, int(rng.gauss(courses_per_student * done / 8, 3)))
+                course_rows.extend(_course_history(rng, pk, count, done, now))
+            session.execute(insert(Course), course_rows)
+            session.commit()
+
+            result.students += size
+            result.courses += len(course_rows)
+            if echo_progress:
+                print(f"  {result.students}/{students} students, {result.courses} courses", file=sys.stderr)
+
+    engine.dispose()
+    result.elapsed_seconds = time.perf_counter() - started
+    return result
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Graduon 합성 데이터 생성기")
+    parser.add_argument("database_url", help="예: sqlite:///big.db (비어 있는 DB를 권장)")
+    parser.add_argument("--students", type=int, default=1000)
+    parser.add_argument("--courses", type=int, default=60, help="졸업 학년 기준 학생당 평균 과목 수")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    from benchmarks.common import prepare_app_import
+    prepare_app_import(args.database_url)
+    dataset = generate(args.database_url, args.students, args.courses, args.seed, echo_progress=True)
+    print(f"생성 완료: 학생 {dataset.students}명, 과목 {dataset.courses}건, {dataset.elapsed_seconds:.1f}초",
+          file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
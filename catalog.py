@@ -0,0 +1,213 @@
+"""
+전공 교과과정 카탈로그 (이수체계도)
+
+`data/catalog/*.json`의 과목 목록(과목 코드, 과목명, 학점, 이수 구분, 권장 학기, 선수과목)을
+앱 기동 시 한 번 읽어 변경 불가능한 그래프로 만들어 둡니다.
+
+- 과목명/코드 조회는 dict 한 번 (O(1))
+- 선수과목 전체(전이 폐쇄)와 위상 정렬 순서는 로드 시점에 미리 계산
+- 선수과목은 학과에서 확인한 과목(`prerequisites_verified: true`)만 수강 계획의 제약으로 사용
+  (확인 전인 선수과목은 `/catalog`에 그대로 보여 주되 참고용으로만 표시)
+- `/catalog` 응답 본문과 ETag도 로드 시점에 미리 만들어 두고 그대로 반환
+"""
+# 외부 라이브러리
+from fastapi import APIRouter, Request, Response, status
+# 내부 라이브러리
+import hashlib
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping, Optional
+# 직접 작성한 모듈
+from settings import CATALOG_PATH
+
+DEFAULT_CATALOG_PATH = Path(__file__).parent / "data" / "catalog" / "curriculum.json"
+
+
+def normalize_course_name(name: str) -> str:
+    """조회용 키: 공백 제거 + 대소문자 무시 ("자료 구조" == "자료구조", "IoT시스템" == "IOT시스템")"""
+    return "".join(name.split()).casefold()
+
+
+@dataclass(frozen=True)
+class CatalogCourse:
+    code: str
+    name: str
+    credits: int
+    category: str  # 전공교양 / 전공필수 / 전공선택_일반 / 전공선택_컴퓨터 / 전공선택_전자
+    is_major: bool
+    recommended_semester: str  # "1-1" ~ "4-2"
+    prerequisites: tuple[str, ...]  # 직접 선수과목 코드
+    grid_column: int  # 이수체계도 격자 위치
+    grid_row: int
+    prerequisites_verified: bool = False  # 학과에서 확인한 선수과목인지 (False면 참고용)
+
+    @property
+    def enforced_prerequisites(self) -> tuple[str, ...]:
+        """수강 계획에서 지켜야 하는 선수과목 (확인 전이면 없음)"""
+        return self.prerequisites if self.prerequisites_verified else ()
+
+
+class Catalog:
+    """로드 후 변경되지 않는 과목 그래프"""
+
+    def __init__(self, version: str, department: str, categories: list[dict], semesters: list[str],
+                 courses: list[CatalogCourse], source: bytes):
+        self.version = version
+        self.department = department
+        self.semesters = tuple(semesters)
+        self.courses = tuple(courses)
+
+        by_code = {course.code: course for course in courses}
+        if len(by_code) != len(courses):
+            raise ValueError("카탈로그에 중복된 과목 코드가 있습니다.")
+        by_name = {normalize_course_name(course.name): course for course in courses}
+        if len(by_name) != len(courses):
+            raise ValueError("카탈로그에 중복된 과목명이 있습니다.")
+        for course in courses:
+            unknown = [code for code in course.prerequisites if code not in by_code]
+            if unknown:
+                raise ValueError(f"'{course.name}'의 선수과목 코드가 카탈로그에 없습니다: {unknown}")
+            if course.recommended_semester not in self.semesters:
+                raise ValueError(f"'{course.name}'의 권장 학기가 잘못되었습니다: {course.recommended_semester}")
+
+        self._by_code: Mapping[str, CatalogCourse] = MappingProxyType(by_code)
+        self._by_name: Mapping[str, CatalogCourse] = MappingProxyType(by_name)
+        self.topological_order: tuple[str, ...] = self._topological_order()
+
+        # 선수과목 전이 폐쇄 / 후수과목: 위상 순서대로 한 번만 계산 (확인된 선수과목만)
+        ancestors: dict[str, frozenset] = {}
+        dependents: dict[str, list] = {code: [] for code in by_code}
+        for code in self.topological_order:
+            course = by_code[code]
+            closure = set(course.enforced_prerequisites)
+            for prerequisite in course.enforced_prerequisites:
+                closure |= ancestors[prerequisite]
+                dependents[prerequisite].append(code)
+            ancestors[code] = frozenset(closure)
+        self._ancestors: Mapping[str, frozenset] = MappingProxyType(ancestors)
+        self._dependents: Mapping[str, tuple] = MappingProxyType(
+            {code: tuple(codes) for code, codes in dependents.items()})
+
+        self.etag = '"' + hashlib.sha256(source).hexdigest()[:32] + '"'
+        self.payload = json.dumps({
+            "version": version,
+            "department": department,
+            "categories": categories,
+            "semesters": list(self.semesters),
+            "courses": [{
+                "code": course.code,
+                "name": course.name,
+                "credits": course.credits,
+                "category": course.category,
+                "is_major": course.is_major,
+                "recommended_semester": course.recommended_semester,
+                "prerequisites": list(course.prerequisites),
+                "prerequisites_verified": course.prerequisites_verified,
+                "grid": {"column": course.grid_column, "row": course.grid_row},
+            } for course in courses],
+        }, ensure_ascii=False, separators=(",", ":")).encode()
+
+    def _topological_order(self) -> tuple[str, ...]:
+        """선수과목이 항상 앞에 오는 순서 (순환이 있으면 ValueError)"""
+        remaining = {course.code: len(course.prerequisites) for course in self.courses}
+        dependents: dict[str, list] = {code: [] for code in remaining}
+        for course in self.courses:
+            for prerequisite in course.prerequisites:
+                dependents[prerequisite].append(course.code)
+        ready = [code for code, count in remaining.items() if count == 0]
+        order = []
+        while ready:
+            code = ready.pop()
+            order.append(code)
+            for dependent in dependents[code]:
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    ready.append(dependent)
+        if len(order) != len(self.courses):
+            cyclic = sorted(code for code, count in remaining.items() if count > 0)
+            raise ValueError(f"카탈로그 선수과목 관계에 순환이 있습니다: {cyclic}")
+        return tuple(order)
+
+    def __len__(self) -> int:
+        return len(self.courses)
+
+    def get(self, code: str) -> Optional[CatalogCourse]:
+        return self._by_code.get(code)
+
+    def find(self, course_name: str) -> Optional[CatalogCourse]:
+        """과목명으로 조회 (공백/대소문자 무시)"""
+        return self._by_name.get(normalize_course_name(course_name))
+
+    def all_prerequisites(self, code: str) -> frozenset:
+        """직접/간접 선수과목 코드 전체 (확인된 선수과목만)"""
+        return self._ancestors[code]
+
+    def dependents(self, code: str) -> tuple[str, ...]:
+        """이 과목을 직접 선수과목으로 갖는 과목 코드 (확인된 선수과목만)"""
+        return self._dependents[code]
+
+
+def load_catalog(path: Optional[str] = None) -> Catalog:
+    """JSON 파일에서 카탈로그 로드 (형식이 잘못되었으면 기동 시점에 바로 실패하도록 예외 발생)"""
+    source = Path(path or DEFAULT_CATALOG_PATH).read_bytes()
+    data = json.loads(source)
+    courses = [CatalogCourse(
+        code=item["code"],
+        name=item["name"],
+        credits=int(item["credits"]),
+        category=item["category"],
+        is_major=bool(item["is_major"]),
+        recommended_semester=item["recommended_semester"],
+        prerequisites=tuple(item.get("prerequisites", ())),
+        grid_column=item["grid"]["column"],
+        grid_row=item["grid"]["row"],
+        prerequisites_verified=bool(item.get("prerequisites_verified", False)),
+    ) for item in data["courses"]]
+    return Catalog(data["version"], data.get("department", ""), data.get("categories", []),
+                   data["semesters"], courses, source)
+
+
+CATALOG = load_catalog(CATALOG_PATH)
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더(여러 개, W/ 접두사, * 허용)에 etag가 포함되는지"""
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+router = APIRouter(tags=["Catalog"], prefix="/catalog")
+
+
+@router.get("",
+            summary="전공 이수체계도 조회",
+            response_description="카탈로그 버전, 이수 구분, 과목 목록(선수과목, 이수체계도 격자 위치 포함)",
+            responses={
+                200: {"description": "카탈로그 조회 성공"},
+                304: {"description": "If-None-Match의 ETag와 같으면 본문 없이 반환"},
+            })
+async def get_catalog(request: Request) -> Response:
+    """
+    ## 개요
+    전공 교과과정 카탈로그(이수체계도)를 반환합니다.
+
+    ## 상세
+    - 과목마다 과목 코드, 과목명, 학점, 이수 구분, 권장 학기, 선수과목 코드, 이수체계도 격자 위치(`grid`)가 있습니다.
+    - `prerequisites_verified`가 `false`인 선수과목은 학과 확인 전인 참고용입니다. 수강 계획에서 제약으로 쓰지 않습니다.
+    - 카탈로그는 서버 기동 시 한 번 로드되고 바뀌지 않으므로 응답에 `ETag`가 붙습니다.
+
+    ## 프론트엔드 지침
+    브라우저 캐시를 그대로 사용하면 됩니다. 캐시가 만료된 뒤에도 ETag가 같으면 `304`가 반환됩니다.
+    `prerequisites_verified`가 `false`인 선수과목은 "확인 전" 등으로 구분해서, 반드시 먼저 들어야 하는 과목처럼 보이지 않게 표시해 주세요.
+    ```javascript
+    const catalog = await fetch('/catalog').then(res => res.json());
+    ```
+    """
+    headers = {"ETag": CATALOG.etag, "Cache-Control": "public, max-age=3600"}
+    if etag_matches(request.headers.get("if-none-match"), CATALOG.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=CATALOG.payload, media_type="application/json", headers=headers)
@@ -0,0 +1,77 @@
+"""
+학생별 과목 변경 기록
+
+과목을 등록/수정/삭제할 때마다 Student.revision이 1씩 올라가고, 같은 트랜잭션에서
+(revision, 과목 id, insert/update/delete)를 CourseChange에 추가합니다.
+클라이언트는 마지막으로 받은 revision 이후의 변경만 받아서 가지고 있는 과목 목록을 갱신합니다.
+
+- 변경 기록은 학생마다 최근 COURSE_CHANGE_RETENTION개 revision만 남기고 지움
+- 기록이 남아 있는 가장 오래된 revision보다 이전부터 달라고 하면 전체 목록을 다시 보냄 (resync)
+- since=0(처음 요청)이나 기록이 없던 시절의 revision(이 기능 이전 데이터)도 resync
+"""
+# 외부 라이브러리
+from sqlalchemy import func
+from sqlmodel import Session, select, delete
+# 내부 라이브러리
+from dataclasses import dataclass
+from typing import Iterable
+# 직접 작성한 모듈
+from models.course import Course
+from models.course_change import CourseChange
+from models.student import Student
+from settings import COURSE_CHANGE_RETENTION
+
+INSERT, UPDATE, DELETE = "insert", "update", "delete"
+# revision이 이 값의 배수가 될 때마다 오래된 기록 정리
+COMPACT_INTERVAL = 20
+
+
+@dataclass(frozen=True)
+class CourseChangeSet:
+    revision: int  # 클라이언트가 다음 요청의 since로 보낼 값
+    resync: bool  # True면 courses가 전체 목록 (가지고 있던 목록을 버림)
+    courses: list  # 추가/수정된 과목 (resync면 전체)
+    deleted: list[int]  # 삭제된 과목 id
+
+
+def record_course_changes(session: Session, student_id: int, revision: int,
+                          changes: Iterable[tuple[int, str]]) -> None:
+    """
+    변경 기록 추가 (커밋은 호출한 쪽에서 과목 변경과 함께)
+
+    :param changes: (과목 id, insert/update/delete)
+    """
+    session.add_all(CourseChange(student_id=student_id, revision=revision, course_id=course_id, operation=operation)
+                    for course_id, operation in changes)
+    if revision % COMPACT_INTERVAL == 0:
+        session.execute(delete(CourseChange).where(
+            CourseChange.student_id == student_id, CourseChange.revision <= revision - COURSE_CHANGE_RETENTION))
+
+
+def load_course_changes(session: Session, student: Student, since: int) -> CourseChangeSet:
+    """since 이후의 변경 (기록이 정리되었거나 since가 잘못되었으면 전체 목록)"""
+    revision = student.revision
+    oldest = session.exec(select(func.min(CourseChange.revision))
+                          .where(CourseChange.student_id == student.id)).one()
+    # 기록은 (oldest - 1, 현재]의 변경을 빠짐없이 담고 있음 (기록이 없으면 지금 revision부터)
+    complete_since = oldest - 1 if oldest is not None else revision
+    # since=0은 가지고 있는 목록이 없다는 뜻 (기록 이전에 등록된 과목도 있으므로 항상 전체)
+    if since == 0 or since < complete_since or since > revision:
+        courses = session.exec(select(Course).where(Course.student_id == student.id)
+                               .order_by(Course.course_name, Course.is_retake)).all()
+        return CourseChangeSet(revision, True, list(courses), [])
+
+    rows = session.exec(select(CourseChange.revision, CourseChange.course_id, CourseChange.operation)
+                        .where(CourseChange.student_id == student.id, CourseChange.revision > since)
+                        .order_by(CourseChange.revision, CourseChange.id)).all()
+    latest: dict[int, str] = {}  # 과목 id -> 마지막 변경
+    for change_revision, course_id, operation in rows:
+        latest[course_id] = operation
+        revision = max(revision, change_revision)
+    changed_ids = [course_id for course_id, operation in latest.items() if operation != DELETE]
+    courses = list(session.exec(select(Course).where(Course.student_id == student.id, Course.id.in_(changed_ids))
+                                .order_by(Course.course_name, Course.is_retake)).all()) if changed_ids else []
+    # 조회 사이에 삭제된 과목도 삭제로 알려 줌
+    found = {course.id for course in courses}
+    deleted = sorted(course_id for course_id in latest if course_id not in found)
+    return CourseChangeSet(revision, False, courses, deleted)
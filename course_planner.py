@@ -0,0 +1,395 @@
+"""
+남은 학기 수강 계획
+
+졸업요건에서 아직 채우지 못한 항목을 보고 이수체계도 과목으로 학기별 계획을 만듭니다.
+
+1. 과목 고르기 (`build_graduation_plan`)
+   - 이수하지 않은 필수 과목과 그 선수과목 전체
+   - 이수 구분/전공 학점이 모자라면, 새로 들어야 하는 선수과목이 적고 권장 학기가 이른 과목부터
+   - 그래도 모자란 졸업 학점은 자유 학점(교양, 일반선택 등)으로 채움
+2. 학기 배치 (`schedule_courses`): 학기당 학점 상한 안에서 선수과목을 먼저 듣는 조건으로 가장 빨리 끝나는 배치
+   - 선수과목 관계로 본 최장 경로(높이)가 긴 과목부터 넣는 greedy 배치로 먼저 답을 하나 만들고
+   - branch-and-bound로 더 짧은 배치를 찾음. 하한은 높이 t 이상인 과목의 학점으로 계산 (최장 경로, 남은 학점 / 상한 포함)
+   - 남은 과목 집합(비트마스크)별로 가장 적은 학기로 도달한 기록을 남겨 같은 부분 문제를 다시 풀지 않음
+   - 학기마다 더 넣을 수 있는 과목이 없는 조합(극대 조합)만, 우선순위가 높은 것부터 `branch_limit`개까지 시도
+   - 시간 예산(`PLANNER_TIME_BUDGET_MS`)이 지나면 그때까지 찾은 가장 좋은 배치를 반환
+"""
+# 내부 라이브러리
+import math
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date
+from typing import Callable, Iterable, Optional
+# 직접 작성한 모듈
+from catalog import CATALOG, Catalog, CatalogCourse, normalize_course_name
+from graduation_rules import (GraduationReport, RequirementPlan, plan_for, admission_year_of,
+                              completed_semesters, evaluate_student)
+from settings import PLANNER_CREDIT_CAP, PLANNER_TIME_BUDGET_MS, PLANNER_CACHE_SIZE
+
+# 학기마다 시도할 과목 조합 수
+BRANCH_LIMIT = 32
+# 시간 확인 주기 (탐색 상태 수)
+CLOCK_INTERVAL = 64
+
+
+@dataclass(frozen=True)
+class PlannerCourse:
+    code: str
+    credits: int
+    prerequisites: tuple[str, ...]  # 계획 안에 있는 선수과목만 (이미 이수한 선수과목은 빼고)
+
+
+@dataclass(frozen=True)
+class Schedule:
+    semesters: tuple[tuple[str, ...], ...]  # 학기별 과목 코드
+    filler_credits: tuple[int, ...]  # 학기별 자유 학점
+    lower_bound: int  # 이보다 짧은 배치는 없음
+    optimal: bool  # 탐색을 끝냈거나 하한에 도달
+    explored: int  # 탐색한 상태 수
+    elapsed_ms: float
+
+
+class _Search:
+    """schedule_courses의 탐색 상태 (과목은 비트 하나)"""
+
+    def __init__(self, courses: list[PlannerCourse], credit_cap: int, filler_credits: int,
+                 deadline: float, branch_limit: int):
+        index = {course.code: i for i, course in enumerate(courses)}
+        self.size = len(courses)
+        self.credits = [course.credits for course in courses]
+        self.prerequisites = [0] * self.size
+        self.dependents = [0] * self.size
+        for i, course in enumerate(courses):
+            for code in course.prerequisites:
+                self.prerequisites[i] |= 1 << index[code]
+                self.dependents[index[code]] |= 1 << i
+        self.heights = self._heights()
+        self.max_height = max(self.heights, default=0)
+        self.cap = credit_cap
+        self.deadline = deadline
+        self.branch_limit = branch_limit
+        # 자유 학점은 선수과목이 없으므로 어느 학기든 남는 자리에 넣으면 됨 → 전체 학점으로만 학기 수에 영향
+        self.minimum = math.ceil((sum(self.credits) + filler_credits) / credit_cap)
+        self.lower_bound = max(self.minimum, self.bound((1 << self.size) - 1, sum(self.credits)))
+        self.best: Optional[list[int]] = None
+        self.best_length = math.inf
+        self.seen: dict[int, int] = {}  # 남은 과목 집합 -> 가장 적은 사용 학기 수
+        self.explored = 0
+        self.timed_out = False
+        self.exhaustive = True  # 조합 수 제한으로 건너뛴 조합이 없었는지
+
+    def _heights(self) -> list[int]:
+        """과목에서 시작하는 선수과목 사슬의 최대 길이 (과목 수, 자신 포함). 순환이 있으면 ValueError"""
+        heights = [0] * self.size
+        remaining = [bin(mask).count("1") for mask in self.dependents]
+        ready = [i for i in range(self.size) if remaining[i] == 0]
+        done = 0
+        while ready:
+            i = ready.pop()
+            done += 1
+            heights[i] = 1 + max((heights[j] for j in _bits(self.dependents[i])), default=0)
+            for j in _bits(self.prerequisites[i]):
+                remaining[j] -= 1
+                if remaining[j] == 0:
+                    ready.append(j)
+        if done != self.size:
+            raise ValueError("선수과목 관계에 순환이 있습니다.")
+        return heights
+
+    def bound(self, remaining: int, remaining_credits: int) -> int:
+        """
+        남은 과목을 끝내는 데 필요한 최소 학기 수
+
+        높이가 t보다 큰 과목은 마지막 t학기 전에 끝나야 하므로 L >= t + ceil(높이 > t인 과목 학점 / 상한).
+        t = 0이면 전체 학점, t = 최대 높이 - 1이면 최장 경로 하한이 됨.
+        c학점 이상인 과목은 한 학기에 cap // c개까지만 들어감.
+        """
+        by_height = [0] * (self.max_height + 1)
+        by_credits = [0] * (self.cap + 1)
+        for i in _bits(remaining):
+            by_height[self.heights[i]] += self.credits[i]
+            by_credits[self.credits[i]] += 1
+        best, above = math.ceil(remaining_credits / self.cap), 0
+        for t in range(self.max_height - 1, 0, -1):
+            above += by_height[t + 1]
+            if above:
+                best = max(best, t + math.ceil(above / self.cap))
+        # c학점 이상인 과목은 한 학기에 cap // c개까지 (상한이 학점의 배수가 아닐 때 남는 자리를 반영)
+        count = 0
+        for credits in range(self.cap, 0, -1):
+            count += by_credits[credits]
+            if count:
+                best = max(best, math.ceil(count / (self.cap // credits)))
+        return best
+
+    def available(self, remaining: int) -> list[int]:
+        """선수과목을 모두 마친 과목, 우선순위 순 (높이, 학점이 큰 것부터)"""
+        ready = [i for i in _bits(remaining) if not self.prerequisites[i] & remaining]
+        ready.sort(key=lambda i: (-self.heights[i], -self.credits[i], self.dependents[i], i))
+        return ready
+
+    def combinations(self, ready: list[int]) -> list[tuple[int, int]]:
+        """
+        한 학기에 넣을 극대 조합 (비트마스크, 학점), 우선순위가 높은 과목을 넣은 조합부터 최대 branch_limit개
+
+        학점과 후수과목이 같은 과목끼리는 서로 바꿔도 결과가 같으므로 앞의 것을 뺐으면 뒤의 것도 넣지 않음.
+        """
+        credits, cap = self.credits, self.cap
+        suffix = [0] * (len(ready) + 1)  # ready[position:]의 학점 합
+        for position in range(len(ready) - 1, -1, -1):
+            suffix[position] = suffix[position + 1] + credits[ready[position]]
+        found: list[tuple[int, int]] = []
+
+        def visit(position: int, mask: int, total: int, smallest_excluded: float, skipped: Optional[tuple]) -> None:
+            if len(found) >= self.branch_limit:
+                self.exhaustive = False
+                return
+            # 남은 과목을 다 넣어도 뺀 과목이 들어갈 자리가 남으면 극대 조합이 아님
+            if total + suffix[position] <= cap - smallest_excluded:
+                return
+            if position == len(ready):
+                if mask:
+                    found.append((mask, total))
+                return
+            i = ready[position]
+            signature = (credits[i], self.dependents[i])
+            if total + credits[i] <= cap and signature != skipped:
+                visit(position + 1, mask | 1 << i, total + credits[i], smallest_excluded, skipped)
+            visit(position + 1, mask, total, min(smallest_excluded, credits[i]), signature)
+
+        visit(0, 0, 0, math.inf, None)
+        return found
+
+    def run(self, remaining: int, used: int, remaining_credits: int, path: list[int]) -> None:
+        self.explored += 1
+        if self.explored % CLOCK_INTERVAL == 0 and time.perf_counter() > self.deadline:
+            self.timed_out = True
+        if self.timed_out or self.best_length <= self.lower_bound:
+            return
+        if not remaining:
+            length = max(used, self.minimum)
+            if length < self.best_length:
+                self.best, self.best_length = list(path), length
+            return
+        if used + self.bound(remaining, remaining_credits) >= self.best_length:
+            return
+        if self.seen.get(remaining, math.inf) <= used:
+            return
+        self.seen[remaining] = used
+
+        for mask, credits in self.combinations(self.available(remaining)):
+            path.append(mask)
+            self.run(remaining & ~mask, used + 1, remaining_credits - credits, path)
+            path.pop()
+            if self.timed_out:
+                return
+
+    def greedy(self) -> list[int]:
+        """우선순위 순으로 학기마다 들어가는 만큼 넣는 배치 (첫 번째 상한값)"""
+        remaining, semesters = (1 << self.size) - 1, []
+        while remaining:
+            mask, total = 0, 0
+            for i in self.available(remaining):
+                if total + self.credits[i] <= self.cap:
+                    mask, total = mask | 1 << i, total + self.credits[i]
+            semesters.append(mask)
+            remaining &= ~mask
+        return semesters
+
+
+def _bits(mask: int) -> Iterable[int]:
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def schedule_courses(courses: list[PlannerCourse], credit_cap: int, filler_credits: int = 0,
+                     time_budget_ms: float = PLANNER_TIME_BUDGET_MS, branch_limit: int = BRANCH_LIMIT) -> Schedule:
+    """
+    선수과목 순서와 학기당 학점 상한을 지키면서 가장 빨리 끝나는 학기 배치
+
+    :param courses: 들어야 하는 과목 (선수과목도 이 목록 안에 있어야 함)
+    :param filler_credits: 선수과목 없이 남는 자리에 넣을 자유 학점
+    :raises ValueError: 학점 상한보다 큰 과목이 있거나 선수과목 관계가 잘못된 경우
+    """
+    started = time.perf_counter()
+    if credit_cap <= 0:
+        raise ValueError("학기당 학점 상한은 0보다 커야 합니다.")
+    if any(course.credits > credit_cap for course in courses):
+        raise ValueError(f"학기당 학점 상한({credit_cap})보다 큰 과목이 있습니다.")
+    codes = {course.code for course in courses}
+    unknown = sorted({code for course in courses for code in course.prerequisites} - codes)
+    if unknown:
+        raise ValueError(f"계획에 없는 선수과목이 있습니다: {unknown}")
+
+    search = _Search(courses, credit_cap, filler_credits, started + time_budget_ms / 1000, branch_limit)
+    full = (1 << search.size) - 1
+    initial = search.greedy()
+    search.best, search.best_length = initial, max(len(initial), search.minimum)
+    if search.best_length > search.lower_bound:
+        search.run(full, 0, sum(search.credits), [])
+
+    semesters = list(search.best)
+    semesters += [0] * (search.best_length - len(semesters))
+    # 자유 학점은 앞 학기의 남는 자리부터
+    fillers, left = [], filler_credits
+    for mask in semesters:
+        room = credit_cap - sum(search.credits[i] for i in _bits(mask))
+        fillers.append(min(room, left))
+        left -= fillers[-1]
+    return Schedule(
+        semesters=tuple(tuple(courses[i].code for i in sorted(_bits(mask))) for mask in semesters),
+        filler_credits=tuple(fillers),
+        lower_bound=search.lower_bound,
+        optimal=search.best_length <= search.lower_bound or (not search.timed_out and search.exhaustive),
+        explored=search.explored,
+        elapsed_ms=(time.perf_counter() - started) * 1000,
+    )
+
+
+@dataclass(frozen=True)
+class PlannedSemester:
+    label: str  # "3-1" (학년-학기, 8학기 이후는 5-1, 5-2 ...)
+    courses: tuple[CatalogCourse, ...]
+    filler_credits: int
+
+    @property
+    def credits(self) -> int:
+        return sum(course.credits for course in self.courses) + self.filler_credits
+
+
+@dataclass(frozen=True)
+class GraduationPlan:
+    requirement_id: str
+    credit_cap: int
+    semesters: tuple[PlannedSemester, ...]
+    unplanned: tuple[str, ...]  # 이수체계도에 없어서 배치하지 못한 필수 과목
+    lower_bound: int
+    optimal: bool
+    elapsed_ms: float
+
+
+def semester_label(index: int) -> str:
+    """0부터 센 학기 번호 → "1-1", "1-2", "2-1" ..."""
+    return f"{index // 2 + 1}-{index % 2 + 1}"
+
+
+def _select_courses(plan: RequirementPlan, report: GraduationReport, passed: set[str],
+                    catalog: Catalog) -> tuple[dict[str, CatalogCourse], int, list[str]]:
+    """들어야 할 카탈로그 과목, 자유 학점, 카탈로그에 없는 필수 과목"""
+    selected: dict[str, CatalogCourse] = {}
+    unplanned: list[str] = []
+
+    def include(course: CatalogCourse) -> None:
+        for code in (*sorted(catalog.all_prerequisites(course.code)), course.code):
+            if code not in passed:
+                selected.setdefault(code, catalog.get(code))
+
+    def new_prerequisites(course: CatalogCourse) -> int:
+        return sum(1 for code in catalog.all_prerequisites(course.code) if code not in passed and code not in selected)
+
+    def fill(deficit: float, counts: Callable[[CatalogCourse], bool]) -> None:
+        deficit -= sum(course.credits for course in selected.values() if counts(course))
+        candidates = [course for course in catalog.courses
+                      if counts(course) and course.code not in passed and course.code not in selected]
+        while deficit > 0 and candidates:
+            candidates.sort(key=lambda course: (new_prerequisites(course), course.recommended_semester, course.code))
+            course = candidates.pop(0)
+            before = set(selected)
+            include(course)
+            deficit -= sum(selected[code].credits for code in selected.keys() - before if counts(selected[code]))
+            candidates = [candidate for candidate in candidates if candidate.code not in selected]
+
+    progress = dict(zip((rule["id"] for rule in plan.rule_definitions), report.rules))
+    # 필수 과목 → 이수 구분 → 전공 학점 → 졸업 학점 순으로, 앞에서 고른 과목이 뒤의 학점에도 들어감
+    definitions = sorted(plan.rule_definitions, key=lambda rule: ("required_courses", "category_credits",
+                                                                  "major_credits", "total_credits",
+                                                                  "min_gpa").index(rule["type"]))
+    filler = 0
+    for rule in definitions:
+        rule_progress = progress[rule["id"]]
+        # 기준값이 확인되지 않은 규칙은 채우려고 과목을 고르지 않음
+        if rule_progress.satisfied or rule_progress.provisional:
+            continue
+        deficit = rule_progress.required - rule_progress.current
+        if rule["type"] == "required_courses":
+            for name in rule_progress.missing:
+                course = catalog.find(name)
+                if course:
+                    include(course)
+                else:
+                    unplanned.append(name)
+        elif rule["type"] == "category_credits":
+            fill(deficit, lambda course, category=rule["category"]: course.category == category)
+        elif rule["type"] == "major_credits":
+            fill(deficit, lambda course: course.is_major)
+        elif rule["type"] == "total_credits":
+            filler = max(0, int(math.ceil(deficit)) - sum(course.credits for course in selected.values()))
+    return selected, filler, unplanned
+
+
+def build_graduation_plan(plan: RequirementPlan, report: GraduationReport, courses: Iterable, start_semester: int,
+                          credit_cap: int = PLANNER_CREDIT_CAP, time_budget_ms: float = PLANNER_TIME_BUDGET_MS,
+                          catalog: Catalog = CATALOG) -> GraduationPlan:
+    """
+    남은 졸업요건을 채우는 학기별 계획
+
+    :param courses: 지금까지의 수강 기록 (통과한 과목만 이수한 것으로 봄)
+    :param start_semester: 계획을 시작할 학기 번호 (0 = 1학년 1학기)
+    """
+    recognized = plan.recognize(courses)
+    passed = {course.code for course in catalog.courses
+              if recognized.get(normalize_course_name(course.name), (0.0,))[0] >= plan.passing_grade}
+    selected, filler, unplanned = _select_courses(plan, report, passed, catalog)
+
+    schedule = schedule_courses(
+        [PlannerCourse(course.code, course.credits,
+                       tuple(code for code in course.enforced_prerequisites if code not in passed))
+         for course in selected.values()],
+        credit_cap, filler, time_budget_ms)
+    return GraduationPlan(
+        requirement_id=plan.id,
+        credit_cap=credit_cap,
+        semesters=tuple(
+            PlannedSemester(semester_label(start_semester + offset), tuple(catalog.get(code) for code in codes),
+                            filler_credits)
+            for offset, (codes, filler_credits) in enumerate(zip(schedule.semesters, schedule.filler_credits))),
+        unplanned=tuple(unplanned),
+        lower_bound=schedule.lower_bound,
+        optimal=schedule.optimal,
+        elapsed_ms=schedule.elapsed_ms,
+    )
+
+
+# (Student.id, Student.revision, 요건 id, 학점 상한, 시작 학기) -> GraduationPlan
+_plan_cache: OrderedDict = OrderedDict()
+_plan_cache_lock = threading.Lock()
+
+
+def plan_student(student, load_courses: Callable[[], list], credit_cap: int = PLANNER_CREDIT_CAP,
+                 as_of: Optional[date] = None) -> GraduationPlan:
+    """
+    학생의 남은 학기 계획 (revision이 같으면 캐시된 계획을 반환하고 과목을 조회하지 않음)
+
+    :param load_courses: 캐시에 없을 때만 호출되는 과목 조회 함수
+    """
+    start_semester = completed_semesters(admission_year_of(student.student_id), as_of or date.today())
+    requirement = plan_for(student.student_id)
+    key = (student.id, student.revision, requirement.id, credit_cap, start_semester)
+    with _plan_cache_lock:
+        cached = _plan_cache.get(key)
+        if cached is not None:
+            _plan_cache.move_to_end(key)
+            return cached
+
+    courses = load_courses()
+    report = evaluate_student(student, lambda: courses)
+    result = build_graduation_plan(requirement, report, courses, start_semester, credit_cap)
+    with _plan_cache_lock:
+        _plan_cache[key] = result
+        while len(_plan_cache) > PLANNER_CACHE_SIZE:
+            _plan_cache.popitem(last=False)
+    return result
@@ -1,17 +1,175 @@
+from sqlalchemy import event, inspect
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError
 from sqlmodel import SQLModel, create_engine
+import asyncio
+import logging
 from models.user import User  # 모델이 정의된 파일로부터 import
 from models.google_user import GoogleUser  # Google OAuth2 사용자 모델 import
 from models.naver_user import NaverUser  # Naver OAuth2 사용자 모델 import
 from models.kakao_user import KakaoUser  # Kakao OAuth2 사용자 모델 import
 from models.student import Student
 from models.course import Course
+from models.course_change import CourseChange  # 과목 변경 기록 (GET /courses/changes)
+from models.idempotency_record import IdempotencyRecord  # POST 재시도 응답 (Idempotency-Key)
 # SQLite 경로: 로컬 파일 (필요시 :memory: 사용 가능)
 from env import DATABASE_URL
+from settings import (SQL_ECHO, SQLITE_TUNED, SQLITE_BUSY_TIMEOUT_MS, SQLITE_MMAP_SIZE, SQLITE_CACHE_SIZE_KB,
+                      SQLITE_POOL_SIZE, SQLITE_MAX_OVERFLOW, SQLITE_MAINTENANCE_INTERVAL)
+import query_monitor
+import tracing
+
+logger = logging.getLogger("graduon.db")
+
+
+def is_sqlite_file(database_url: str) -> bool:
+    """파일 기반 SQLite인지 (:memory:는 WAL, 커넥션 풀 설정이 의미 없으므로 제외)"""
+    return database_url.startswith("sqlite") and ":memory:" not in database_url and database_url.rstrip("/") != "sqlite:"
+
+
+def sqlite_pragmas() -> list[str]:
+    return [
+        "PRAGMA journal_mode=WAL",  # 읽기와 쓰기가 서로를 막지 않음
+        "PRAGMA synchronous=NORMAL",  # WAL에서는 커밋마다 fsync하지 않아도 DB가 깨지지 않음
+        f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}",
+        f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}",
+        f"PRAGMA cache_size=-{SQLITE_CACHE_SIZE_KB}",  # 음수는 KiB 단위
+        "PRAGMA temp_store=MEMORY",
+    ]
+
+
+def create_app_engine(database_url: str = DATABASE_URL, sqlite_tuned: bool = SQLITE_TUNED) -> Engine:
+    """
+    데이터베이스 종류에 맞는 엔진 생성
+
+    SQLite 파일 DB는 쓰기 잠금이 하나뿐이라 커넥션을 많이 열어도 처리량이 늘지 않으므로
+    풀을 작게 잡고, 커넥션을 열 때마다 WAL 등 프라그마를 설정합니다.
+    """
+    if not (sqlite_tuned and is_sqlite_file(database_url)):
+        return create_engine(database_url, echo=SQL_ECHO, pool_size=100, max_overflow=5, pool_timeout=30)
+
+    sqlite_engine = create_engine(
+        database_url,
+        echo=SQL_ECHO,
+        pool_size=SQLITE_POOL_SIZE,
+        max_overflow=SQLITE_MAX_OVERFLOW,
+        pool_timeout=30,
+        # 같은 커넥션을 스레드풀의 여러 스레드가 순서대로 쓰므로 필요
+        connect_args={"check_same_thread": False, "timeout": SQLITE_BUSY_TIMEOUT_MS / 1000},
+    )
+
+    @event.listens_for(sqlite_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma in sqlite_pragmas():
+            cursor.execute(pragma)
+        cursor.close()
+
+    return sqlite_engine
+
+
+def run_sqlite_maintenance(target: Engine) -> None:
+    """WAL 파일을 본 DB에 반영해 줄이고, 쿼리 플래너 통계를 갱신"""
+    with target.connect() as connection:
+        busy, wal_pages, checkpointed = connection.exec_driver_sql("PRAGMA wal_checkpoint(TRUNCATE)").one()
+        connection.exec_driver_sql("PRAGMA optimize")
+    logger.info("sqlite maintenance: wal_pages=%s checkpointed=%s busy=%s", wal_pages, checkpointed, busy)
+
+
+async def sqlite_maintenance_loop(target: Engine, interval: float = SQLITE_MAINTENANCE_INTERVAL) -> None:
+    """앱이 떠 있는 동안 주기적으로 run_sqlite_maintenance 실행 (블로킹 작업이므로 스레드에서)"""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await asyncio.to_thread(run_sqlite_maintenance, target)
+        except Exception:
+            logger.exception("sqlite maintenance 실패")
+
+
+# 애플리케이션 전체가 공유하는 엔진 (요청마다 엔진을 새로 만들지 않도록 여기서 한 번만 생성)
+# SQL 로그 출력은 SQL_ECHO로 켤 때만 (기본은 꺼짐, 대신 query_monitor가 느린 쿼리만 기록)
+engine = create_app_engine()
+query_monitor.install(engine)
+tracing.install(engine)
+USES_TUNED_SQLITE = SQLITE_TUNED and is_sqlite_file(DATABASE_URL)
+
+def _sql_literal(value) -> str:
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, (int, float)):
+        return repr(value)
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def add_missing_columns(target: Engine) -> list[str]:
+    """
+    모델에는 있지만 기존 테이블에는 없는 컬럼 추가
+
+    create_all은 이미 있는 테이블을 바꾸지 않으므로, 모델에 컬럼을 추가하면 여기서 ALTER TABLE ... ADD COLUMN을 실행합니다.
+    기존 행을 채울 수 있도록 nullable이거나 스칼라 기본값이 있는 컬럼만 지원합니다.
+    """
+    inspector = inspect(target)
+    statements = []
+    for table in SQLModel.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing:
+                continue
+            ddl = f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column.type.compile(dialect=target.dialect)}"
+            if column.default is not None and column.default.is_scalar:
+                ddl += f" NOT NULL DEFAULT {_sql_literal(column.default.arg)}"
+            elif not column.nullable:
+                raise RuntimeError(f"{table.name}.{column.name}: 기본값이 없는 NOT NULL 컬럼은 자동으로 추가할 수 없습니다.")
+            statements.append(ddl)
+    if statements:
+        with target.begin() as connection:
+            for ddl in statements:
+                connection.exec_driver_sql(ddl)
+                logger.warning("schema migration: %s", ddl)
+    return statements
+
+
+def add_missing_indexes(target: Engine) -> list[str]:
+    """
+    모델에는 있지만 기존 테이블에는 없는 인덱스 생성 (unique 인덱스는 중복 데이터가 있으면 건너뛰고 로그)
+    """
+    inspector = inspect(target)
+    created = []
+    for table in SQLModel.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name in existing:
+                continue
+            try:
+                with target.begin() as connection:
+                    index.create(connection)
+            except IntegrityError:
+                logger.error("schema migration: %s 생성 실패 (중복 데이터 정리 필요)", index.name)
+                continue
+            logger.warning("schema migration: CREATE INDEX %s", index.name)
+            created.append(index.name)
+    return created
+
+
+def upsert_insert(bind, model):
+    """
+    INSERT ... ON CONFLICT / RETURNING을 쓸 수 있는 insert 문 (SQLite 3.35+, PostgreSQL)
+
+    :param bind: Session 또는 Engine (dialect 판단용)
+    """
+    dialect = bind.get_bind().dialect.name if hasattr(bind, "get_bind") else bind.dialect.name
+    return (postgresql if dialect == "postgresql" else sqlite).insert(model)
 
-engine = create_engine(DATABASE_URL, echo=True)  # echo=True는 SQL 쿼리 로그 출력
 
 def init_db():
     SQLModel.metadata.create_all(engine)
+    add_missing_columns(engine)
+    add_missing_indexes(engine)
     print("===== 데이터베이스 및 테이블이 생성되었습니다. =====")
 
 if __name__ == "__main__":
@@ -1,5 +1,14 @@
 from fastapi_mail import FastMail, MessageSchema, MessageType
 
+from metrics import SMTP_SEND_SECONDS
+from resilience import SMTP
+
+
+async def send_timed(fm: FastMail, message: MessageSchema, kind: str) -> None:
+    """메일 송신 한 번 (시도마다 송신 시간 기록, 제한 시간/재시도/차단기는 SMTP)"""
+    async with SMTP_SEND_SECONDS.time(kind=kind):
+        await fm.send_message(message)
+
 async def send_reset_email(fm: FastMail, user_email: str, verification_code: str, expires_minutes: int = 60):
     """
     비밀번호 재설정용 인증 코드 이메일 발송
@@ -27,7 +36,7 @@ async def send_reset_email(fm: FastMail, user_email: str, verification_code: str
         body=body,
         subtype=MessageType.html
     )
-    await fm.send_message(message)
+    await SMTP.call("send", lambda: send_timed(fm, message, "reset_password"))
 
 async def send_signup_verification_email(fm: FastMail, user_email: str, verification_code: str, expires_minutes: int = 60):
     subject = "이메일 주소 인증 코드 안내"
@@ -49,4 +58,4 @@ async def send_signup_verification_email(fm: FastMail, user_email: str, verifica
         body=body,
         subtype=MessageType.html
     )
-    await fm.send_message(message)
+    await SMTP.call("send", lambda: send_timed(fm, message, "signup_verification"))
@@ -6,11 +6,16 @@ from google.auth.transport import requests
 from google.oauth2 import id_token
 from google_auth_oauthlib.flow import Flow
 from typing import Optional
+import asyncio
 # 직접 작성한 모듈
 from models.google_user import GoogleUser
 from schemas.google import GoogleLoginSuccessResponse, GoogleLoginErrorResponse
 from env import DATABASE_URL, GOOGLE_CLIENT_ID, GOOGLE_CLIENT_SECRET, GOOGLE_REDIRECT_URI
 from auth_utils import get_serializer, cookie_generate, get_engine
+from database import upsert_insert
+from metrics import OAUTH_REQUEST_SECONDS
+from resilience import GOOGLE
+from tracing import traced
 
 
 router = APIRouter(tags=["Google OAuth2"], prefix="/auth/google")
@@ -34,28 +39,44 @@ def get_google_flow():
     return flow
 
 
+@traced()
 def get_google_user_by_google_id(session: Session, google_id: str) -> Optional[GoogleUser]:
     """Google ID로 사용자 조회"""
     return session.exec(select(GoogleUser).where(GoogleUser.google_id == google_id)).first()
 
 
+@traced()
 def get_google_user_by_email(session: Session, email: str) -> Optional[GoogleUser]:
     """이메일로 Google 사용자 조회"""
     return session.exec(select(GoogleUser).where(GoogleUser.email == email)).first()
 
 
+@traced()
 def create_google_user(session: Session, google_id: str, email: str, name: str, picture: str = None) -> GoogleUser:
-    """새 Google 사용자 생성"""
+    """
+    Google 사용자 생성 (이미 있으면 기존 사용자 반환)
+
+    먼저 조회해서 이미 있는 사용자면 그대로 반환합니다 (SQLite 쓰기 잠금을 잡지 않도록, 처음 로그인할 때만 쓰기).
+    없을 때만 INSERT ... ON CONFLICT(google_id) DO NOTHING ... RETURNING으로 생성하므로 같은 사용자의 첫 로그인이 동시에 들어와도 하나만 생성됩니다.
+    """
+    user = get_google_user_by_google_id(session, google_id)
+    if user is not None:
+        return user
     user = GoogleUser(
         google_id=google_id,
         email=email,
         name=name,
         picture=picture
     )
-    session.add(user)
+    statement = upsert_insert(session, GoogleUser).values(**user.model_dump(exclude={"id"}))
+    statement = statement.on_conflict_do_nothing(index_elements=[GoogleUser.google_id])
+    created = session.scalars(statement.returning(GoogleUser)).one_or_none()
+    if created is None:
+        # 조회한 뒤 동시에 들어온 첫 로그인이 먼저 생성함: 바뀐 것이 없으므로 트랜잭션을 끝내고 조회
+        session.rollback()
+        return get_google_user_by_google_id(session, google_id)
     session.commit()
-    session.refresh(user)
-    return user
+    return created
 
 
 @router.get("/login",
@@ -162,16 +183,27 @@ async def google_callback(request: Request, response: Response):
     
     try:
         # Authorization code를 token으로 교환
+        # (google 라이브러리는 동기 호출이므로 스레드에서, 제한 시간과 차단기는 GOOGLE)
         authorization_response = str(request.url)
-        flow.fetch_token(authorization_response=authorization_response)
+
+        def fetch_token() -> None:
+            with OAUTH_REQUEST_SECONDS.time(provider="google", operation="token"):
+                flow.fetch_token(authorization_response=authorization_response, timeout=GOOGLE.timeout)
+
+        await GOOGLE.call("token", lambda: asyncio.to_thread(fetch_token))
         
-        # Google ID token에서 사용자 정보 추출
+        # Google ID token에서 사용자 정보 추출 (서명 확인용 공개키 조회는 멱등하므로 재시도)
         credentials = flow.credentials
-        id_info = id_token.verify_oauth2_token(
-            credentials.id_token,
-            requests.Request(),
-            GOOGLE_CLIENT_ID
-        )
+
+        def verify_id_token() -> dict:
+            with OAUTH_REQUEST_SECONDS.time(provider="google", operation="verify_id_token"):
+                return id_token.verify_oauth2_token(
+                    credentials.id_token,
+                    requests.Request(),
+                    GOOGLE_CLIENT_ID
+                )
+
+        id_info = await GOOGLE.call("verify_id_token", lambda: asyncio.to_thread(verify_id_token), idempotent=True)
         
         google_id = id_info.get('sub')
         email = id_info.get('email')
@@ -187,15 +219,12 @@ async def google_callback(request: Request, response: Response):
         # 데이터베이스에서 사용자 확인 또는 생성
         engine = get_engine()
         with Session(engine) as session:
-            user = get_google_user_by_google_id(session, google_id)
-            
-            if not user:
-                # 새 사용자 생성 (자동 회원가입)
-                user = create_google_user(session, google_id, email, name, picture)
+            # 사용자 조회 또는 생성 (자동 회원가입, 처음 로그인할 때만 쓰기)
+            create_google_user(session, google_id, email, name, picture)
             
             # auth-google 쿠키 생성
             serializer = get_serializer()
-            cookie_value = cookie_generate(str(user.google_id), serializer)
+            cookie_value = cookie_generate(str(google_id), serializer)
             
             # 대시보드로 리다이렉트하면서 쿠키 설정
             redirect_response = RedirectResponse(url="/dashboard", status_code=302)
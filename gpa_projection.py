@@ -0,0 +1,184 @@
+"""
+평점 예측 (what-if)
+
+"다음 학기에 어떤 성적을 받아야 3.5를 넘길 수 있나?"에 답하기 위한 계산입니다.
+지금까지의 수강 기록에 앞으로 들을 과목(성적 분포 또는 범위)을 더해서 최종 평점을 계산합니다.
+
+- 최저/최고 평점: 과목마다 가능한 가장 낮은/높은 성적 (평점은 과목 성적에 대해 단조 증가하므로 정확한 값)
+- 분포: 과목마다 성적을 뽑은 시나리오 N개를 NumPy 배열 (시나리오 × 과목)로 한 번에 계산
+- 목표 평점: 도달 확률과, 모든 과목에서 같은 성적을 받는다고 할 때 필요한 최소 성적
+
+이미 들은 과목을 다시 넣으면 재수강으로 보고 졸업요건과 같은 `retake_policy`로 기존 기록을 대체합니다.
+"""
+# 외부 라이브러리
+import numpy as np
+# 내부 라이브러리
+from dataclasses import dataclass
+from typing import Iterable, Optional
+# 직접 작성한 모듈
+from catalog import normalize_course_name
+from graduation_rules import RequirementPlan
+
+GRADE_STEPS = (0.0, 1.0, 1.5, 2.0, 2.5, 3.0, 3.5, 4.0, 4.5)  # F, D0, D+, C0, C+, B0, B+, A0, A+
+PERCENTILES = (5, 25, 50, 75, 95)
+HISTOGRAM_WIDTH = 0.1
+
+
+@dataclass(frozen=True)
+class HypotheticalCourse:
+    course_name: str
+    credits: int
+    grades: tuple[float, ...]  # 받을 수 있는 성적
+    weights: tuple[float, ...]  # 성적별 가중치 (합이 1이 아니어도 됨)
+
+    @classmethod
+    def from_range(cls, course_name: str, credits: int, min_grade: float = 0.0,
+                   max_grade: float = 4.5) -> "HypotheticalCourse":
+        """범위 안의 등급을 같은 확률로"""
+        grades = tuple(grade for grade in GRADE_STEPS if min_grade <= grade <= max_grade)
+        if not grades:
+            raise ValueError(f"'{course_name}': {min_grade}~{max_grade} 범위에 해당하는 등급이 없습니다.")
+        return cls(course_name, credits, grades, (1.0,) * len(grades))
+
+
+@dataclass(frozen=True)
+class GpaProjection:
+    current_gpa: float
+    current_credits: int  # 평점에 들어가는 학점 (재수강 중복 제외)
+    projected_credits: int  # 예정 과목을 모두 들은 뒤 (재수강으로 대체되는 학점 제외, 최고 성적 기준)
+    retakes: tuple[str, ...]  # 재수강으로 처리된 과목
+    min_gpa: float
+    max_gpa: float
+    mean_gpa: float
+    std_gpa: float
+    percentiles: tuple[tuple[int, float], ...]  # (백분위, 평점)
+    histogram: tuple[tuple[float, float, float], ...]  # (구간 시작, 구간 끝, 비율)
+    scenarios: int
+    target_gpa: Optional[float] = None
+    target_probability: Optional[float] = None
+    required_grade: Optional[float] = None  # 모든 예정 과목에서 이 성적 이상이면 목표 도달 (불가능하면 None)
+
+
+def project_gpa(plan: RequirementPlan, courses: Iterable, hypothetical: list[HypotheticalCourse],
+                scenarios: int = 5000, target_gpa: Optional[float] = None,
+                seed: Optional[int] = None) -> GpaProjection:
+    """
+    수강 기록 + 예정 과목으로 최종 평점 예측
+
+    :param courses: 지금까지의 수강 기록 (course_name, credits, grade, is_major, is_retake 속성)
+    :param hypothetical: 예정 과목 (과목명이 겹치면 안 됨)
+    :raises ValueError: 예정 과목이 잘못된 경우 (중복, 재수강 불가, 가중치 없음)
+    """
+    if not hypothetical:
+        raise ValueError("예정 과목이 없습니다.")
+    courses = list(courses)
+    chosen = plan.recognize(courses)
+    retaken = {normalize_course_name(course.course_name) for course in courses if course.is_retake}
+
+    keys = [normalize_course_name(course.course_name) for course in hypothetical]
+    replaced = set(keys)
+    if len(replaced) != len(keys):
+        raise ValueError("예정 과목에 같은 과목이 두 번 있습니다.")
+    for course, key in zip(hypothetical, keys):
+        # 초수강 1번, 재수강 1번까지만 가능
+        if key in retaken:
+            raise ValueError(f"'{course.course_name}' 과목은 이미 재수강했습니다.")
+        if len(course.grades) != len(course.weights) or not course.grades:
+            raise ValueError(f"'{course.course_name}': 성적과 가중치 개수가 다릅니다.")
+        if min(course.weights) < 0 or sum(course.weights) <= 0:
+            raise ValueError(f"'{course.course_name}': 가중치는 0 이상이고 합이 0보다 커야 합니다.")
+
+    # 바뀌지 않는 과목은 합계 두 개로 줄임
+    fixed = {key: record for key, record in chosen.items() if key not in replaced}
+    fixed_points = sum(grade * credits for grade, _, credits, _ in fixed.values())
+    fixed_credits = sum(credits for _, _, credits, _ in fixed.values())
+    current_credits = sum(credits for _, _, credits, _ in chosen.values())
+    current_points = sum(grade * credits for grade, _, credits, _ in chosen.values())
+
+    # 과목별 상수 (과목 축 J). 재수강이 아니면 기존 성적 -1 / 학점 0
+    credits = np.array([course.credits for course in hypothetical], dtype=np.float64)
+    old_grade = np.array([chosen[key][0] if key in chosen else -1.0 for key in keys])
+    old_credits = np.array([chosen[key][2] if key in chosen else 0 for key in keys], dtype=np.float64)
+    keep_best = plan.retake_policy == "best"
+
+    def contribution(grades: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """grades (..., J) -> 과목별로 평점에 들어가는 (성적 × 학점, 학점)"""
+        points = grades * credits
+        counted = np.broadcast_to(credits, grades.shape)
+        if keep_best:
+            # 재수강 성적이 더 낮으면 기존 기록을 인정
+            keep_old = old_grade > grades
+            points = np.where(keep_old, old_grade * old_credits, points)
+            counted = np.where(keep_old, old_credits, counted)
+        return points, counted
+
+    def gpa_of(grades: np.ndarray) -> np.ndarray:
+        """grades (..., J) -> 평점 (...)"""
+        points, counted = contribution(grades)
+        return (fixed_points + points.sum(axis=-1)) / (fixed_credits + counted.sum(axis=-1))
+
+    # 성적표를 (J, K)로 채움. 모자란 칸은 마지막 성적, 누적 확률 1.0
+    size = max(len(course.grades) for course in hypothetical)
+    values = np.empty((len(hypothetical), size))
+    cumulative = np.ones((len(hypothetical), size))
+    possible = np.zeros((len(hypothetical), size), dtype=bool)  # 가중치가 0인 성적은 최저/최고에서 제외
+    for row, course in enumerate(hypothetical):
+        order = np.argsort(course.grades)
+        grades = np.asarray(course.grades, dtype=np.float64)[order]
+        weights = np.asarray(course.weights, dtype=np.float64)[order]
+        values[row, :len(grades)], values[row, len(grades):] = grades, grades[-1]
+        cumulative[row, :len(grades)] = np.cumsum(weights) / weights.sum()
+        cumulative[row, len(grades) - 1:] = 1.0
+        possible[row, :len(grades)] = weights > 0
+    lowest = values[np.arange(len(hypothetical)), possible.argmax(axis=1)]
+    highest = values[np.arange(len(hypothetical)), size - 1 - possible[:, ::-1].argmax(axis=1)]
+
+    # 칸마다 (성적 × 학점, 학점)을 미리 계산해 두고 시나리오에서는 칸 번호로 꺼내서 더하기만 함
+    points_table, credits_table = (table.T.ravel() for table in contribution(values.T))
+    # 과목 j의 누적 확률에 j를 더해 한 줄로 펴면 전체가 정렬된 배열이 되므로,
+    # 균등 난수 + j를 searchsorted 한 번으로 (시나리오 × 과목) 칸 번호로 바꿀 수 있음
+    offsets = np.arange(len(hypothetical))
+    rng = np.random.default_rng(seed)
+    draws = rng.random((scenarios, len(hypothetical))) + offsets
+    picked = np.searchsorted((cumulative + offsets[:, None]).ravel(), draws, side="right")
+    np.minimum(picked, offsets * size + size - 1, out=picked)  # 부동소수점 오차로 다음 과목으로 넘어가지 않도록
+    gpas = np.round((fixed_points + points_table[picked].sum(axis=1))
+                    / (fixed_credits + credits_table[picked].sum(axis=1)), 2)
+
+    low, high = float(gpa_of(lowest)), float(gpa_of(highest))
+    if keep_best:
+        projected_credits = int(fixed_credits + np.where(old_grade > highest, old_credits, credits).sum())
+    else:
+        projected_credits = int(fixed_credits + credits.sum())
+
+    # 0.1 단위 구간
+    start = np.floor(gpas.min() / HISTOGRAM_WIDTH) * HISTOGRAM_WIDTH
+    stop = max(start + HISTOGRAM_WIDTH, np.ceil(gpas.max() / HISTOGRAM_WIDTH) * HISTOGRAM_WIDTH)
+    edges = np.round(np.arange(start, stop + HISTOGRAM_WIDTH / 2, HISTOGRAM_WIDTH), 2)
+    counts, _ = np.histogram(gpas, bins=edges)
+
+    target_probability = required_grade = None
+    if target_gpa is not None:
+        target_probability = round(float((gpas >= target_gpa).mean()), 4)
+        # 등급마다 "모든 과목에서 이 성적"인 경우의 평점 (K개 한 번에)
+        uniform = np.round(gpa_of(np.repeat(np.asarray(GRADE_STEPS)[:, None], len(hypothetical), axis=1)), 2)
+        reached = np.nonzero(uniform >= target_gpa)[0]
+        required_grade = GRADE_STEPS[reached[0]] if len(reached) else None
+
+    return GpaProjection(
+        current_gpa=round(current_points / current_credits, 2) if current_credits else 0.0,
+        current_credits=current_credits,
+        projected_credits=projected_credits,
+        retakes=tuple(course.course_name for course, key in zip(hypothetical, keys) if key in chosen),
+        min_gpa=round(low, 2),
+        max_gpa=round(high, 2),
+        mean_gpa=round(float(gpas.mean()), 3),
+        std_gpa=round(float(gpas.std()), 3),
+        percentiles=tuple(zip(PERCENTILES, (round(float(value), 2) for value in np.percentile(gpas, PERCENTILES)))),
+        histogram=tuple((float(lower), float(upper), round(count / scenarios, 4))
+                        for lower, upper, count in zip(edges[:-1], edges[1:], counts.tolist())),
+        scenarios=scenarios,
+        target_gpa=target_gpa,
+        target_probability=target_probability,
+        required_grade=required_grade,
+    )
@@ -0,0 +1,252 @@
+"""
+전체 학생 졸업요건 일괄 점검
+
+수강신청 기간 전에 학과에서 졸업이 늦어질 수 있는 학생을 찾기 위한 명령입니다.
+
+- Student를 id 순으로 chunk 단위(keyset pagination)로 읽고, 같은 범위의 Course를 한 번에 읽음
+- chunk마다 프로세스 풀에서 `graduation_rules`로 평가
+- 결과는 chunk 순서대로 CSV 또는 JSON Lines로 바로 기록 (동시에 메모리에 있는 chunk는 workers * 2개까지)
+- chunk를 기록할 때마다 체크포인트를 남기므로 `--resume`으로 중단된 지점부터 이어서 실행
+
+사용 예시:
+    python graduation_audit.py audit.csv
+    python graduation_audit.py audit.jsonl --format jsonl --workers 4 --chunk-size 2000
+    python graduation_audit.py audit.csv --resume
+    python graduation_audit.py audit.csv --at-risk-only --as-of 2026-02-01
+"""
+# 외부 라이브러리
+from sqlmodel import Session, select
+# 내부 라이브러리
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+import time
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor, Future
+from datetime import date
+from pathlib import Path
+from typing import Iterator, Optional
+# 직접 작성한 모듈
+from graduation_rules import plan_for, admission_year_of, completed_semesters
+
+# 프로세스 간에는 ORM 객체 대신 이 튜플만 주고받음
+CourseRecord = namedtuple("CourseRecord", "course_name credits grade is_major is_retake")
+
+FIELDS = ("student_pk", "student_id", "name", "admission_year", "requirement_id", "satisfied", "at_risk",
+          "earned_credits", "required_credits", "expected_credits", "credit_gap", "major_credits", "gpa",
+          "failed_rules", "missing_courses", "provisional_failed_rules")
+
+
+def evaluate_chunk(students: list[tuple], as_of: date, slack: int) -> list[dict]:
+    """
+    프로세스 풀에서 실행되는 chunk 평가
+
+    :param students: (Student.id, 학번, 이름, [CourseRecord 필드 튜플, ...]) 목록
+    :param slack: 기대 학점보다 이만큼 넘게 부족해야 위험으로 판단
+    """
+    results = []
+    for student_pk, student_id, name, courses in students:
+        plan = plan_for(student_id)
+        report = plan.evaluate(CourseRecord._make(course) for course in courses)
+        rules = {rule.type: rule for rule in report.rules}
+        required = int(rules["total_credits"].required) if "total_credits" in rules else 0
+        admission_year = admission_year_of(student_id)
+        expected = round(required * completed_semesters(admission_year, as_of) / 8)
+        gap = expected - report.earned_credits
+        gpa_rule = rules.get("min_gpa")
+        if gpa_rule is not None and gpa_rule.provisional:
+            gpa_rule = None
+        at_risk = not report.satisfied and (
+            gap > slack
+            or (gpa_rule is not None and not gpa_rule.satisfied and report.gpa > 0)
+            # 마지막 학기인데 필수 과목이 남은 경우
+            or (completed_semesters(admission_year, as_of) >= 7
+                and "required_courses" in rules and not rules["required_courses"].satisfied)
+        )
+        results.append({
+            "student_pk": student_pk,
+            "student_id": student_id,
+            "name": name,
+            "admission_year": admission_year,
+            "requirement_id": report.requirement_id,
+            "satisfied": report.satisfied,
+            "at_risk": at_risk,
+            "earned_credits": report.earned_credits,
+            "required_credits": required,
+            "expected_credits": expected,
+            "credit_gap": max(0, gap),
+            "major_credits": report.major_credits,
+            "gpa": report.gpa,
+            "failed_rules": [rule.id for rule in report.rules if not rule.satisfied and not rule.provisional],
+            "missing_courses": [course for rule in report.rules for course in rule.missing],
+            # 기준값이 확인되지 않은 규칙 (참고용, 위험 판단에서 제외)
+            "provisional_failed_rules": [rule.id for rule in report.rules if not rule.satisfied and rule.provisional],
+        })
+    return results
+
+
+def iter_chunks(engine, chunk_size: int, after_student_pk: int = 0) -> Iterator[list[tuple]]:
+    """Student id 순으로 chunk를 만들어 반환 (chunk마다 쿼리 2번, OFFSET 없이 마지막 id 이후부터)"""
+    from models.student import Student
+    from models.course import Course
+
+    last_pk = after_student_pk
+    with Session(engine) as session:
+        while True:
+            students = session.exec(
+                select(Student.id, Student.student_id, Student.name)
+                .where(Student.id > last_pk).order_by(Student.id).limit(chunk_size)).all()
+            if not students:
+                return
+            first_pk, last_pk = students[0][0], students[-1][0]
+            courses: dict[int, list] = {student[0]: [] for student in students}
+            rows = session.exec(
+                select(Course.student_id, Course.course_name, Course.credits, Course.grade,
+                       Course.is_major, Course.is_retake)
+                .where(Course.student_id >= first_pk, Course.student_id <= last_pk)).all()
+            for student_pk, *record in rows:
+                courses[student_pk].append(tuple(record))
+            yield [(pk, student_id, name, courses[pk]) for pk, student_id, name in students]
+
+
+class AuditWriter:
+    """CSV / JSON Lines 출력 + 체크포인트"""
+
+    def __init__(self, path: Path, output_format: str, resume: bool):
+        self.path = path
+        self.output_format = output_format
+        self.checkpoint_path = path.with_name(path.name + ".checkpoint")
+        self.last_student_pk = 0
+        self.written = 0
+        self.at_risk = 0
+
+        checkpoint = self._read_checkpoint() if resume else None
+        if checkpoint:
+            self.last_student_pk = checkpoint["last_student_pk"]
+            self.written = checkpoint["written"]
+            self.at_risk = checkpoint["at_risk"]
+            self.file = open(path, "r+b")
+            # 체크포인트 이후에 일부만 기록된 행은 버림
+            self.file.truncate(checkpoint["output_bytes"])
+            self.file.seek(checkpoint["output_bytes"])
+        else:
+            self.file = open(path, "wb")
+            if output_format == "csv":
+                self.file.write(self._csv_line(FIELDS))
+
+    def _read_checkpoint(self) -> Optional[dict]:
+        if not self.checkpoint_path.exists() or not self.path.exists():
+            return None
+        checkpoint = json.loads(self.checkpoint_path.read_text())
+        if checkpoint.get("format") != self.output_format:
+            raise SystemExit(f"체크포인트의 출력 형식({checkpoint.get('format')})이 다릅니다.")
+        return checkpoint
+
+    @staticmethod
+    def _csv_line(values) -> bytes:
+        buffer = io.StringIO()
+        csv.writer(buffer).writerow(values)
+        return buffer.getvalue().encode("utf-8")
+
+    def write_chunk(self, results: list[dict], at_risk_only: bool) -> None:
+        lines = []
+        for result in results:
+            self.at_risk += result["at_risk"]
+            if at_risk_only and not result["at_risk"]:
+                continue
+            if self.output_format == "csv":
+                lines.append(self._csv_line([";".join(value) if isinstance(value, list) else value
+                                             for value in (result[field] for field in FIELDS)]))
+            else:
+                lines.append(json.dumps(result, ensure_ascii=False).encode("utf-8") + b"\n")
+        self.file.write(b"".join(lines))
+        self.written += len(results)
+        if results:
+            self.last_student_pk = results[-1]["student_pk"]
+        self._save_checkpoint()
+
+    def _save_checkpoint(self) -> None:
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        temporary = self.checkpoint_path.with_name(self.checkpoint_path.name + ".tmp")
+        temporary.write_text(json.dumps({
+            "format": self.output_format,
+            "last_student_pk": self.last_student_pk,
+            "written": self.written,
+            "at_risk": self.at_risk,
+            "output_bytes": self.file.tell(),
+        }))
+        os.replace(temporary, self.checkpoint_path)
+
+    def finish(self) -> None:
+        self.file.close()
+        self.checkpoint_path.unlink(missing_ok=True)
+
+
+def run_audit(database_url: str, output: Path, output_format: str = "csv", workers: Optional[int] = None,
+              chunk_size: int = 1000, resume: bool = False, as_of: Optional[date] = None, slack: int = 9,
+              at_risk_only: bool = False, progress: bool = False) -> AuditWriter:
+    from database import create_app_engine
+
+    as_of = as_of or date.today()
+    workers = workers or os.cpu_count() or 1
+    engine = create_app_engine(database_url)
+    writer = AuditWriter(output, output_format, resume)
+    started = time.perf_counter()
+    initial = writer.written
+
+    pending: deque[Future] = deque()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        def drain(limit: int) -> None:
+            # chunk 순서대로 기록해야 체크포인트(마지막 학생 id) 이전이 모두 기록된 상태가 됨
+            while len(pending) > limit:
+                writer.write_chunk(pending.popleft().result(), at_risk_only)
+                if progress:
+                    rate = (writer.written - initial) / (time.perf_counter() - started)
+                    print(f"\r{writer.written}명 처리 ({rate:.0f}명/초), 위험 {writer.at_risk}명",
+                          end="", file=sys.stderr)
+
+        for chunk in iter_chunks(engine, chunk_size, writer.last_student_pk):
+            pending.append(pool.submit(evaluate_chunk, chunk, as_of, slack))
+            drain(workers * 2)
+        drain(0)
+
+    if progress:
+        print(file=sys.stderr)
+    writer.finish()
+    engine.dispose()
+    return writer
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="전체 학생 졸업요건 일괄 점검")
+    parser.add_argument("output", help="결과 파일 경로 (예: audit.csv, audit.jsonl)")
+    parser.add_argument("--format", choices=("csv", "jsonl"), default=None, help="기본값: 확장자로 판단")
+    parser.add_argument("--database-url", default=None, help="기본값: env.DATABASE_URL")
+    parser.add_argument("--workers", type=int, default=None, help="평가 프로세스 수 (기본값: CPU 수)")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="한 번에 읽고 평가할 학생 수")
+    parser.add_argument("--resume", action="store_true", help="체크포인트가 있으면 이어서 실행")
+    parser.add_argument("--as-of", type=date.fromisoformat, default=None, help="기준일 (기본값: 오늘)")
+    parser.add_argument("--slack", type=int, default=9, help="기대 학점보다 이만큼 넘게 부족하면 위험 (기본값: 9)")
+    parser.add_argument("--at-risk-only", action="store_true", help="위험 학생만 기록")
+    args = parser.parse_args(argv)
+
+    output = Path(args.output)
+    output_format = args.format or ("jsonl" if output.suffix in (".jsonl", ".ndjson") else "csv")
+    if args.database_url is None:
+        from env import DATABASE_URL
+        args.database_url = DATABASE_URL
+
+    started = time.perf_counter()
+    writer = run_audit(args.database_url, output, output_format, args.workers, args.chunk_size, args.resume,
+                       args.as_of, args.slack, args.at_risk_only, progress=True)
+    print(f"완료: {writer.written}명, 위험 {writer.at_risk}명, {time.perf_counter() - started:.1f}초 → {output}",
+          file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
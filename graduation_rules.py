@@ -0,0 +1,267 @@
+"""
+졸업요건 규칙 엔진
+
+입학년도별 요건은 `data/graduation/*.json`에 선언합니다. 기동 시 한 번 읽어서
+규칙마다 필요한 집계(총 학점, 전공 학점, 이수 구분별 학점, 평점, 이수한 과목)만 모으는 평가 계획으로 컴파일합니다.
+
+학생 한 명 평가는 Course 행을 한 번만 훑습니다.
+같은 과목을 여러 번 들었으면 `retake_policy`에 따라 한 번만 인정합니다.
+- best: 가장 높은 성적
+- latest: 재수강 성적
+
+`"provisional": true`인 규칙은 기준값이 확인되지 않은 규칙입니다. 진행 상황은 보여 주지만
+졸업 충족 여부(satisfied), 일괄 점검의 위험 판단, 수강 계획의 과목 선택에는 쓰지 않습니다.
+
+결과는 (학생, Student.revision, 요건 id)로 캐시합니다. 과목이 바뀔 때마다 revision이 올라가므로 무효화가 따로 필요 없습니다.
+"""
+# 내부 라이브러리
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import Callable, Iterable, Optional
+# 직접 작성한 모듈
+from catalog import CATALOG, normalize_course_name
+from settings import GRADUATION_RULES_DIR, GRADUATION_CACHE_SIZE
+
+DEFAULT_RULES_DIR = Path(__file__).parent / "data" / "graduation"
+
+RULE_TYPES = ("total_credits", "major_credits", "category_credits", "required_courses", "min_gpa")
+RETAKE_POLICIES = ("best", "latest")
+
+
+@dataclass(frozen=True)
+class RuleProgress:
+    id: str
+    type: str
+    title: str
+    required: float
+    current: float
+    satisfied: bool
+    missing: tuple[str, ...] = ()  # required_courses: 아직 이수하지 않은 과목
+    provisional: bool = False  # 기준값이 확인되지 않은 규칙 (satisfied 판단에서 제외)
+
+    @property
+    def ratio(self) -> float:
+        """진행률 (0.0~1.0)"""
+        if self.required <= 0:
+            return 1.0
+        return min(1.0, self.current / self.required)
+
+
+@dataclass(frozen=True)
+class GraduationReport:
+    requirement_id: str
+    title: str
+    satisfied: bool  # provisional 규칙 제외
+    earned_credits: int  # 재수강 중복 제외, 통과한 과목 학점
+    major_credits: int
+    gpa: float  # 재수강 중복 제외
+    rules: tuple[RuleProgress, ...]
+
+
+class _Totals:
+    """Course 행을 훑으며 모으는 집계"""
+    __slots__ = ("earned", "major", "grade_points", "gpa_credits", "categories", "passed")
+
+    def __init__(self, categories: Iterable[str]):
+        self.earned = 0
+        self.major = 0
+        self.grade_points = 0.0
+        self.gpa_credits = 0
+        self.categories = dict.fromkeys(categories, 0)
+        self.passed: set[str] = set()  # 통과한 과목 (정규화된 과목명)
+
+    @property
+    def gpa(self) -> float:
+        return round(self.grade_points / self.gpa_credits, 2) if self.gpa_credits else 0.0
+
+
+class RequirementPlan:
+    """요건 데이터 하나를 컴파일한 평가 계획"""
+
+    def __init__(self, data: dict):
+        self.id: str = data["id"]
+        self.title: str = data["title"]
+        years = data.get("admission_years", {})
+        self.year_from: Optional[int] = years.get("from")
+        self.year_to: Optional[int] = years.get("to")
+        self.retake_policy: str = data.get("retake_policy", "best")
+        self.passing_grade: float = float(data.get("passing_grade", 1.0))
+        if self.retake_policy not in RETAKE_POLICIES:
+            raise ValueError(f"[{self.id}] 알 수 없는 retake_policy입니다: {self.retake_policy}")
+
+        self.rule_definitions: tuple[dict, ...] = tuple(data["rules"])  # 요건 파일의 규칙 (report.rules와 같은 순서)
+        self._checks: list[Callable[[_Totals], RuleProgress]] = []
+        self._categories: set[str] = set()
+        for rule in data["rules"]:
+            self._checks.append(self._compile(rule))
+        # 이수 구분별 학점 규칙이 보는 과목만 (정규화된 과목명 -> 이수 구분)
+        self._category_of: dict[str, str] = {normalize_course_name(course.name): course.category
+                                             for course in CATALOG.courses if course.category in self._categories}
+
+    def covers(self, admission_year: int) -> bool:
+        return ((self.year_from is None or self.year_from <= admission_year)
+                and (self.year_to is None or admission_year <= self.year_to))
+
+    def _compile(self, rule: dict) -> Callable[[_Totals], RuleProgress]:
+        rule_id, rule_type, title = rule["id"], rule["type"], rule["title"]
+        provisional = bool(rule.get("provisional", False))
+        if rule_type not in RULE_TYPES:
+            raise ValueError(f"[{self.id}] 알 수 없는 규칙 종류입니다: {rule_type}")
+
+        def progress(required: float, current: float, missing: tuple = ()) -> RuleProgress:
+            return RuleProgress(rule_id, rule_type, title, required, current,
+                                current >= required and not missing, missing, provisional)
+
+        if rule_type == "total_credits":
+            minimum = rule["min"]
+            return lambda totals: progress(minimum, totals.earned)
+        if rule_type == "major_credits":
+            minimum = rule["min"]
+            return lambda totals: progress(minimum, totals.major)
+        if rule_type == "category_credits":
+            minimum, category = rule["min"], rule["category"]
+            if not any(course.category == category for course in CATALOG.courses):
+                raise ValueError(f"[{self.id}] 카탈로그에 없는 이수 구분입니다: {category}")
+            self._categories.add(category)
+            return lambda totals: progress(minimum, totals.categories[category])
+        if rule_type == "required_courses":
+            # 카탈로그 과목이면 카탈로그 표기로 통일
+            names = tuple(CATALOG.find(name).name if CATALOG.find(name) else name for name in rule["courses"])
+            keys = tuple(normalize_course_name(name) for name in names)
+
+            def check_required(totals: _Totals) -> RuleProgress:
+                missing = tuple(name for name, key in zip(names, keys) if key not in totals.passed)
+                return progress(len(names), len(names) - len(missing), missing)
+            return check_required
+        # min_gpa
+        minimum = rule["min"]
+        return lambda totals: progress(minimum, totals.gpa)
+
+    def _prefer(self, candidate: tuple, current: tuple) -> bool:
+        """같은 과목의 두 수강 기록 (grade, is_retake, credits, is_major) 중 candidate를 인정해야 하는지"""
+        if self.retake_policy == "latest":
+            return candidate[1] and not current[1]
+        return candidate[:2] > current[:2]
+
+    def recognize(self, courses: Iterable) -> dict[str, tuple]:
+        """
+        과목별로 인정할 수강 기록만 남김 (정규화된 과목명 -> (grade, is_retake, credits, is_major))
+
+        :param courses: course_name, credits, grade, is_major, is_retake 속성이 있는 객체 (Course 또는 Row)
+        """
+        # ORM 속성 접근은 느리므로 행마다 한 번씩만 읽음
+        chosen: dict[str, tuple] = {}
+        for course in courses:
+            key = normalize_course_name(course.course_name)
+            record = (course.grade, course.is_retake, course.credits, course.is_major)
+            current = chosen.get(key)
+            if current is None or self._prefer(record, current):
+                chosen[key] = record
+        return chosen
+
+    def evaluate(self, courses: Iterable) -> GraduationReport:
+        """
+        과목 목록으로 요건 평가
+
+        :param courses: course_name, credits, grade, is_major, is_retake 속성이 있는 객체 (Course 또는 Row)
+        """
+        # 1. 한 번 훑으면서 과목별로 인정할 수강 기록만 남김
+        chosen = self.recognize(courses)
+
+        # 2. 인정된 기록으로 집계 (과목 수만큼)
+        totals = _Totals(self._categories)
+        category_of = self._category_of
+        for key, (grade, _, credits, is_major) in chosen.items():
+            totals.grade_points += grade * credits
+            totals.gpa_credits += credits
+            if grade < self.passing_grade:
+                continue
+            totals.earned += credits
+            totals.passed.add(key)
+            if is_major:
+                totals.major += credits
+            category = category_of.get(key)
+            if category is not None:
+                totals.categories[category] += credits
+
+        rules = tuple(check(totals) for check in self._checks)
+        return GraduationReport(
+            requirement_id=self.id,
+            title=self.title,
+            satisfied=all(rule.satisfied for rule in rules if not rule.provisional),
+            earned_credits=totals.earned,
+            major_credits=totals.major,
+            gpa=totals.gpa,
+            rules=rules,
+        )
+
+
+def load_requirement_plans(directory: Optional[str] = None) -> tuple[RequirementPlan, ...]:
+    """디렉토리의 요건 파일을 모두 컴파일 (입학년도 구간이 겹치면 ValueError)"""
+    plans = tuple(RequirementPlan(json.loads(path.read_text(encoding="utf-8")))
+                  for path in sorted(Path(directory or DEFAULT_RULES_DIR).glob("*.json")))
+    if not plans:
+        raise ValueError("졸업요건 파일이 없습니다.")
+    ordered = sorted(plans, key=lambda plan: plan.year_from if plan.year_from is not None else -1)
+    for previous, following in zip(ordered, ordered[1:]):
+        if previous.year_to is None or following.year_from is None or previous.year_to >= following.year_from:
+            raise ValueError(f"졸업요건 입학년도 구간이 겹칩니다: {previous.id}, {following.id}")
+    return tuple(ordered)
+
+
+REQUIREMENT_PLANS = load_requirement_plans(GRADUATION_RULES_DIR)
+
+
+def admission_year_of(student_id: str) -> Optional[int]:
+    """학번 앞 4자리 (예: 202401794 → 2024)"""
+    prefix = student_id[:4]
+    return int(prefix) if len(prefix) == 4 and prefix.isdigit() else None
+
+
+def completed_semesters(admission_year: Optional[int], as_of: date) -> int:
+    """기준일까지 끝난 정규 학기 수 (3월 입학, 휴학 없음 가정, 최대 8)"""
+    if admission_year is None:
+        return 8
+    completed = (as_of.year - admission_year) * 2 + (1 if as_of.month >= 9 else 0)
+    return max(0, min(8, completed))
+
+
+def plan_for(student_id: str) -> RequirementPlan:
+    """학번에 맞는 졸업요건 (입학년도를 알 수 없거나 맞는 구간이 없으면 가장 최근 요건)"""
+    year = admission_year_of(student_id)
+    if year is not None:
+        for plan in REQUIREMENT_PLANS:
+            if plan.covers(year):
+                return plan
+    return REQUIREMENT_PLANS[-1]
+
+
+# (Student.id, Student.revision, 요건 id) -> GraduationReport
+_report_cache: OrderedDict = OrderedDict()
+_report_cache_lock = threading.Lock()
+
+
+def evaluate_student(student, load_courses: Callable[[], Iterable]) -> GraduationReport:
+    """
+    학생의 졸업요건 평가 (revision이 같으면 캐시된 결과를 반환하고 과목을 조회하지 않음)
+
+    :param load_courses: 캐시에 없을 때만 호출되는 과목 조회 함수
+    """
+    plan = plan_for(student.student_id)
+    key = (student.id, student.revision, plan.id)
+    with _report_cache_lock:
+        report = _report_cache.get(key)
+        if report is not None:
+            _report_cache.move_to_end(key)
+            return report
+
+    report = plan.evaluate(load_courses())
+    with _report_cache_lock:
+        _report_cache[key] = report
+        while len(_report_cache) > GRADUATION_CACHE_SIZE:
+            _report_cache.popitem(last=False)
+    return report
@@ -0,0 +1,150 @@
+"""
+liveness / readiness 확인 (/health/live, /health/ready)
+
+- liveness: 프로세스와 이벤트 루프가 응답하는지만 확인 (DB를 건드리지 않으므로 DB 장애로 워커가 재시작되지 않음)
+- readiness: 이 워커에 요청을 보내도 되는지 확인
+  - database: `SELECT 1` 왕복 (HEALTH_DB_TIMEOUT초 안에 끝나야 함)
+  - pool: 사용 중인 커넥션 비율 (HEALTH_POOL_SATURATION 이상이면 DB를 조회하지 않고 실패, 조회하면 풀 대기로 늦어지므로)
+  - smtp, oauth: 최근 EXTERNAL_WINDOW초 동안의 호출 결과 (메트릭에서 계산, 외부 서비스를 직접 호출하지 않음)
+    외부 서비스 장애는 워커를 바꿔도 나아지지 않으므로 실패가 아니라 degraded로만 표시
+- 결과는 HEALTH_CACHE_SECONDS 동안 재사용하고, 동시에 들어온 확인 요청은 진행 중인 확인 하나를 함께 기다림
+  (확인 요청이 많아도 DB에는 주기마다 쿼리 한 번)
+"""
+# 외부 라이브러리
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+# 내부 라이브러리
+import asyncio
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Optional
+# 직접 작성한 모듈
+from metrics import Histogram, SMTP_SEND_SECONDS, OAUTH_REQUEST_SECONDS
+from settings import HEALTH_CACHE_SECONDS, HEALTH_DB_TIMEOUT, HEALTH_POOL_SATURATION
+
+OK, DEGRADED, FAIL = "ok", "degraded", "fail"
+_SEVERITY = {OK: 0, DEGRADED: 1, FAIL: 2}
+
+# 외부 서비스 호출 결과를 보는 구간과 degraded 기준
+EXTERNAL_WINDOW = 300.0
+EXTERNAL_MIN_CALLS = 3
+EXTERNAL_ERROR_RATIO = 0.5
+
+
+def check_pool(engine: Engine) -> dict:
+    pool = engine.pool
+    size = getattr(pool, "size", None)
+    checked_out = getattr(pool, "checkedout", None)
+    if size is None or checked_out is None:
+        return {"status": OK, "detail": "풀 상태를 확인할 수 없는 풀입니다."}
+    capacity = size() + max(0, getattr(pool, "_max_overflow", 0))
+    in_use = checked_out()
+    saturation = in_use / capacity if capacity else 0.0
+    return {
+        "status": FAIL if saturation >= HEALTH_POOL_SATURATION else OK,
+        "checked_out": in_use,
+        "capacity": capacity,
+        "saturation": round(saturation, 3),
+    }
+
+
+def ping_database(engine: Engine) -> None:
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1")).scalar_one()
+
+
+async def check_database(engine: Engine) -> dict:
+    started = time.perf_counter()
+    try:
+        await asyncio.wait_for(asyncio.to_thread(ping_database, engine), HEALTH_DB_TIMEOUT)
+    except asyncio.TimeoutError:
+        return {"status": FAIL, "detail": f"{HEALTH_DB_TIMEOUT}초 안에 응답하지 않았습니다."}
+    except Exception as error:
+        return {"status": FAIL, "detail": f"{type(error).__name__}: {error}"}
+    return {"status": OK, "latency_ms": round((time.perf_counter() - started) * 1000, 2)}
+
+
+class ExternalCalls:
+    """메트릭 히스토그램에서 최근 구간의 호출 수/오류 수 계산 (group_by 라벨별)"""
+
+    def __init__(self, histogram: Histogram, group_by: Optional[str] = None):
+        self.histogram = histogram
+        self.group_index = histogram.labelnames.index(group_by) if group_by else None
+        self.outcome_index = histogram.labelnames.index("outcome")
+        # (시각, {그룹: (호출 수, 오류 수)}) - 가장 오래된 항목이 구간의 기준
+        self._snapshots: deque[tuple[float, dict]] = deque()
+
+    def _totals(self) -> dict[str, tuple[int, int]]:
+        totals: dict[str, tuple[int, int]] = {}
+        for key, count in self.histogram.counts().items():
+            group = key[self.group_index] if self.group_index is not None else "all"
+            calls, errors = totals.get(group, (0, 0))
+            totals[group] = (calls + count, errors + (count if key[self.outcome_index] == "error" else 0))
+        return totals
+
+    def check(self, now: float) -> dict:
+        current = self._totals()
+        self._snapshots.append((now, current))
+        # 구간 시작보다 오래된 기준은 하나만 남김 (기록이 하나뿐이면 프로세스 시작부터)
+        while len(self._snapshots) > 1 and self._snapshots[1][0] <= now - EXTERNAL_WINDOW:
+            self._snapshots.popleft()
+        baseline = self._snapshots[0][1] if len(self._snapshots) > 1 else {}
+
+        groups = {}
+        for group, (calls, errors) in current.items():
+            base_calls, base_errors = baseline.get(group, (0, 0))
+            recent_calls, recent_errors = calls - base_calls, errors - base_errors
+            failing = recent_calls >= EXTERNAL_MIN_CALLS and recent_errors / recent_calls >= EXTERNAL_ERROR_RATIO
+            groups[group] = {"status": DEGRADED if failing else OK, "calls": recent_calls, "errors": recent_errors}
+        result = {
+            "status": worst(group["status"] for group in groups.values()),
+            "window_seconds": EXTERNAL_WINDOW,
+            "calls": sum(group["calls"] for group in groups.values()),
+            "errors": sum(group["errors"] for group in groups.values()),
+        }
+        if self.group_index is not None:
+            result["providers"] = groups
+        return result
+
+
+def worst(statuses) -> str:
+    return max(statuses, key=_SEVERITY.__getitem__, default=OK)
+
+
+class ReadinessChecker:
+    def __init__(self, engine: Engine, cache_seconds: float = HEALTH_CACHE_SECONDS):
+        self.engine = engine
+        self.cache_seconds = cache_seconds
+        self.smtp = ExternalCalls(SMTP_SEND_SECONDS)
+        self.oauth = ExternalCalls(OAUTH_REQUEST_SECONDS, group_by="provider")
+        self._result: Optional[dict] = None
+        self._checked_at = 0.0
+        self._running: Optional[asyncio.Task] = None
+
+    async def check(self) -> dict:
+        """캐시된 결과 또는 새로 확인한 결과"""
+        if self._result is not None and time.monotonic() - self._checked_at < self.cache_seconds:
+            return self._result
+        if self._running is None:
+            self._running = asyncio.ensure_future(self._check())
+            self._running.add_done_callback(lambda _: setattr(self, "_running", None))
+        return await asyncio.shield(self._running)
+
+    async def _check(self) -> dict:
+        checks = {"pool": check_pool(self.engine)}
+        if checks["pool"]["status"] == FAIL:
+            checks["database"] = {"status": FAIL, "detail": "커넥션 풀이 가득 차서 조회하지 않았습니다."}
+        else:
+            checks["database"] = await check_database(self.engine)
+        now = time.monotonic()
+        checks["smtp"] = self.smtp.check(now)
+        checks["oauth"] = self.oauth.check(now)
+
+        self._result = {
+            "status": worst(check["status"] for check in checks.values()),
+            "checked_at": datetime.now(timezone.utc).isoformat(),
+            "checks": checks,
+        }
+        self._checked_at = time.monotonic()
+        return self._result
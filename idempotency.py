@@ -0,0 +1,87 @@
+"""
+POST 재시도 처리 (Idempotency-Key)
+
+네트워크가 불안정한 모바일 클라이언트는 응답을 받지 못하면 같은 `POST /courses`를 다시 보냅니다.
+첫 요청이 이미 성공했다면 재시도는 "이미 등록되어 있습니다" 400을 받게 되므로,
+요청에 `Idempotency-Key` 헤더가 있으면 성공한 첫 응답을 저장해 두고 재시도에는 그 응답을 그대로 돌려줍니다.
+
+- 저장: 성공한 응답만, 과목/학생 등록과 같은 트랜잭션에서 (등록이 커밋되면 응답도 함께 커밋)
+- 재생: (사용자, 키)가 같고 경로/본문도 같으면 저장된 상태 코드와 본문 (`Idempotent-Replayed: true`), Course/Student는 조회하지 않음
+- 같은 키로 다른 요청(경로나 본문이 다름)을 보내면 422
+- 실패한 요청은 저장하지 않으므로 같은 키로 다시 시도할 수 있음
+- IDEMPOTENCY_TTL_HOURS가 지난 기록은 없는 것으로 보고, 같은 사용자가 새로 저장할 때 지움
+"""
+# 외부 라이브러리
+import pydantic_core
+from fastapi import Request, Response, HTTPException, status
+from pydantic import BaseModel
+from sqlmodel import Session, select, delete
+# 내부 라이브러리
+import hashlib
+from datetime import timedelta
+from typing import Any, Optional
+# 직접 작성한 모듈
+from models.course import utc_now_factory
+from models.idempotency_record import IdempotencyRecord
+from settings import IDEMPOTENCY_TTL_HOURS
+
+HEADER = "idempotency-key"
+MAX_KEY_LENGTH = 255
+
+
+def auth_scope(auth_info: tuple) -> str:
+    """로그인 방식별 사용자 식별자 (이메일 사용자는 이메일, OAuth 사용자는 id)"""
+    auth_type, user = auth_info
+    return f"{auth_type}:{user.email if auth_type == 'email' else user.id}"
+
+
+class IdempotentRequest:
+    """요청 하나의 Idempotency-Key 처리 (헤더가 없으면 아무것도 하지 않음)"""
+
+    def __init__(self, request: Request, auth_info: tuple, body: BaseModel):
+        self.key = request.headers.get(HEADER)
+        if self.key is not None and not 0 < len(self.key) <= MAX_KEY_LENGTH:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Idempotency-Key는 1~{MAX_KEY_LENGTH}자여야 합니다."
+            )
+        self.scope = auth_scope(auth_info)
+        self.fingerprint = hashlib.sha256(
+            f"{request.method} {request.url.path}\n".encode("utf-8") + body.model_dump_json().encode("utf-8")
+        ).hexdigest()
+
+    def replay(self, session: Session) -> Optional[Response]:
+        """같은 키로 성공한 요청이 있으면 저장된 응답"""
+        if self.key is None:
+            return None
+        record = session.exec(select(IdempotencyRecord).where(
+            IdempotencyRecord.scope == self.scope,
+            IdempotencyRecord.key == self.key,
+            IdempotencyRecord.created_at >= utc_now_factory() - timedelta(hours=IDEMPOTENCY_TTL_HOURS),
+        )).first()
+        if record is None:
+            return None
+        if record.fingerprint != self.fingerprint:
+            raise HTTPException(
+                status_code=422,
+                detail="같은 Idempotency-Key로 다른 요청을 보냈습니다. 새 요청에는 새 키를 사용해 주세요."
+            )
+        return Response(record.response_body, status_code=record.status_code, media_type="application/json",
+                        headers={"Idempotent-Replayed": "true"})
+
+    def remember(self, session: Session, status_code: int, value: Any) -> None:
+        """성공한 응답 저장 (호출한 쪽의 커밋에 포함)"""
+        if self.key is None:
+            return
+        # 만료된 기록 정리 (같은 키의 만료된 기록이 있으면 unique 제약에 걸리므로 먼저)
+        session.execute(delete(IdempotencyRecord).where(
+            IdempotencyRecord.scope == self.scope,
+            IdempotencyRecord.created_at < utc_now_factory() - timedelta(hours=IDEMPOTENCY_TTL_HOURS),
+        ))
+        session.add(IdempotencyRecord(
+            scope=self.scope,
+            key=self.key,
+            fingerprint=self.fingerprint,
+            status_code=status_code,
+            response_body=pydantic_core.to_json(value),
+        ))
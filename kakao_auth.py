@@ -11,27 +11,46 @@ from models.kakao_user import KakaoUser
 from schemas.kakao import KakaoLoginSuccessResponse, KakaoLoginErrorResponse
 from env import DATABASE_URL, KAKAO_CLIENT_ID, KAKAO_CLIENT_SECRET, KAKAO_REDIRECT_URI
 from auth_utils import get_serializer, cookie_generate, get_engine
+from database import upsert_insert
+from metrics import OAUTH_REQUEST_SECONDS
+from resilience import KAKAO
+from tracing import traced
 
 
 router = APIRouter(tags=["Kakao OAuth2"], prefix="/auth/kakao")
 
 
+@traced()
 def get_kakao_user_by_kakao_id(session: Session, kakao_id: str) -> Optional[KakaoUser]:
     """카카오 ID로 사용자 조회"""
     return session.exec(select(KakaoUser).where(KakaoUser.kakao_id == kakao_id)).first()
 
 
+@traced()
 def create_kakao_user(session: Session, kakao_id: str, nickname: str = None, picture: str = None) -> KakaoUser:
-    """새 카카오 사용자 생성"""
+    """
+    카카오 사용자 생성 (이미 있으면 기존 사용자 반환)
+
+    먼저 조회해서 이미 있는 사용자면 그대로 반환합니다 (SQLite 쓰기 잠금을 잡지 않도록, 처음 로그인할 때만 쓰기).
+    없을 때만 INSERT ... ON CONFLICT(kakao_id) DO NOTHING ... RETURNING으로 생성하므로 같은 사용자의 첫 로그인이 동시에 들어와도 하나만 생성됩니다.
+    """
+    user = get_kakao_user_by_kakao_id(session, kakao_id)
+    if user is not None:
+        return user
     user = KakaoUser(
         kakao_id=kakao_id,
         nickname=nickname,
         picture=picture
     )
-    session.add(user)
+    statement = upsert_insert(session, KakaoUser).values(**user.model_dump(exclude={"id"}))
+    statement = statement.on_conflict_do_nothing(index_elements=[KakaoUser.kakao_id])
+    created = session.scalars(statement.returning(KakaoUser)).one_or_none()
+    if created is None:
+        # 조회한 뒤 동시에 들어온 첫 로그인이 먼저 생성함: 바뀐 것이 없으므로 트랜잭션을 끝내고 조회
+        session.rollback()
+        return get_kakao_user_by_kakao_id(session, kakao_id)
     session.commit()
-    session.refresh(user)
-    return user
+    return created
 
 
 async def get_access_token(authorization_code: str) -> dict:
@@ -46,10 +65,15 @@ async def get_access_token(authorization_code: str) -> dict:
         "code": authorization_code
     }
     
-    async with httpx.AsyncClient() as client:
-        response = await client.post(token_url, data=data)
-        response.raise_for_status()
-        return response.json()
+    async def request() -> dict:
+        async with OAUTH_REQUEST_SECONDS.time(provider="kakao", operation="token"):
+            async with httpx.AsyncClient(timeout=KAKAO.timeout) as client:
+                response = await client.post(token_url, data=data)
+                response.raise_for_status()
+                return response.json()
+
+    # authorization code는 한 번만 쓸 수 있으므로 연결 실패만 재시도
+    return await KAKAO.call("token", request)
 
 
 async def get_user_info(access_token: str) -> dict:
@@ -60,10 +84,14 @@ async def get_user_info(access_token: str) -> dict:
         "Authorization": f"Bearer {access_token}"
     }
     
-    async with httpx.AsyncClient() as client:
-        response = await client.get(user_info_url, headers=headers)
-        response.raise_for_status()
-        return response.json()
+    async def request() -> dict:
+        async with OAUTH_REQUEST_SECONDS.time(provider="kakao", operation="user_info"):
+            async with httpx.AsyncClient(timeout=KAKAO.timeout) as client:
+                response = await client.get(user_info_url, headers=headers)
+                response.raise_for_status()
+                return response.json()
+
+    return await KAKAO.call("user_info", request, idempotent=True)
 
 
 @router.get("/login",
@@ -218,15 +246,12 @@ async def kakao_callback(request: Request, response: Response, code: str = None,
         # 데이터베이스에서 사용자 확인 또는 생성
         engine = get_engine()
         with Session(engine) as session:
-            user = get_kakao_user_by_kakao_id(session, kakao_id)
-            
-            if not user:
-                # 새 사용자 생성 (자동 회원가입)
-                user = create_kakao_user(session, kakao_id, nickname, picture)
+            # 사용자 조회 또는 생성 (자동 회원가입, 처음 로그인할 때만 쓰기)
+            create_kakao_user(session, kakao_id, nickname, picture)
             
             # auth-kakao 쿠키 생성
             serializer = get_serializer()
-            cookie_value = cookie_generate(str(user.kakao_id), serializer)
+            cookie_value = cookie_generate(str(kakao_id), serializer)
             
             # 대시보드로 리다이렉트하면서 쿠키 설정
             redirect_response = RedirectResponse(url="/dashboard", status_code=302)
@@ -0,0 +1,166 @@
+"""
+이벤트 루프 지연 감시 (LOOP_MONITOR = True일 때)
+
+`async def` 엔드포인트 안에서 동기 DB 조회나 동기 네트워크 호출을 하면 그동안 이벤트 루프가 멈춰서
+워커의 모든 요청이 함께 멈춥니다. 지금은 워커 전체가 느려진 뒤에야 알 수 있으므로 계속 측정합니다.
+
+- 루프 안의 Task가 LOOP_MONITOR_INTERVAL_MS마다 깨어나서, 예정보다 늦게 깨어난 시간(lag)을 히스토그램으로 기록
+- 별도 감시 스레드가 루프가 마지막으로 깨어난 시각을 보고, LOOP_BLOCK_THRESHOLD_MS 이상 멈춰 있으면
+  그 순간 루프 스레드의 스택과 실행 중인 요청의 경로를 캡처
+  - call_site: 스택에서 가장 안쪽의 이 프로젝트 코드 위치 (예: `main.py:812 get_courses`)
+  - 루프가 다시 깨어나면 멈춘 시간을 (경로, call_site)별 횟수/시간 합계로 기록
+  - call_site마다 LOG_INTERVAL초에 한 번 `graduon.loop` 로거에 스택을 JSON 한 줄로 남김
+- 가장 많이 멈춘 위치는 /metrics에서 `topk(10, graduon_event_loop_blocked_seconds_total)`로 확인
+"""
+# 외부 라이브러리
+from starlette.types import ASGIApp, Scope, Receive, Send
+# 내부 라이브러리
+import asyncio
+import json
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from typing import Optional
+# 직접 작성한 모듈
+from metrics import LOOP_LAG_SECONDS, LOOP_BLOCKS, LOOP_BLOCKED_SECONDS, route_template
+from settings import LOOP_MONITOR as ENABLED, LOOP_MONITOR_INTERVAL_MS, LOOP_BLOCK_THRESHOLD_MS
+
+logger = logging.getLogger("graduon.loop")
+
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+LOG_INTERVAL = 60.0
+STACK_LIMIT = 20
+
+# 요청을 처리 중인 Task -> ASGI scope (멈춘 Task가 어떤 요청인지 찾기 위해)
+_active_scopes: dict[asyncio.Task, Scope] = {}
+
+
+def is_project_frame(frame: traceback.FrameSummary) -> bool:
+    """이 프로젝트의 코드인지 (요청마다 스택에 있는 ASGI 미들웨어의 __call__은 제외)"""
+    return (frame.filename.startswith(PROJECT_ROOT) and "site-packages" not in frame.filename
+            and frame.name not in ("__call__", "send_wrapper"))
+
+
+def call_site(stack: traceback.StackSummary) -> str:
+    """스택에서 가장 안쪽의 프로젝트 코드 위치 (없으면 가장 안쪽 위치)"""
+    for frame in reversed(stack):
+        if is_project_frame(frame):
+            return f"{os.path.relpath(frame.filename, PROJECT_ROOT)}:{frame.lineno} {frame.name}"
+    if stack:
+        frame = stack[-1]
+        return f"{os.path.basename(frame.filename)}:{frame.lineno} {frame.name}"
+    return "<unknown>"
+
+
+class LoopMonitor:
+    def __init__(self, enabled: bool = ENABLED, interval: float = LOOP_MONITOR_INTERVAL_MS / 1000,
+                 threshold: float = LOOP_BLOCK_THRESHOLD_MS / 1000):
+        self.enabled = enabled
+        self.interval = interval
+        self.threshold = threshold
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id = 0
+        self._task: Optional[asyncio.Task] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+        # 루프가 마지막으로 깨어난 시각 (감시 스레드는 읽기만 함)
+        self._heartbeat = 0.0
+        # 감시 스레드가 캡처한 멈춤: (heartbeat, route, call_site, stack)
+        self._pending: Optional[tuple] = None
+        self._last_logged: dict[tuple, float] = {}
+
+    def start(self) -> None:
+        """측정 Task와 감시 스레드 시작 (lifespan에서 호출, 꺼져 있으면 아무것도 하지 않음)"""
+        if not self.enabled:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._stopped.clear()
+        self._task = asyncio.create_task(self._measure())
+        self._thread = threading.Thread(target=self._watch, name="loop-monitor", daemon=True)
+        self._thread.start()
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._stopped.set()
+        self._task.cancel()
+        self._task = None
+        await asyncio.to_thread(self._thread.join)
+
+    async def _measure(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            heartbeat = self._heartbeat
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, loop.time() - expected)
+            self._heartbeat = time.monotonic()
+            LOOP_LAG_SECONDS.observe(lag)
+            pending = self._pending
+            if pending is not None and pending[0] == heartbeat:
+                self._pending = None
+                # 캡처는 했지만 실제로 늦게 깨어난 시간이 한도보다 짧으면 멈춤이 아님
+                if lag >= self.threshold:
+                    self._record(pending[1], pending[2], pending[3], lag)
+
+    def _record(self, route: str, site: str, stack: traceback.StackSummary, blocked: float) -> None:
+        LOOP_BLOCKS.inc(route=route, call_site=site)
+        LOOP_BLOCKED_SECONDS.inc(blocked, route=route, call_site=site)
+        key = (route, site)
+        now = time.monotonic()
+        if now - self._last_logged.get(key, -LOG_INTERVAL) >= LOG_INTERVAL:
+            self._last_logged[key] = now
+            logger.warning(json.dumps({
+                "event": "event_loop_blocked",
+                "blocked_ms": round(blocked * 1000, 1),
+                "route": route,
+                "call_site": site,
+                "stack": [f"{frame.filename}:{frame.lineno} {frame.name}" for frame in stack[-STACK_LIMIT:]],
+            }, ensure_ascii=False))
+
+    def _watch(self) -> None:
+        """감시 스레드: 루프가 한도 이상 멈춰 있으면 루프 스레드의 스택 캡처 (멈춤 한 번에 한 번)"""
+        captured_for = None
+        while not self._stopped.wait(self.interval):
+            heartbeat = self._heartbeat
+            # heartbeat 뒤에는 interval만큼 자는 시간이 있으므로 예정된 깨어날 시각부터의 지연으로 비교
+            if heartbeat == captured_for or time.monotonic() - heartbeat - self.interval < self.threshold:
+                continue
+            captured_for = heartbeat
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+            stack = traceback.extract_stack(frame)
+            task = asyncio.current_task(self._loop)
+            scope = _active_scopes.get(task)
+            route = f'{scope["method"]} {route_template(scope)}' if scope is not None else "<background>"
+            # 캡처하는 사이에 루프가 다시 깨어났으면 스택이 멈춘 위치가 아니므로 버림
+            if self._heartbeat == heartbeat:
+                self._pending = (heartbeat, route, call_site(stack), stack)
+
+
+class LoopMonitorMiddleware:
+    """요청을 처리하는 Task와 scope를 기록하는 ASGI 미들웨어 (멈춘 요청의 경로를 찾기 위해)"""
+
+    def __init__(self, app: ASGIApp, enabled: bool = ENABLED):
+        self.app = app
+        self.enabled = enabled
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if not self.enabled or scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        task = asyncio.current_task()
+        _active_scopes[task] = scope
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _active_scopes.pop(task, None)
+
+
+LOOP_MONITOR = LoopMonitor()
@@ -1,38 +1,99 @@
 # 외부 라이브러리
-from fastapi import FastAPI, Response, status, HTTPException, Request, Depends
+from fastapi import FastAPI, Response, status, HTTPException, Request, Depends, Query
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse, RedirectResponse, HTMLResponse
-from sqlmodel import create_engine, SQLModel, Session, select
+from fastapi.responses import FileResponse, RedirectResponse, HTMLResponse, PlainTextResponse, JSONResponse
+from sqlmodel import SQLModel, Session, select, insert, update, delete
+from sqlalchemy import and_, or_, func, case, exists, literal
+from sqlalchemy.exc import IntegrityError
 from typing import Optional, Union, List
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+import asyncio
+import hashlib
 # 직접 작성한 모듈
 from auth import router as auth_router, get_user_by_email
 from google_auth import router as google_auth_router, get_google_user_by_google_id
 from naver_auth import router as naver_auth_router, get_naver_user_by_naver_id
 from kakao_auth import router as kakao_auth_router, get_kakao_user_by_kakao_id
-from env import DATABASE_URL
+from catalog import router as catalog_router, CATALOG, etag_matches
+from autocomplete import COURSE_NAME_INDEX, load_course_students
 from models.student import Student
-from models.course import Course
+from models.course import Course, utc_now_factory
 from models.user import User
 from models.google_user import GoogleUser
 from models.naver_user import NaverUser
 from models.kakao_user import KakaoUser
 from schemas.student import StudentCreateRequest, StudentResponse
-from schemas.course import CourseCreateRequest, CourseResponse
-from auth_utils import get_engine, get_serializer, cookie_load
+from schemas.course import (CourseCreateRequest, CourseResponse, CourseSuggestionResponse, SemesterSyncRequest,
+                            SemesterSyncResponse, CourseChangesResponse)
+from schemas.graduation import (GraduationStatusResponse, RuleProgressResponse, GraduationPlanResponse,
+                                PlannedSemesterResponse, PlannedCourseResponse)
+from schemas.bootstrap import (BootstrapResponse, CourseSummaryResponse, SemesterSummaryResponse,
+                               VersionsResponse)
+from schemas.gpa import GpaProjectionRequest, GpaProjectionResponse, PercentileResponse, HistogramBinResponse
+from graduation_rules import evaluate_student, plan_for
+from gpa_projection import HypotheticalCourse, project_gpa
+from course_planner import plan_student
+from page_render import cached_page, render_page
+from response_cache import RESPONSE_CACHE, CachedResponse
+from singleflight import READ_FLIGHTS
+from idempotency import IdempotentRequest
+from write_coordinator import WRITE_COORDINATOR
+from course_changes import record_course_changes, load_course_changes, INSERT, UPDATE, DELETE
+from auth_utils import get_engine, get_session, get_serializer, cookie_load
+from metrics import MetricsMiddleware, REGISTRY, CONTENT_TYPE as METRICS_CONTENT_TYPE, register_pool
+from query_monitor import QueryStatsMiddleware
+from tracing import TracingMiddleware, traced
+from loop_monitor import LOOP_MONITOR, LoopMonitorMiddleware
+from admission import AdmissionMiddleware
+from health import ReadinessChecker, FAIL
+from database import engine, USES_TUNED_SQLITE, sqlite_maintenance_loop, add_missing_columns, add_missing_indexes
+from settings import CATALOG_STRICT, PLANNER_CREDIT_CAP, SSR_PAGES, SINGLEFLIGHT_TIMEOUT
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """앱 기동/종료 시 백그라운드 작업 관리"""
+    background_tasks = []
+    # 자동완성 인덱스에 이미 등록된 과목명 추가 (카탈로그 과목은 import 시점에 들어가 있음)
+    with Session(engine) as session:
+        COURSE_NAME_INDEX.load(*await asyncio.to_thread(load_course_students, session))
+    if USES_TUNED_SQLITE:
+        background_tasks.append(asyncio.create_task(sqlite_maintenance_loop(engine)))
+    WRITE_COORDINATOR.start()
+    LOOP_MONITOR.start()
+    yield
+    await LOOP_MONITOR.stop()
+    await WRITE_COORDINATOR.stop()
+    for task in background_tasks:
+        task.cancel()
+
 
 app = FastAPI(
     title="Graduon",
     description="Graduon - 한국외국어대학교 컴퓨터공학부 졸업 요건 서비스",
     version="0.1.0",
+    lifespan=lifespan,
 )
-engine = create_engine(DATABASE_URL, echo=True, pool_size=100, max_overflow=5, pool_timeout=30)
 SQLModel.metadata.create_all(engine)
+add_missing_columns(engine)
+add_missing_indexes(engine)
+register_pool("main", engine)
+READINESS = ReadinessChecker(engine)
+
+# Middlewares
+app.add_middleware(LoopMonitorMiddleware)
+app.add_middleware(QueryStatsMiddleware)
+app.add_middleware(AdmissionMiddleware)  # 거절한 요청도 메트릭에 남도록 MetricsMiddleware 안쪽
+app.add_middleware(MetricsMiddleware)
+app.add_middleware(TracingMiddleware)  # 가장 바깥: 요청 수 제한 대기 시간까지 root span에 포함
 
 # Include routers
 app.include_router(auth_router)
 app.include_router(google_auth_router)
 app.include_router(naver_auth_router)
 app.include_router(kakao_auth_router)
+app.include_router(catalog_router)
 
 # Static files
 app.mount("/static", StaticFiles(directory="static"), name="static")
@@ -77,7 +138,11 @@ async def fill_student_info():
          summary="메인 대시보드",
          description="졸업 진행률과 학점 관리 기능을 제공하는 대시보드 페이지를 반환합니다.",
          response_class=FileResponse)
-async def dashboard():
+async def dashboard(request: Request, session: Session = Depends(get_session)):
+    if SSR_PAGES:
+        rendered = await render_student_page("static/frontend/dashboard.html", ["graduation"], request, session)
+        if rendered is not None:
+            return rendered
     return FileResponse("static/frontend/dashboard.html")
 
 @app.get("/grade-management",
@@ -98,7 +163,11 @@ async def grade_input():
          summary="졸업 학점 계산기 페이지",
          description="졸업 학점 계산기 페이지를 반환합니다.",
          response_class=FileResponse)
-async def graduation_calculator():
+async def graduation_calculator(request: Request, session: Session = Depends(get_session)):
+    if SSR_PAGES:
+        rendered = await render_student_page("static/frontend/graduation_calculator.html", ["graduation"], request, session)
+        if rendered is not None:
+            return rendered
     return FileResponse("static/frontend/graduation_calculator.html")
 
 @app.get("/credit-status",
@@ -112,7 +181,11 @@ async def credit_status():
          summary="마이페이지",
          description="마이페이지를 반환합니다.",
          response_class=FileResponse)
-async def my():
+async def my(request: Request, session: Session = Depends(get_session)):
+    if SSR_PAGES:
+        rendered = await render_student_page("static/frontend/my.html", ["courses"], request, session)
+        if rendered is not None:
+            return rendered
     return FileResponse("static/frontend/my.html")
 
 @app.get("/course-management",
@@ -125,26 +198,78 @@ async def course_management():
 @app.get("/ping",
          status_code=status.HTTP_204_NO_CONTENT,
          summary="서버 기동 확인",
-         response_description="서버와 데이터베이스가 정상 작동함을 응답 (204 No Content)",
+         response_description="서버 프로세스가 요청을 받고 있음 (204 No Content)",
          responses={
-             204: {"description": "서버와 데이터베이스 모두 살아있음"},
-             500: {"description": "서버 혹은 데이터베이스가 죽었음"},
+             204: {"description": "서버가 살아있음 (데이터베이스는 확인하지 않음)"},
          }
          )
 async def does_server_alive(response: Response) -> Response:
     """
-    서버, 데이터베이스가 살아있는지 확인하는 API입니다.
+    서버 프로세스가 살아있는지 확인하는 API입니다. 데이터베이스는 확인하지 않습니다.
 
     ## 프론트엔드 지침
-    서버가 살아있는지 확인할 때 사용할 수 있는 다재다능한 API입니다.
+    서버에 연결할 수 있는지 확인할 때 사용합니다.
+    데이터베이스까지 정상인지 확인하려면 `/health/ready`를 사용하세요.
     """
     response.status_code = status.HTTP_204_NO_CONTENT
     return response
 
 
+@app.get("/health/live",
+         summary="liveness 확인",
+         description="프로세스와 이벤트 루프가 응답하는지 확인합니다. 데이터베이스는 확인하지 않습니다.",
+         responses={
+             200: {"description": "살아있음"},
+         })
+async def health_live() -> dict:
+    """
+    오케스트레이터의 liveness probe용입니다. 실패하면 워커를 재시작해야 한다는 뜻이므로
+    DB, 외부 서비스 장애와 관계없이 이벤트 루프가 돌고 있으면 200을 반환합니다.
+    """
+    return {"status": "ok"}
+
+
+@app.get("/health/ready",
+         summary="readiness 확인",
+         description="데이터베이스 왕복, 커넥션 풀 사용률, 최근 SMTP/OAuth 호출 결과를 확인합니다.",
+         responses={
+             200: {"description": "요청을 받을 수 있음 (status: ok 또는 degraded)"},
+             503: {"description": "요청을 받을 수 없음 (checks에 실패한 항목과 이유)"},
+         })
+async def health_ready() -> JSONResponse:
+    """
+    오케스트레이터의 readiness probe용입니다.
+
+    - `database`, `pool`이 실패하면 `503` (이 워커에 요청을 보내지 않아야 함)
+    - `smtp`, `oauth`는 최근 5분 호출의 절반 이상이 실패하면 `degraded`로 표시하지만 `200` (워커를 바꿔도 나아지지 않으므로)
+    - 결과는 `HEALTH_CACHE_SECONDS`(2초) 동안 재사용하므로 자주 호출해도 DB 부하는 늘지 않습니다
+
+    ```json
+    {"status": "fail", "checked_at": "...", "checks": {"pool": {"status": "fail", "checked_out": 16, "capacity": 16, "saturation": 1.0}, "database": {"status": "fail", "detail": "..."}, "smtp": {...}, "oauth": {...}}}
+    ```
+    """
+    result = await READINESS.check()
+    return JSONResponse(result, status_code=status.HTTP_503_SERVICE_UNAVAILABLE if result["status"] == FAIL else 200)
+
+
+@app.get("/metrics",
+         summary="서버 메트릭",
+         description="요청 수, route별 latency, DB 커넥션 풀, SMTP/OAuth 호출 시간을 Prometheus 텍스트 포맷으로 반환합니다.",
+         response_class=PlainTextResponse)
+async def get_metrics() -> PlainTextResponse:
+    """
+    Prometheus 스크레이퍼가 호출하는 API입니다.
+
+    ## 프론트엔드 지침
+    프론트엔드에서 사용할 일은 없습니다.
+    """
+    return PlainTextResponse(REGISTRY.render(), media_type=METRICS_CONTENT_TYPE)
+
+
+@traced()
 def authenticate_user_from_cookies(
         request: Request,
-        session: Session = Depends(lambda: Session(engine)),
+        session: Session = Depends(get_session),
         serializer=Depends(get_serializer)
 ) -> tuple[str, Union[User, GoogleUser, NaverUser, KakaoUser]]:
     """쿠키에서 사용자 인증 정보를 추출하고 검증"""
@@ -198,11 +323,11 @@ def authenticate_user_from_cookies(
     )
 
 
-def get_student_from_auth(
+def find_student(
         auth_info: tuple[str, Union[User, GoogleUser, NaverUser, KakaoUser]],
         session: Session
-) -> Student:
-    """인증된 사용자의 Student 레코드 조회"""
+) -> Optional[Student]:
+    """인증된 사용자의 Student 레코드 조회 (없으면 None)"""
     auth_type, user = auth_info
 
     # Student 레코드 조회
@@ -216,7 +341,15 @@ def get_student_from_auth(
     elif auth_type == "kakao":
         student_stmt = student_stmt.where(Student.kakao_user_id == user.id)
 
-    student = session.exec(student_stmt).first()
+    return session.exec(student_stmt).first()
+
+
+def get_student_from_auth(
+        auth_info: tuple[str, Union[User, GoogleUser, NaverUser, KakaoUser]],
+        session: Session
+) -> Student:
+    """인증된 사용자의 Student 레코드 조회"""
+    student = find_student(auth_info, session)
     if not student:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -226,6 +359,173 @@ def get_student_from_auth(
     return student
 
 
+def get_student_courses(session: Session, student: Student, semester: Optional[str] = None) -> List[Course]:
+    """학생의 과목 목록 조회 (semester를 주면 해당 학기만), 과목명 순 / 초수강 먼저"""
+    courses_stmt = select(Course).where(Course.student_id == student.id)
+    if semester is not None:
+        courses_stmt = courses_stmt.where(Course.semester == semester)
+    courses_stmt = courses_stmt.order_by(Course.course_name, Course.is_retake)
+    return session.exec(courses_stmt).all()
+
+
+def resolve_course_name(course_name: str, credits: int, is_major: bool) -> str:
+    """이수체계도 과목이면 카탈로그 표기로 통일하고 학점 확인 (맞지 않으면 HTTPException)"""
+    catalog_course = CATALOG.find(course_name)
+    if catalog_course:
+        if credits != catalog_course.credits:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"'{catalog_course.name}' 과목은 {catalog_course.credits}학점입니다."
+            )
+        return catalog_course.name
+    if CATALOG_STRICT and is_major:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"'{course_name}' 과목은 전공 이수체계도에 없는 과목입니다."
+        )
+    return course_name
+
+
+def semester_etag(courses: List[Course]) -> str:
+    """학기 과목 목록의 버전 (과목이 추가/수정/삭제되면 바뀜)"""
+    digest = hashlib.sha256()
+    for course in sorted(courses, key=lambda course: course.id):
+        digest.update(f"{course.id}:{as_utc(course.updated_at).isoformat()};".encode())
+    return '"' + digest.hexdigest()[:32] + '"'
+
+
+class CourseChanged(Exception):
+    """조회한 뒤 다른 곳에서 과목이 수정/삭제되어 조건부 수정/삭제가 적용되지 않음 (409)"""
+
+
+def as_utc(value: datetime) -> datetime:
+    """SQLite에서 읽은 시각은 timezone이 없으므로 UTC로 간주"""
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+
+def to_course_response(course: Course) -> CourseResponse:
+    return CourseResponse(
+        id=course.id,
+        student_id=course.student_id,
+        semester=course.semester,
+        course_name=course.course_name,
+        credits=course.credits,
+        grade=course.grade,
+        is_major=course.is_major,
+        is_retake=course.is_retake,
+        created_at=course.created_at.isoformat(),
+        updated_at=course.updated_at.isoformat()
+    )
+
+
+def to_student_response(student: Student) -> StudentResponse:
+    return StudentResponse(
+        id=student.id,
+        student_id=student.student_id,
+        name=student.name,
+        user_email=student.user_email,
+        google_user_id=student.google_user_id,
+        naver_user_id=student.naver_user_id,
+        kakao_user_id=student.kakao_user_id,
+        created_at=student.created_at.isoformat(),
+        updated_at=student.updated_at.isoformat()
+    )
+
+
+def to_graduation_response(report) -> GraduationStatusResponse:
+    return GraduationStatusResponse(
+        requirement_id=report.requirement_id,
+        title=report.title,
+        satisfied=report.satisfied,
+        earned_credits=report.earned_credits,
+        major_credits=report.major_credits,
+        gpa=report.gpa,
+        rules=[
+            RuleProgressResponse(
+                id=rule.id,
+                type=rule.type,
+                title=rule.title,
+                required=rule.required,
+                current=rule.current,
+                ratio=rule.ratio,
+                satisfied=rule.satisfied,
+                missing=list(rule.missing),
+                provisional=rule.provisional,
+            )
+            for rule in report.rules
+        ]
+    )
+
+
+def auth_user_info_of(auth_type: str, user: Union[User, GoogleUser, NaverUser, KakaoUser]) -> dict:
+    """로그인 방식별 사용자 정보 (프로필 이미지용)"""
+    if auth_type == "email":
+        return {"email": user.email}
+    elif auth_type in ("google", "naver"):
+        return {"email": user.email, "name": user.name, "picture": user.picture}
+    elif auth_type == "kakao":
+        return {"nickname": user.nickname, "picture": user.picture}
+    return {}
+
+
+def get_course_summary(session: Session, student: Student) -> CourseSummaryResponse:
+    """학기별 과목 수/학점 합계 (과목을 읽지 않고 SQL에서 집계)"""
+    rows = session.exec(
+        select(Course.semester, func.count(Course.id), func.sum(Course.credits),
+               func.sum(case((Course.is_major == True, Course.credits), else_=0)))
+        .where(Course.student_id == student.id).group_by(Course.semester).order_by(Course.semester)).all()
+    return CourseSummaryResponse(
+        courses=sum(count for _, count, _, _ in rows),
+        total_credits=sum(credits for _, _, credits, _ in rows),
+        major_credits=sum(major for _, _, _, major in rows),
+        semesters=[SemesterSummaryResponse(semester=semester, courses=count, credits=credits)
+                   for semester, count, credits, _ in rows],
+    )
+
+
+def build_course_list_response(session: Session, student: Student, cache_key: str,
+                               semester: Optional[str] = None) -> CachedResponse:
+    """과목 목록 응답을 만들어 응답 캐시에 저장 (semester를 주면 해당 학기만, ETag 포함)"""
+    courses = get_student_courses(session, student, semester)
+    headers = {"ETag": semester_etag(courses)} if semester is not None else None
+    return RESPONSE_CACHE.set(cache_key, [to_course_response(course) for course in courses], headers)
+
+
+async def coalesce_read(route: str, key: str, function, *args):
+    """
+    응답 캐시에 없는 읽기를 스레드에서 실행 (같은 키로 진행 중인 계산이 있으면 그 결과를 함께 사용)
+
+    SINGLEFLIGHT_TIMEOUT 안에 끝나지 않으면 503
+    """
+    try:
+        return await READ_FLIGHTS.do(route, key, lambda: asyncio.to_thread(run_in_new_session, function, *args),
+                                     SINGLEFLIGHT_TIMEOUT)
+    except asyncio.TimeoutError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="요청을 처리하는 데 시간이 오래 걸리고 있습니다. 잠시 후 다시 시도해 주세요."
+        )
+
+
+BOOTSTRAP_SECTIONS = ("courses", "course_summary", "graduation", "versions")
+
+
+def run_in_new_session(function, *args):
+    """스레드에서 실행할 조회 (Session은 스레드 간에 공유할 수 없으므로 각자 엽니다)"""
+    with Session(engine) as session:
+        return function(session, *args)
+
+
+def bump_student_revision(session: Session, student: Student) -> int:
+    """
+    과목이 바뀌었음을 기록 (같은 트랜잭션에서 커밋, 동시 요청에도 증가분이 유실되지 않도록 SQL에서 +1)
+
+    :return: 올라간 revision (변경 기록에 사용)
+    """
+    return session.execute(update(Student).where(Student.id == student.id)
+                           .values(revision=Student.revision + 1).returning(Student.revision)).scalar_one()
+
+
 @app.post("/students",
           status_code=status.HTTP_201_CREATED,
           response_model=StudentResponse,
@@ -238,8 +538,9 @@ def get_student_from_auth(
           })
 async def create_student(
         student_request: StudentCreateRequest,
+        request: Request,
         auth_info: tuple[str, Union[User, GoogleUser, NaverUser, KakaoUser]] = Depends(authenticate_user_from_cookies),
-        session: Session = Depends(lambda: Session(engine))
+        session: Session = Depends(get_session)
 ) -> StudentResponse:
     """
     현재 로그인된 사용자의 학생 정보를 등록합니다.
@@ -248,30 +549,15 @@ async def create_student(
     - 로그인 상태에서만 호출 가능합니다
     - 한 사용자당 하나의 학생 정보만 등록 가능합니다
     - 학번은 전체 시스템에서 고유해야 합니다
+    - 응답을 받지 못해 다시 보낼 때는 `Idempotency-Key` 헤더에 처음과 같은 값을 넣으면 처음 응답을 그대로 받습니다
     """
-    # 이미 등록된 학생인지 확인 (get_student_from_auth에서 예외가 발생하지 않으면 이미 등록됨)
-    try:
-        get_student_from_auth(auth_info, session)
-        # 학생 정보가 이미 있으면 예외 발생
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="이미 학생 정보가 등록되어 있습니다."
-        )
-    except HTTPException as e:
-        # 학생 정보가 없어서 발생한 예외는 무시 (정상적인 신규 등록)
-        if e.status_code != status.HTTP_400_BAD_REQUEST or "학생 정보가 등록되지 않았습니다" not in e.detail:
-            raise e
-
     auth_type, user = auth_info
 
-    # 학번 중복 확인
-    student_id_stmt = select(Student).where(Student.student_id == student_request.student_id)
-    existing_student_id = session.exec(student_id_stmt).first()
-    if existing_student_id:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"학번 '{student_request.student_id}'는 이미 등록되어 있습니다."
-        )
+    # 같은 Idempotency-Key로 이미 등록했으면 처음 응답 반환
+    idempotent = IdempotentRequest(request, auth_info, student_request)
+    replayed = idempotent.replay(session)
+    if replayed is not None:
+        return replayed
 
     # Student 레코드 생성
     student_data = {
@@ -288,23 +574,36 @@ async def create_student(
     elif auth_type == "kakao":
         student_data["kakao_user_id"] = user.id
 
+    # 중복 확인은 unique 제약(학번, 사용자당 하나)에 맡기고 INSERT ... RETURNING 한 번으로 등록
     student = Student(**student_data)
-    session.add(student)
-    session.commit()
-    session.refresh(student)
+
+    def write(session: Session) -> StudentResponse:
+        created = session.scalars(
+            insert(Student).values(**student.model_dump(exclude={"id"})).returning(Student)).one()
+        response = to_student_response(created)
+        idempotent.remember(session, status.HTTP_201_CREATED, response)
+        return response
+
+    try:
+        response = await WRITE_COORDINATOR.run(session, write)
+    except IntegrityError as error:
+        session.rollback()
+        # 같은 키의 재시도가 동시에 들어와 먼저 끝난 쪽이 있으면 그 응답
+        replayed = idempotent.replay(session)
+        if replayed is not None:
+            return replayed
+        if "student_id" in str(error.orig):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"학번 '{student_request.student_id}'는 이미 등록되어 있습니다."
+            )
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="이미 학생 정보가 등록되어 있습니다."
+        )
 
     # 응답 생성
-    return StudentResponse(
-        id=student.id,
-        student_id=student.student_id,
-        name=student.name,
-        user_email=student.user_email,
-        google_user_id=student.google_user_id,
-        naver_user_id=student.naver_user_id,
-        kakao_user_id=student.kakao_user_id,
-        created_at=student.created_at.isoformat(),
-        updated_at=student.updated_at.isoformat()
-    )
+    return response
 
 
 @app.post("/courses",
@@ -319,8 +618,9 @@ async def create_student(
           })
 async def create_course(
         course_request: CourseCreateRequest,
+        request: Request,
         auth_info: tuple[str, Union[User, GoogleUser, NaverUser, KakaoUser]] = Depends(authenticate_user_from_cookies),
-        session: Session = Depends(lambda: Session(engine))
+        session: Session = Depends(get_session)
 ) -> CourseResponse:
     """
     현재 로그인된 학생의 과목 정보를 등록합니다.
@@ -330,70 +630,77 @@ async def create_course(
     - 학생 정보가 먼저 등록되어 있어야 합니다
     - 같은 과목은 초수강 1번, 재수강 1번까지 총 2번 수강 가능합니다
     - 재수강인 경우 반드시 초수강이 먼저 등록되어 있어야 합니다
-    
-    ## TODO
-    - 과목 삭제 기능 구현 예정
+    - 전공 이수체계도(`/catalog`)에 있는 과목은 학점이 카탈로그와 같아야 하며, 과목명은 카탈로그 표기로 저장됩니다 (예: "자료 구조" → "자료구조")
+    - 과목 수정/삭제는 `PATCH /courses/semester/{semester}`로 학기 단위로 합니다
+    - 응답을 받지 못해 다시 보낼 때는 `Idempotency-Key` 헤더에 처음과 같은 값을 넣으면 처음 응답(201)을 그대로 받습니다
+      (같은 키로 다른 과목을 보내면 422, 키는 24시간 보관)
     """
 
-    # 1. Student 레코드 조회
+    # 1. 같은 Idempotency-Key로 이미 등록했으면 처음 응답 반환 (Student/Course 조회 없음)
+    idempotent = IdempotentRequest(request, auth_info, course_request)
+    replayed = idempotent.replay(session)
+    if replayed is not None:
+        return replayed
+
+    # 2. Student 레코드 조회
     student = get_student_from_auth(auth_info, session)
 
-    # 2. 재수강인 경우 초수강이 존재하는지 확인
+    # 3. 카탈로그 확인 (이수체계도에 있는 과목은 과목명을 카탈로그 표기로 통일하고 학점 확인)
+    course_name = resolve_course_name(course_request.course_name, course_request.credits, course_request.is_major)
+
+    # 4. Course 레코드 생성 (INSERT 한 번)
+    # - 중복(같은 과목, 같은 재수강 여부)은 uq_student_course_retake 제약으로 확인
+    # - 재수강은 초수강이 있을 때만 행이 들어가도록 INSERT ... SELECT ... WHERE EXISTS
+    course = Course(
+        student_id=student.id,
+        semester=course_request.semester,
+        course_name=course_name,
+        credits=course_request.credits,
+        grade=course_request.grade,
+        is_major=course_request.is_major,
+        is_retake=course_request.is_retake
+    )
+    values = course.model_dump(exclude={"id"})
+    source = select(*(literal(value, Course.__table__.c[name].type).label(name) for name, value in values.items()))
     if course_request.is_retake:
-        initial_course_stmt = select(Course).where(
+        source = source.where(exists().where(
             Course.student_id == student.id,
-            Course.course_name == course_request.course_name,
+            Course.course_name == course_name,
             Course.is_retake == False
-        )
-        initial_course = session.exec(initial_course_stmt).first()
-        if not initial_course:
+        ))
+
+    def write(session: Session) -> CourseResponse:
+        course = session.scalars(insert(Course).from_select(list(values), source).returning(Course)).first()
+        if course is None:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"재수강 등록을 위해서는 '{course_request.course_name}' 과목의 초수강이 먼저 등록되어 있어야 합니다."
+                detail=f"재수강 등록을 위해서는 '{course_name}' 과목의 초수강이 먼저 등록되어 있어야 합니다."
             )
+        # 변경 기록, 재시도용 응답 저장
+        response = to_course_response(course)
+        record_course_changes(session, student.id, bump_student_revision(session, student), [(course.id, INSERT)])
+        idempotent.remember(session, status.HTTP_201_CREATED, response)
+        return response
 
-    # 3. 중복 과목 확인 (같은 과목, 같은 재수강 여부)
-    existing_course_stmt = select(Course).where(
-        Course.student_id == student.id,
-        Course.course_name == course_request.course_name,
-        Course.is_retake == course_request.is_retake
-    )
-    existing_course = session.exec(existing_course_stmt).first()
-    if existing_course:
+    # 5. 커밋 (WRITE_COORDINATOR를 켜면 다른 쓰기 요청과 한 트랜잭션으로)
+    try:
+        response = await WRITE_COORDINATOR.run(session, write)
+    except IntegrityError:
+        session.rollback()
+        # 같은 키의 재시도가 동시에 들어와 먼저 끝난 쪽이 있으면 그 응답
+        replayed = idempotent.replay(session)
+        if replayed is not None:
+            return replayed
         retake_status = "재수강" if course_request.is_retake else "초수강"
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"'{course_request.course_name}' 과목의 {retake_status}은 이미 등록되어 있습니다."
+            detail=f"'{course_name}' 과목의 {retake_status}은 이미 등록되어 있습니다."
         )
+    if not course_request.is_retake:
+        COURSE_NAME_INDEX.observe(course_name, student.id)
 
-    # 4. Course 레코드 생성
-    course = Course(
-        student_id=student.id,
-        semester=course_request.semester,
-        course_name=course_request.course_name,
-        credits=course_request.credits,
-        grade=course_request.grade,
-        is_major=course_request.is_major,
-        is_retake=course_request.is_retake
-    )
-
-    session.add(course)
-    session.commit()
-    session.refresh(course)
-
-    # 5. 응답 생성
-    return CourseResponse(
-        id=course.id,
-        student_id=course.student_id,
-        semester=course.semester,
-        course_name=course.course_name,
-        credits=course.credits,
-        grade=course.grade,
-        is_major=course.is_major,
-        is_retake=course.is_retake,
-        created_at=course.created_at.isoformat(),
-        updated_at=course.updated_at.isoformat()
-    )
+    # 6. 응답 생성
+    return response
 
 
 @app.get("/course/all",
@@ -409,33 +716,106 @@ async def create_course(
          )
 async def get_all_courses(
         auth_info: tuple[str, Union[User, GoogleUser, NaverUser, KakaoUser]] = Depends(authenticate_user_from_cookies),
-        session: Session = Depends(lambda: Session(engine))
+        session: Session = Depends(get_session)
 ) -> List[CourseResponse]:
     # 1. Student 레코드 조회
     student = get_student_from_auth(auth_info, session)
 
-    # 2. 해당 학기의 모든 과목 조회
-    courses_stmt = select(Course).where(
-        Course.student_id == student.id,
-    ).order_by(Course.course_name, Course.is_retake)  # 과목명 순, 초수강 먼저
+    # 2. 과목이 바뀌지 않았으면 (같은 revision) 저장해 둔 응답 그대로
+    cache_key = RESPONSE_CACHE.key("/course/all", student)
+    cached = RESPONSE_CACHE.get("/course/all", cache_key)
+    if cached is not None:
+        return cached.response()
+
+    # 3. 모든 과목 조회 + 응답 생성 (동시에 들어온 같은 요청은 한 번만 조회)
+    cached = await coalesce_read("/course/all", cache_key, build_course_list_response, student, cache_key)
+    return cached.response()
+
+
+@app.get("/courses/changes",
+         status_code=status.HTTP_200_OK,
+         response_model=CourseChangesResponse,
+         summary="과목 변경분 조회",
+         description="마지막으로 받은 revision 이후 등록/수정/삭제된 과목만 조회합니다.",
+         responses={
+             200: {"description": "조회 성공 (resync가 true면 과목 전체)"},
+             400: {"description": "학생 미등록"},
+             401: {"description": "인증 실패 (로그인 필요)"},
+         })
+async def get_course_changes(
+        since: int = Query(default=0, ge=0, description="마지막으로 받은 revision (처음이면 0)"),
+        auth_info: tuple[str, Union[User, GoogleUser, NaverUser, KakaoUser]] = Depends(authenticate_user_from_cookies),
+        session: Session = Depends(get_session)
+) -> CourseChangesResponse:
+    """
+    과목 목록을 매번 전부 받지 않고, 가지고 있는 목록을 변경분으로 갱신합니다.
+
+    ## 프론트엔드 지침
+    - 처음에는 `since=0`으로 호출하면 `resync: true`와 과목 전체가 옵니다
+    - 응답의 `revision`을 저장해 두고 다음에는 `since`로 보냅니다
+    - `resync`가 true면 가지고 있던 목록을 `upserted`로 교체하고, false면 `upserted`는 id로 덮어쓰고 `deleted`의 id는 지웁니다
+    - 변경 기록은 최근 일부만 보관하므로 오래전 revision을 보내면 `resync: true`로 전체가 옵니다
+    ```javascript
+    const res = await fetch(`/courses/changes?since=${revision}`);
+    const changes = await res.json();
+    if (changes.resync) courses.clear();
+    changes.deleted.forEach(id => courses.delete(id));
+    changes.upserted.forEach(course => courses.set(course.id, course));
+    revision = changes.revision;
+    ```
+    """
+
+    # 1. Student 레코드 조회
+    student = get_student_from_auth(auth_info, session)
 
-    courses = session.exec(courses_stmt).all()
+    # 2. 변경분 조회 (기록이 없거나 정리된 구간이면 전체)
+    changes = load_course_changes(session, student, since)
 
     # 3. 응답 생성
+    return CourseChangesResponse(
+        revision=changes.revision,
+        resync=changes.resync,
+        upserted=[to_course_response(course) for course in changes.courses],
+        deleted=changes.deleted,
+    )
+
+
+@app.get("/courses/autocomplete",
+         status_code=status.HTTP_200_OK,
+         response_model=List[CourseSuggestionResponse],
+         summary="과목명 자동완성",
+         description="입력 중인 과목명(초성, 입력 중인 음절 포함)으로 과목명을 추천합니다.",
+         responses={
+             200: {"description": "추천 과목명 목록 (없으면 빈 배열)"},
+         })
+async def autocomplete_courses(
+        q: str = Query(..., description="검색어 (예: '자료', '잘', 'ㅈㄹㄱㅈ', '구조')", min_length=1, max_length=50),
+        limit: int = Query(10, description="최대 개수", ge=1, le=50)
+) -> List[CourseSuggestionResponse]:
+    """
+    과목명을 자동완성합니다. DB를 조회하지 않고 메모리 인덱스만 사용합니다.
+
+    ## 검색 규칙
+    - 공백과 대소문자는 무시합니다
+    - 초성만 입력해도 찾습니다 (`ㅈㄹㄱㅈ` → 자료구조)
+    - 입력 중인 음절로도 찾습니다 (`잘`, `자ㄹ` → 자료구조)
+    - 과목명 중간 음절부터 입력해도 찾습니다 (`구조` → 자료구조)
+    - 전공 이수체계도 과목과 여러 학생이 이미 등록한 과목명이 대상입니다
+
+    ## 프론트엔드 지침
+    - 입력 이벤트마다 호출해도 되지만, 100ms 정도 debounce를 권장합니다
+    - 카탈로그 과목(`in_catalog: true`)은 학점도 함께 반환되므로 학점 입력란을 채우는 데 사용할 수 있습니다
+    """
     return [
-        CourseResponse(
-            id=course.id,
-            student_id=course.student_id,
-            semester=course.semester,
-            course_name=course.course_name,
-            credits=course.credits,
-            grade=course.grade,
-            is_major=course.is_major,
-            is_retake=course.is_retake,
-            created_at=course.created_at.isoformat(),
-            updated_at=course.updated_at.isoformat()
+        CourseSuggestionResponse(
+            course_name=suggestion.name,
+            in_catalog=suggestion.catalog_course is not None,
+            code=suggestion.catalog_course.code if suggestion.catalog_course else None,
+            credits=suggestion.catalog_course.credits if suggestion.catalog_course else None,
+            category=suggestion.catalog_course.category if suggestion.catalog_course else None,
+            is_major=suggestion.catalog_course.is_major if suggestion.catalog_course else None,
         )
-        for course in courses
+        for suggestion in COURSE_NAME_INDEX.search(q, limit)
     ]
 
 
@@ -452,7 +832,7 @@ async def get_all_courses(
 async def get_courses_by_semester(
         semester: str,
         auth_info: tuple[str, Union[User, GoogleUser, NaverUser, KakaoUser]] = Depends(authenticate_user_from_cookies),
-        session: Session = Depends(lambda: Session(engine))
+        session: Session = Depends(get_session)
 ) -> List[CourseResponse]:
     """
     현재 로그인된 학생의 특정 학기 과목 정보를 조회합니다.
@@ -462,35 +842,407 @@ async def get_courses_by_semester(
     - 학생 정보가 먼저 등록되어 있어야 합니다
     - semester 파라미터는 URL 경로에 포함 (예: /courses/semester/1-1)
     - 해당 학기에 등록된 모든 과목을 반환합니다 (초수강, 재수강 모두 포함)
+    - 응답의 `ETag`를 `PATCH /courses/semester/{semester}`의 `If-Match`로 보내면 그 사이 바뀐 과목이 있는지 확인합니다
     """
 
     # 1. Student 레코드 조회
     student = get_student_from_auth(auth_info, session)
 
-    # 2. 해당 학기의 모든 과목 조회
-    courses_stmt = select(Course).where(
-        Course.student_id == student.id,
-        Course.semester == semester
-    ).order_by(Course.course_name, Course.is_retake)  # 과목명 순, 초수강 먼저
+    # 2. 과목이 바뀌지 않았으면 (같은 revision) 저장해 둔 응답 그대로
+    cache_key = RESPONSE_CACHE.key("/courses/semester/{semester}", student, semester)
+    cached = RESPONSE_CACHE.get("/courses/semester/{semester}", cache_key)
+    if cached is not None:
+        return cached.response()
 
-    courses = session.exec(courses_stmt).all()
+    # 3. 해당 학기의 모든 과목 조회 + 응답 생성 (동시에 들어온 같은 요청은 한 번만 조회)
+    cached = await coalesce_read("/courses/semester/{semester}", cache_key, build_course_list_response,
+                                 student, cache_key, semester)
+    return cached.response()
 
-    # 3. 응답 생성
-    return [
-        CourseResponse(
-            id=course.id,
-            student_id=course.student_id,
-            semester=course.semester,
-            course_name=course.course_name,
-            credits=course.credits,
-            grade=course.grade,
-            is_major=course.is_major,
-            is_retake=course.is_retake,
-            created_at=course.created_at.isoformat(),
-            updated_at=course.updated_at.isoformat()
+
+@app.patch("/courses/semester/{semester}",
+           status_code=status.HTTP_200_OK,
+           response_model=SemesterSyncResponse,
+           summary="학기별 과목 한 번에 반영",
+           description="학기에 있어야 하는 과목 목록을 받아 기존 과목과의 차이(등록/수정/삭제)를 한 트랜잭션으로 반영합니다.",
+           responses={
+               200: {"description": "반영 성공 (바뀐 것이 없어도 200)"},
+               400: {"description": "잘못된 요청 (학생 미등록, 목록 안 중복, 다른 학기와 중복, 재수강 조건 위반 등)"},
+               401: {"description": "인증 실패 (로그인 필요)"},
+               409: {"description": "조회한 뒤 다른 곳에서 과목이 수정/삭제됨 (다시 조회 후 재시도)"},
+               412: {"description": "If-Match의 ETag가 현재 학기 과목과 다름"},
+           })
+async def sync_semester_courses(
+        semester: str,
+        sync_request: SemesterSyncRequest,
+        request: Request,
+        response: Response,
+        auth_info: tuple[str, Union[User, GoogleUser, NaverUser, KakaoUser]] = Depends(authenticate_user_from_cookies),
+        session: Session = Depends(get_session)
+) -> SemesterSyncResponse:
+    """
+    학기 과목 목록 전체를 보내면 바뀐 과목만 등록/수정/삭제합니다.
+
+    ## 반영 규칙
+    - `id`가 없는 과목은 새로 등록, `id`가 있는 과목은 값이 바뀐 경우에만 수정, 목록에 없는 기존 과목은 삭제합니다
+    - `id`가 있는 과목은 조회했을 때의 `updated_at`을 함께 보내야 하며, 그 사이 수정/삭제되었으면 `409`로 아무것도 반영하지 않습니다
+    - `If-Match` 헤더에 `GET /courses/semester/{semester}`의 `ETag`를 보내면, 그 사이 다른 곳에서 추가된 과목까지 확인합니다 (`412`)
+    - 과목 등록과 같은 규칙(카탈로그 과목명/학점, 초수강 1번 + 재수강 1번, 재수강은 초수강 필요)을 반영 후 상태로 확인합니다
+    - 모두 한 트랜잭션으로 반영되고, 바뀐 과목이 있으면 졸업요건 등 캐시가 한 번만 갱신됩니다
+
+    ## 프론트엔드 지침
+    ```javascript
+    const res = await fetch('/courses/semester/1-1');
+    const etag = res.headers.get('ETag');
+    const courses = await res.json();
+    courses[0].grade = 4.0;  // 성적 수정
+    courses.splice(1, 1);     // 과목 삭제
+    courses.push({course_name: '선형대수', credits: 3, grade: 3.5, is_major: true});  // 과목 추가
+    await fetch('/courses/semester/1-1', {
+        method: 'PATCH',
+        headers: {'Content-Type': 'application/json', 'If-Match': etag},
+        body: JSON.stringify({courses}),
+    });
+    ```
+    """
+
+    # 1. Student 레코드 조회
+    student = get_student_from_auth(auth_info, session)
+
+    # 2. 요청 정리 (카탈로그 과목명으로 통일, 목록 안 중복 확인)
+    desired = []
+    desired_keys = set()
+    for item in sync_request.courses:
+        course_name = resolve_course_name(item.course_name, item.credits, item.is_major)
+        key = (course_name, item.is_retake)
+        if key in desired_keys:
+            retake_status = "재수강" if item.is_retake else "초수강"
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"'{course_name}' 과목의 {retake_status}이 목록에 두 번 있습니다."
+            )
+        if item.id is not None and item.updated_at is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"'{course_name}' 과목의 updated_at이 없습니다."
+            )
+        desired_keys.add(key)
+        desired.append((item, course_name))
+
+    # 3. 현재 학기 과목과 비교
+    existing = get_student_courses(session, student, semester)
+    if_match = request.headers.get("if-match")
+    if if_match and not etag_matches(if_match, semester_etag(existing)):
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail="조회한 뒤 이 학기 과목이 바뀌었습니다. 다시 조회해 주세요."
         )
-        for course in courses
-    ]
+    existing_by_id = {course.id: course for course in existing}
+    inserts, updates, kept_ids = [], [], set()
+    for item, course_name in desired:
+        if item.id is None:
+            inserts.append((item, course_name))
+            continue
+        course = existing_by_id.get(item.id)
+        if course is None or as_utc(course.updated_at) != as_utc(item.updated_at):
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"'{course_name}' 과목이 조회한 뒤 수정 또는 삭제되었습니다. 다시 조회해 주세요."
+            )
+        kept_ids.add(course.id)
+        values = {field: value for field, value in (
+            ("course_name", course_name), ("credits", item.credits), ("grade", item.grade),
+            ("is_major", item.is_major), ("is_retake", item.is_retake),
+        ) if getattr(course, field) != value}
+        if values:
+            updates.append((course, values))
+    deletes = [course for course in existing if course.id not in kept_ids]
+
+    # 4. 다른 학기 과목까지 포함해서 중복/재수강 조건 확인 (반영 후 상태 기준)
+    other_keys = set(session.exec(
+        select(Course.course_name, Course.is_retake)
+        .where(Course.student_id == student.id, Course.semester != semester)).all())
+    for course_name, is_retake in desired_keys & other_keys:
+        retake_status = "재수강" if is_retake else "초수강"
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"'{course_name}' 과목의 {retake_status}은 다른 학기에 이미 등록되어 있습니다."
+        )
+    final_keys = desired_keys | other_keys
+    # 이번에 바뀌는 과목명만 확인 (다른 학기의 기존 데이터 때문에 실패하지 않도록)
+    touched = ({course_name for course_name, _ in desired_keys}
+               | {course.course_name for course in deletes} | {course.course_name for course, _ in updates})
+    for course_name in sorted(touched):
+        if (course_name, True) in final_keys and (course_name, False) not in final_keys:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"'{course_name}' 과목의 재수강이 있으려면 초수강이 등록되어 있어야 합니다."
+            )
+
+    # 5. 한 트랜잭션으로 반영 (조회한 updated_at이 그대로일 때만 수정/삭제)
+    if inserts or updates or deletes:
+        now = utc_now_factory()
+        # (과목명, 재수강여부)가 바뀌는 과목은 임시 과목명으로 옮긴 뒤 마지막에 최종 값으로 바꿈
+        # (두 과목의 재수강여부/과목명을 맞바꿀 때 순서대로 바꾸면 중간 상태가 unique 제약에 걸리므로)
+        moved = []
+        try:
+            if deletes:
+                result = session.execute(delete(Course).where(or_(*(
+                    and_(Course.id == course.id, Course.updated_at == course.updated_at) for course in deletes))))
+                if result.rowcount != len(deletes):
+                    raise CourseChanged()
+            for course, values in updates:
+                if "course_name" in values or "is_retake" in values:
+                    moved.append((course, values))
+                    values = {"course_name": f"#sync-{course.id}"}
+                result = session.execute(update(Course).where(
+                    Course.id == course.id, Course.updated_at == course.updated_at).values(**values, updated_at=now))
+                if result.rowcount != 1:
+                    raise CourseChanged()
+            for course, values in moved:
+                session.execute(update(Course).where(Course.id == course.id).values(
+                    **{"course_name": course.course_name, **values}))
+            added = [Course(
+                student_id=student.id,
+                semester=semester,
+                course_name=course_name,
+                credits=item.credits,
+                grade=item.grade,
+                is_major=item.is_major,
+                is_retake=item.is_retake,
+                created_at=now,
+                updated_at=now,
+            ) for item, course_name in inserts]
+            session.add_all(added)
+            session.flush()  # 변경 기록에 넣을 id
+            record_course_changes(session, student.id, bump_student_revision(session, student), [
+                *((course.id, DELETE) for course in deletes),
+                *((course.id, UPDATE) for course, _ in updates),
+                *((course.id, INSERT) for course in added),
+            ])
+            session.commit()
+        except CourseChanged:
+            session.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="반영하는 동안 다른 곳에서 과목이 바뀌었습니다. 다시 조회해 주세요."
+            )
+        except IntegrityError:
+            # 확인한 뒤 다른 요청이 같은 과목을 등록한 경우
+            session.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="같은 과목의 초수강 또는 재수강이 이미 등록되어 있습니다."
+            )
+        for item, course_name in inserts:
+            if not item.is_retake:
+                COURSE_NAME_INDEX.observe(course_name, student.id)
+
+    # 6. 응답 생성
+    courses = get_student_courses(session, student, semester)
+    response.headers["ETag"] = semester_etag(courses)
+    return SemesterSyncResponse(
+        semester=semester,
+        inserted=len(inserts),
+        updated=len(updates),
+        deleted=len(deletes),
+        unchanged=len(desired) - len(inserts) - len(updates),
+        courses=[to_course_response(course) for course in courses],
+    )
+
+
+@app.get("/graduation/status",
+         status_code=status.HTTP_200_OK,
+         response_model=GraduationStatusResponse,
+         summary="졸업요건 충족 현황",
+         description="현재 로그인된 학생의 입학년도에 맞는 졸업요건을 규칙별로 평가합니다.",
+         responses={
+             200: {"description": "평가 성공"},
+             400: {"description": "학생 미등록"},
+             401: {"description": "인증 실패 (로그인 필요)"},
+         })
+async def get_graduation_status(
+        auth_info: tuple[str, Union[User, GoogleUser, NaverUser, KakaoUser]] = Depends(authenticate_user_from_cookies),
+        session: Session = Depends(get_session)
+) -> GraduationStatusResponse:
+    """
+    현재 로그인된 학생의 졸업요건 충족 현황을 반환합니다.
+
+    ## 평가 기준
+    - 졸업요건은 학번 앞 4자리(입학년도)로 선택합니다 (`data/graduation/*.json`)
+    - 같은 과목을 재수강했으면 한 번만 인정합니다 (요건 파일의 `retake_policy`)
+    - F 등 `passing_grade` 미만 성적은 학점에 포함하지 않지만 평점에는 포함합니다
+
+    ## 프론트엔드 지침
+    - 로그인 상태에서만 호출 가능합니다
+    - `rules`의 `ratio`로 규칙별 진행률 바를 그리면 됩니다
+    - `provisional`이 `true`인 규칙은 기준값이 확인되지 않은 참고용입니다. "확인 전" 등으로 표시하고 졸업 불가처럼 보이지 않게 해 주세요
+    - 과목이 바뀌지 않았으면 서버에 캐시된 결과가 반환되므로 자주 호출해도 됩니다
+    """
+
+    # 1. Student 레코드 조회
+    student = get_student_from_auth(auth_info, session)
+
+    # 2. 평가 (revision이 같으면 캐시 사용, 과목 조회 없음)
+    report = evaluate_student(student, lambda: get_student_courses(session, student))
+
+    # 3. 응답 생성
+    return to_graduation_response(report)
+
+
+@app.get("/graduation/plan",
+         status_code=status.HTTP_200_OK,
+         response_model=GraduationPlanResponse,
+         summary="남은 학기 수강 계획",
+         description="채우지 못한 졸업요건을 이수체계도 과목으로 가장 빨리 채우는 학기별 계획을 만듭니다.",
+         responses={
+             200: {"description": "계획 생성 성공"},
+             400: {"description": "학생 미등록"},
+             401: {"description": "인증 실패 (로그인 필요)"},
+         })
+async def get_graduation_plan(
+        credit_cap: int = Query(default=PLANNER_CREDIT_CAP, ge=6, le=24, description="학기당 최대 학점"),
+        auth_info: tuple[str, Union[User, GoogleUser, NaverUser, KakaoUser]] = Depends(authenticate_user_from_cookies),
+        session: Session = Depends(get_session)
+) -> GraduationPlanResponse:
+    """
+    남은 졸업요건을 채우는 학기별 수강 계획을 반환합니다.
+
+    ## 계획 방식
+    - 이수하지 않은 필수 과목과 그 선수과목, 모자란 이수 구분/전공 학점을 채울 이수체계도 과목을 고릅니다
+    - 선수과목을 먼저 듣고 학기당 `credit_cap`학점을 넘지 않으면서 가장 빨리 끝나는 배치를 찾습니다
+    - 남는 졸업 학점은 학기마다 `filler_credits`(교양, 일반선택 등)로 표시합니다
+    - 탐색은 최대 `PLANNER_TIME_BUDGET_MS`(기본 200ms)까지 하고, 그때까지 찾은 가장 좋은 계획을 반환합니다 (`optimal`)
+
+    ## 프론트엔드 지침
+    - 과목이 바뀌지 않았으면 서버에 캐시된 계획이 반환됩니다
+    - 계획은 다음 학기부터 시작하며, 학기는 학번 기준(휴학 없음)으로 계산합니다
+    """
+
+    # 1. Student 레코드 조회
+    student = get_student_from_auth(auth_info, session)
+
+    # 2. 계획 (revision이 같으면 캐시 사용, 탐색은 이벤트 루프 밖에서, 과목은 스레드의 Session으로 조회)
+    plan = await asyncio.to_thread(plan_student, student, lambda: run_in_new_session(get_student_courses, student),
+                                   credit_cap)
+
+    # 3. 응답 생성
+    return GraduationPlanResponse(
+        requirement_id=plan.requirement_id,
+        credit_cap=plan.credit_cap,
+        semesters=[
+            PlannedSemesterResponse(
+                semester=semester.label,
+                courses=[
+                    PlannedCourseResponse(
+                        code=course.code,
+                        course_name=course.name,
+                        credits=course.credits,
+                        category=course.category,
+                        recommended_semester=course.recommended_semester,
+                    )
+                    for course in semester.courses
+                ],
+                filler_credits=semester.filler_credits,
+                credits=semester.credits,
+            )
+            for semester in plan.semesters
+        ],
+        unplanned_courses=list(plan.unplanned),
+        optimal=plan.optimal,
+        lower_bound=plan.lower_bound,
+    )
+
+
+@app.post("/gpa/projection",
+          status_code=status.HTTP_200_OK,
+          response_model=GpaProjectionResponse,
+          summary="평점 예측 (what-if)",
+          description="지금까지의 성적에 앞으로 들을 과목의 예상 성적을 더해 최종 평점의 범위와 분포를 계산합니다.",
+          responses={
+              200: {"description": "계산 성공"},
+              400: {"description": "잘못된 요청 (학생 미등록, 중복 과목, 이미 재수강한 과목, 학점 불일치 등)"},
+              401: {"description": "인증 실패 (로그인 필요)"},
+          })
+async def project_student_gpa(
+        projection_request: GpaProjectionRequest,
+        auth_info: tuple[str, Union[User, GoogleUser, NaverUser, KakaoUser]] = Depends(authenticate_user_from_cookies),
+        session: Session = Depends(get_session)
+) -> GpaProjectionResponse:
+    """
+    "다음 학기에 어떤 성적을 받아야 목표 평점에 도달하나?"를 계산합니다.
+
+    ## 계산 방식
+    - 과목마다 `distribution`(등급별 가중치) 또는 `min_grade`~`max_grade` 범위(범위 안의 등급을 같은 확률로)를 받습니다
+    - `min_gpa`/`max_gpa`는 모든 과목이 가장 낮은/높은 등급일 때의 정확한 값입니다
+    - 나머지 값은 `scenarios`번 뽑은 시뮬레이션 결과입니다
+    - 이미 들은 과목을 넣으면 재수강으로 보고, 졸업요건의 재수강 규칙(`retake_policy`)대로 기존 성적을 대체합니다
+    - `required_grade`는 모든 예정 과목에서 같은 등급을 받는다고 할 때 목표에 도달하는 최소 등급입니다
+
+    ## 프론트엔드 지침
+    ```javascript
+    const res = await fetch('/gpa/projection', {
+        method: 'POST',
+        headers: {'Content-Type': 'application/json'},
+        body: JSON.stringify({
+            courses: [
+                {course_name: '운영체제', min_grade: 3.0, max_grade: 4.5},
+                {course_name: '자료구조', distribution: [{grade: 4.0, weight: 1}, {grade: 4.5, weight: 1}]},
+            ],
+            target_gpa: 3.5,
+        }),
+    });
+    ```
+    """
+
+    # 1. Student 레코드 조회
+    student = get_student_from_auth(auth_info, session)
+
+    # 2. 예정 과목 정리 (이수체계도 과목은 학점을 카탈로그에서)
+    planned = []
+    try:
+        for course in projection_request.courses:
+            catalog_course = CATALOG.find(course.course_name)
+            credits = course.credits
+            if catalog_course:
+                if credits is not None and credits != catalog_course.credits:
+                    raise ValueError(f"'{catalog_course.name}' 과목은 {catalog_course.credits}학점입니다.")
+                credits = catalog_course.credits
+            elif credits is None:
+                raise ValueError(f"'{course.course_name}' 과목의 학점을 입력해야 합니다.")
+            course_name = catalog_course.name if catalog_course else course.course_name
+            if course.distribution:
+                planned.append(HypotheticalCourse(course_name, credits,
+                                                  tuple(item.grade for item in course.distribution),
+                                                  tuple(item.weight for item in course.distribution)))
+            else:
+                planned.append(HypotheticalCourse.from_range(course_name, credits, course.min_grade, course.max_grade))
+
+        # 3. 계산
+        projection = project_gpa(plan_for(student.student_id), get_student_courses(session, student), planned,
+                                 projection_request.scenarios, projection_request.target_gpa,
+                                 projection_request.seed)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    # 4. 응답 생성
+    return GpaProjectionResponse(
+        current_gpa=projection.current_gpa,
+        current_credits=projection.current_credits,
+        projected_credits=projection.projected_credits,
+        retakes=list(projection.retakes),
+        min_gpa=projection.min_gpa,
+        max_gpa=projection.max_gpa,
+        mean_gpa=projection.mean_gpa,
+        std_gpa=projection.std_gpa,
+        percentiles=[PercentileResponse(percentile=percentile, gpa=gpa) for percentile, gpa in projection.percentiles],
+        histogram=[HistogramBinResponse(lower=lower, upper=upper, probability=probability)
+                   for lower, upper, probability in projection.histogram],
+        scenarios=projection.scenarios,
+        target_gpa=projection.target_gpa,
+        target_probability=projection.target_probability,
+        required_grade=projection.required_grade,
+    )
 
 
 @app.get("/student/status",
@@ -503,7 +1255,7 @@ async def get_courses_by_semester(
          })
 async def get_student_status(
         auth_info: tuple[str, Union[User, GoogleUser, NaverUser, KakaoUser]] = Depends(authenticate_user_from_cookies),
-        session: Session = Depends(lambda: Session(engine))
+        session: Session = Depends(get_session)
 ):
     """
     현재 로그인된 사용자의 학생 정보 등록 상태를 확인합니다.
@@ -520,18 +1272,16 @@ async def get_student_status(
         auth_type, user = auth_info
         
         # OAuth 사용자 정보 추가 (프로필 이미지용)
-        auth_user_info = {}
-        if auth_type == "email":
-            auth_user_info = {"email": user.email}
-        elif auth_type == "google":
-            auth_user_info = {"email": user.email, "name": user.name, "picture": user.picture}
-        elif auth_type == "naver":
-            auth_user_info = {"email": user.email, "name": user.name, "picture": user.picture}
-        elif auth_type == "kakao":
-            auth_user_info = {"nickname": user.nickname, "picture": user.picture}
+        auth_user_info = auth_user_info_of(auth_type, user)
+
+        # 같은 revision, 같은 로그인 정보면 저장해 둔 응답 그대로
+        cache_key = RESPONSE_CACHE.key("/student/status", student, auth_type, sorted(auth_user_info.items()))
+        cached = RESPONSE_CACHE.get("/student/status", cache_key)
+        if cached is not None:
+            return cached.response()
         
         # 학생 정보가 있는 경우
-        return {
+        return RESPONSE_CACHE.set(cache_key, {
             "has_student_info": True,
             "auth_type": auth_type,
             "auth_user_info": auth_user_info,
@@ -546,21 +1296,12 @@ async def get_student_status(
                 "created_at": student.created_at.isoformat(),
                 "updated_at": student.updated_at.isoformat()
             }
-        }
+        }).response()
     except HTTPException as e:
         # 학생 정보가 없는 경우 (get_student_from_auth에서 400 에러)
         if e.status_code == status.HTTP_400_BAD_REQUEST and "학생 정보가 등록되지 않았습니다" in e.detail:
             auth_type, user = auth_info
-            user_info = {}
-            
-            if auth_type == "email":
-                user_info = {"email": user.email}
-            elif auth_type == "google":
-                user_info = {"email": user.email, "name": user.name, "picture": user.picture}
-            elif auth_type == "naver":
-                user_info = {"email": user.email, "name": user.name, "picture": user.picture}
-            elif auth_type == "kakao":
-                user_info = {"nickname": user.nickname, "picture": user.picture}
+            user_info = auth_user_info_of(auth_type, user)
             
             return {
                 "has_student_info": False,
@@ -572,6 +1313,121 @@ async def get_student_status(
             raise e
 
 
+async def load_bootstrap(
+        auth_info: tuple[str, Union[User, GoogleUser, NaverUser, KakaoUser]],
+        session: Session,
+        sections: List[str]
+) -> BootstrapResponse:
+    """로그인 정보 + 학생 정보 + 요청한 항목 (GET /me/bootstrap, 서버 렌더링 페이지의 초기 데이터)"""
+    # 1. Student 레코드 조회
+    auth_type, user = auth_info
+    student = find_student(auth_info, session)
+    result = BootstrapResponse(
+        has_student_info=student is not None,
+        auth_type=auth_type,
+        auth_user_info=auth_user_info_of(auth_type, user),
+        student=to_student_response(student) if student else None,
+    )
+    if "versions" in sections:
+        result.versions = VersionsResponse(
+            catalog_version=CATALOG.version,
+            catalog_etag=CATALOG.etag,
+            requirement_id=plan_for(student.student_id).id if student else None,
+            course_revision=student.revision if student else None,
+        )
+    if student is None:
+        return result
+
+    # 2. DB 조회가 필요한 항목은 각자 Session을 열어 동시에 실행 (졸업요건은 캐시에 있으면 조회 없음)
+    jobs = {}
+    if "courses" in sections:
+        jobs["courses"] = asyncio.to_thread(run_in_new_session, get_student_courses, student)
+    if "course_summary" in sections:
+        jobs["course_summary"] = asyncio.to_thread(run_in_new_session, get_course_summary, student)
+    if "graduation" in sections:
+        jobs["graduation"] = asyncio.to_thread(
+            run_in_new_session, lambda thread_session, student: evaluate_student(
+                student, lambda: get_student_courses(thread_session, student)), student)
+    loaded = dict(zip(jobs, await asyncio.gather(*jobs.values())))
+
+    # 3. 응답 생성
+    if "courses" in loaded:
+        result.courses = [to_course_response(course) for course in loaded["courses"]]
+    if "course_summary" in loaded:
+        result.course_summary = loaded["course_summary"]
+    if "graduation" in loaded:
+        result.graduation = to_graduation_response(loaded["graduation"])
+    return result
+
+
+async def render_student_page(path: str, sections: List[str], request: Request,
+                              session: Session) -> Optional[HTMLResponse]:
+    """
+    SSR_PAGES일 때 학생 이름과 초기 데이터(`window.__INITIAL_DATA__`)를 채운 페이지
+
+    로그인하지 않았거나 학생 정보가 없으면 None (정적 페이지의 스크립트가 이동을 처리)
+    """
+    try:
+        auth_info = authenticate_user_from_cookies(request, session, get_serializer())
+    except HTTPException:
+        return None
+    student = find_student(auth_info, session)
+    if student is None:
+        return None
+
+    # 과목이 바뀌면 revision이 바뀌므로 같은 키의 렌더링 결과를 그대로 사용
+    auth_type, user = auth_info
+    key = (path, student.id, student.revision, auth_type, tuple(sorted(auth_user_info_of(auth_type, user).items())))
+    body = cached_page(key)
+    if body is None:
+        data = await load_bootstrap(auth_info, session, sections)
+        body = render_page(path, key, student.name, data.model_dump_json())
+    return HTMLResponse(body, headers={"Cache-Control": "private, no-cache"})
+
+
+@app.get("/me/bootstrap",
+         status_code=status.HTTP_200_OK,
+         response_model=BootstrapResponse,
+         summary="페이지 초기 데이터",
+         description="로그인 정보, 학생 정보와 페이지에 필요한 데이터(과목, 과목 합계, 졸업요건, 버전)를 한 번에 조회합니다.",
+         responses={
+             200: {"description": "조회 성공 (학생 정보가 없으면 has_student_info: false)"},
+             400: {"description": "include에 알 수 없는 항목"},
+             401: {"description": "인증 실패 (로그인 필요)"},
+         })
+async def get_bootstrap(
+        include: str = Query(default="courses,course_summary,graduation,versions",
+                             description="함께 받을 항목 (쉼표 구분: courses, course_summary, graduation, versions)"),
+        auth_info: tuple[str, Union[User, GoogleUser, NaverUser, KakaoUser]] = Depends(authenticate_user_from_cookies),
+        session: Session = Depends(get_session)
+) -> BootstrapResponse:
+    """
+    `/student/status` 다음에 `/course/all`, `/graduation/status`를 차례로 부르던 페이지 초기화를 요청 한 번으로 줄입니다.
+
+    ## 프론트엔드 지침
+    - 로그인 상태에서만 호출 가능합니다
+    - `include`로 페이지에 필요한 항목만 요청합니다 (요청하지 않은 항목은 null)
+    - `has_student_info`가 false면 학생 정보 입력 페이지로 이동하면 됩니다 (`versions` 외의 항목은 null)
+    - `versions.catalog_etag`가 저장해 둔 값과 같으면 `/catalog`를 다시 받지 않아도 됩니다
+    ```javascript
+    const data = await (await fetch('/me/bootstrap?include=graduation')).json();
+    if (!data.has_student_info) location.href = '/fill-student-info';
+    ```
+    """
+
+    # 1. include 확인
+    sections = [section.strip() for section in include.split(",") if section.strip()]
+    unknown = sorted(set(sections) - set(BOOTSTRAP_SECTIONS))
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"알 수 없는 include 항목입니다: {', '.join(unknown)} (가능한 값: {', '.join(BOOTSTRAP_SECTIONS)})"
+        )
+
+    # 2. 조회 (인증은 의존성에서 한 번만)
+    return await load_bootstrap(auth_info, session, sections)
+
+
 @app.get("/logout",
          status_code=status.HTTP_204_NO_CONTENT,
          summary="로그아웃",
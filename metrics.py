@@ -0,0 +1,380 @@
+"""
+Prometheus 텍스트 포맷(0.0.4)으로 노출하는 경량 메트릭 모듈
+
+외부 의존성 없이 Counter / Gauge / Histogram만 구현했습니다.
+값 갱신은 dict 조회 + 덧셈 수준이라 운영 환경에서 항상 켜 두는 것을 전제로 합니다.
+"""
+# 외부 라이브러리
+from starlette.types import ASGIApp, Scope, Receive, Send, Message
+# 내부 라이브러리
+import bisect
+import threading
+import time
+from typing import Callable, Iterable, Optional
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# 기본 latency 버킷 (초)
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: tuple, values: tuple, extra: str = "") -> str:
+    pairs = [f'{n}="{_escape(str(v))}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict) -> tuple:
+        return tuple(labels.get(name, "") for name in self.labelnames)
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+        lines.extend(self._samples())
+        return lines
+
+    def _samples(self) -> list[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def _samples(self) -> list[str]:
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+                for key, value in sorted(self._values.items())]
+
+
+class Gauge(_Metric):
+    type_name = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = (),
+                 collect: Optional[Callable[[], dict]] = None):
+        """
+        :param collect: 스크레이프 시점에 {라벨값 튜플: 값}을 반환하는 함수.
+                        지정하면 set/inc로 관리하지 않고 이 함수의 결과를 그대로 노출합니다.
+        """
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple, float] = {}
+        self._collect = collect
+
+    def set(self, value: float, **labels) -> None:
+        self._values[self._key(labels)] = value
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels) -> None:
+        self.inc(-amount, **labels)
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def _samples(self) -> list[str]:
+        values = self._collect() if self._collect else self._values
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+                for key, value in sorted(values.items())]
+
+
+class Histogram(_Metric):
+    type_name = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = (),
+                 buckets: Iterable[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # 라벨값 튜플 -> [버킷별 개수..., +Inf 개수, 합계]
+        self._values: dict[tuple, list] = {}
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            state[index] += 1
+            state[-1] += value
+
+    def time(self, **labels) -> "Timer":
+        """`with`/`async with` 블록의 실행 시간을 기록 (예외가 나면 outcome=error)"""
+        return Timer(self, labels)
+
+    def count(self, **labels) -> int:
+        state = self._values.get(self._key(labels))
+        return sum(state[:-1]) if state else 0
+
+    def counts(self) -> dict[tuple, int]:
+        """라벨값 튜플별 관측 수 (labelnames 순서)"""
+        with self._lock:
+            return {key: sum(state[:-1]) for key, state in self._values.items()}
+
+    def _samples(self) -> list[str]:
+        lines = []
+        for key, state in sorted(self._values.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), state[:-1]):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {_format_value(state[-1])}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {cumulative}")
+        return lines
+
+
+class Timer:
+    """Histogram.time()이 반환하는 컨텍스트 매니저 (동기/비동기 겸용)"""
+
+    def __init__(self, histogram: Histogram, labels: dict):
+        self.histogram = histogram
+        self.labels = labels
+        self.started = 0.0
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        labels = self.labels
+        if "outcome" in self.histogram.labelnames:
+            labels = {**labels, "outcome": "error" if exc_type else "success"}
+        self.histogram.observe(time.perf_counter() - self.started, **labels)
+        return False
+
+    async def __aenter__(self):
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return self.__exit__(exc_type, exc, tb)
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"이미 등록된 메트릭입니다: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Iterable[str] = (),
+              collect: Optional[Callable[[], dict]] = None) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames, collect))
+
+    def histogram(self, name: str, documentation: str, labelnames: Iterable[str] = (),
+                  buckets: Iterable[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+HTTP_REQUESTS_TOTAL = REGISTRY.counter(
+    "graduon_http_requests_total", "처리한 HTTP 요청 수", ("method", "route", "status"))
+HTTP_REQUEST_SECONDS = REGISTRY.histogram(
+    "graduon_http_request_duration_seconds", "HTTP 요청 처리 시간 (route template 기준)", ("method", "route", "status"))
+HTTP_IN_FLIGHT = REGISTRY.gauge(
+    "graduon_http_requests_in_flight", "현재 처리 중인 HTTP 요청 수")
+SMTP_SEND_SECONDS = REGISTRY.histogram(
+    "graduon_smtp_send_duration_seconds", "SMTP 이메일 송신 시간", ("kind", "outcome"),
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 16.0, 32.0))
+OAUTH_REQUEST_SECONDS = REGISTRY.histogram(
+    "graduon_oauth_request_duration_seconds", "OAuth provider 호출 시간", ("provider", "operation", "outcome"),
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0))
+
+# DB 커넥션 풀 (스크레이프 시점에 풀 상태를 직접 읽음)
+_pools: dict[str, object] = {}
+
+
+def register_pool(name: str, engine) -> None:
+    """커넥션 풀 상태를 /metrics에 노출할 엔진 등록"""
+    _pools[name] = engine
+
+
+def _collect_pool(attribute: str) -> Callable[[], dict]:
+    def collect() -> dict:
+        values = {}
+        for name, engine in _pools.items():
+            reader = getattr(engine.pool, attribute, None)
+            if reader is not None:
+                values[(name,)] = reader()
+        return values
+    return collect
+
+
+DB_POOL_CHECKED_OUT = REGISTRY.gauge(
+    "graduon_db_pool_checked_out", "사용 중인 DB 커넥션 수", ("engine",), collect=_collect_pool("checkedout"))
+DB_POOL_OVERFLOW = REGISTRY.gauge(
+    "graduon_db_pool_overflow", "pool_size를 넘어 생성된 overflow 커넥션 수", ("engine",),
+    # QueuePool.overflow()는 풀이 다 차기 전까지 음수이므로 0 미만은 0으로 노출
+    collect=lambda: {key: max(0, value) for key, value in _collect_pool("overflow")().items()})
+DB_POOL_SIZE = REGISTRY.gauge(
+    "graduon_db_pool_size", "DB 커넥션 풀 크기", ("engine",), collect=_collect_pool("size"))
+
+# 응답 캐시 (response_cache.py)
+_response_caches: dict[str, object] = {}
+
+
+def register_response_cache(name: str, cache) -> None:
+    """항목 수/바이트를 /metrics에 노출할 응답 캐시 등록"""
+    _response_caches[name] = cache
+
+
+RESPONSE_CACHE_REQUESTS = REGISTRY.counter(
+    "graduon_response_cache_requests_total", "응답 캐시 조회 수 (result=hit/miss)", ("route", "result"))
+RESPONSE_CACHE_ENTRIES = REGISTRY.gauge(
+    "graduon_response_cache_entries", "응답 캐시 항목 수", ("cache",),
+    collect=lambda: {(name,): len(cache) for name, cache in _response_caches.items()})
+RESPONSE_CACHE_BYTES = REGISTRY.gauge(
+    "graduon_response_cache_bytes", "응답 캐시가 사용하는 바이트 (대략)", ("cache",),
+    collect=lambda: {(name,): cache.bytes for name, cache in _response_caches.items()})
+
+SINGLEFLIGHT_REQUESTS = REGISTRY.counter(
+    "graduon_singleflight_requests_total", "응답 캐시에 없어 계산한 요청 수 (role=leader: 직접 계산, follower: 진행 중인 계산 결과 공유)",
+    ("route", "role"))
+
+# 쓰기 배치 (write_coordinator.py)
+WRITE_BATCH_SIZE = REGISTRY.histogram(
+    "graduon_write_batch_size", "한 트랜잭션으로 커밋한 쓰기 작업 수",
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128, 256))
+WRITE_BATCH_SECONDS = REGISTRY.histogram(
+    "graduon_write_batch_duration_seconds", "쓰기 배치 실행부터 커밋까지 걸린 시간", ("outcome",),
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5))
+
+# 요청 수 제한 (admission.py)
+_admission_budgets: dict[str, object] = {}
+
+
+def register_admission_budgets(budgets: dict) -> None:
+    """등급별 처리 중/대기 중 요청 수를 /metrics에 노출할 Budget 등록"""
+    _admission_budgets.update(budgets)
+
+
+ADMISSION_ACTIVE = REGISTRY.gauge(
+    "graduon_admission_active", "등급별 처리 중인 요청 수", ("route_class",),
+    collect=lambda: {(name,): budget.active for name, budget in _admission_budgets.items()})
+ADMISSION_QUEUE_DEPTH = REGISTRY.gauge(
+    "graduon_admission_queue_depth", "등급별 처리 자리를 기다리는 요청 수", ("route_class",),
+    collect=lambda: {(name,): budget.queued for name, budget in _admission_budgets.items()})
+ADMISSION_SHED = REGISTRY.counter(
+    "graduon_admission_shed_total", "한도를 넘어 503으로 거절한 요청 수 (reason=queue_full/timeout)",
+    ("route_class", "reason"))
+
+# 외부 서비스 호출 (resilience.py)
+_dependencies: list = []
+_CIRCUIT_STATE_VALUES = {"closed": 0, "half_open": 1, "open": 2}
+
+
+def register_dependencies(*dependencies) -> None:
+    """차단기 상태를 /metrics에 노출할 외부 서비스 등록"""
+    _dependencies.extend(dependencies)
+
+
+CIRCUIT_STATE = REGISTRY.gauge(
+    "graduon_circuit_state", "외부 서비스 차단기 상태 (0: 정상, 1: 시험 중, 2: 차단)", ("dependency",),
+    collect=lambda: {(dependency.name,): _CIRCUIT_STATE_VALUES[dependency.breaker.state] for dependency in _dependencies})
+OUTBOUND_RETRIES = REGISTRY.counter(
+    "graduon_outbound_retries_total", "일시적인 오류로 다시 시도한 외부 호출 수", ("dependency", "operation"))
+CIRCUIT_REJECTED = REGISTRY.counter(
+    "graduon_circuit_rejected_total", "차단 중이라 보내지 않고 바로 실패시킨 외부 호출 수", ("dependency",))
+
+# 이벤트 루프 지연 (loop_monitor.py)
+LOOP_LAG_SECONDS = REGISTRY.histogram(
+    "graduon_event_loop_lag_seconds", "이벤트 루프가 예정보다 늦게 실행한 시간 (주기적으로 측정)",
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0))
+LOOP_BLOCKS = REGISTRY.counter(
+    "graduon_event_loop_blocks_total", "이벤트 루프를 한도 이상 멈춘 횟수 (call_site: 멈춘 시점에 실행 중이던 코드 위치)",
+    ("route", "call_site"))
+LOOP_BLOCKED_SECONDS = REGISTRY.counter(
+    "graduon_event_loop_blocked_seconds_total", "이벤트 루프를 한도 이상 멈춘 시간 합계", ("route", "call_site"))
+
+
+def route_template(scope: Scope) -> str:
+    """
+    매칭된 라우트의 경로 템플릿 반환 (예: /courses/semester/{semester})
+
+    실제 경로를 라벨로 쓰면 라벨 수가 무한히 늘어나므로, 매칭되지 않은 요청은 하나로 묶습니다.
+    """
+    route = scope.get("route")
+    path = getattr(route, "path", None)
+    if path is not None:
+        return path
+    # Mount(StaticFiles 등)는 route를 남기지 않으므로 root_path에 붙은 mount 경로로 판단
+    mount_path = scope.get("root_path", "")[len(scope.get("app_root_path", "")):]
+    if mount_path:
+        return mount_path + "/{path}"
+    return "<unmatched>"
+
+
+class MetricsMiddleware:
+    """요청 수, 처리 중인 요청 수, route template별 latency를 기록하는 ASGI 미들웨어"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        started = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        HTTP_IN_FLIGHT.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_IN_FLIGHT.dec()
+            labels = {"method": scope["method"], "route": route_template(scope), "status": status_code}
+            HTTP_REQUEST_SECONDS.observe(time.perf_counter() - started, **labels)
+            HTTP_REQUESTS_TOTAL.inc(**labels)
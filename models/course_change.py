@@ -0,0 +1,20 @@
+from sqlmodel import SQLModel, Field
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import Index
+from models.course import utc_now_factory
+
+
+class CourseChange(SQLModel, table=True):
+    __table_args__ = (
+        # 학생별로 revision 이후의 변경을 찾음
+        Index('ix_coursechange_student_revision', 'student_id', 'revision'),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    student_id: int = Field(foreign_key="student.id", nullable=False)
+    revision: int = Field(nullable=False)  # 이 변경으로 올라간 Student.revision
+    course_id: int = Field(nullable=False)  # 삭제된 과목도 기록하므로 외래 키 없음
+    operation: str = Field(nullable=False)  # insert / update / delete
+
+    created_at: datetime = Field(default_factory=utc_now_factory)
@@ -0,0 +1,21 @@
+from sqlmodel import SQLModel, Field
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import UniqueConstraint
+from models.course import utc_now_factory
+
+
+class IdempotencyRecord(SQLModel, table=True):
+    __table_args__ = (
+        # 사용자마다 같은 Idempotency-Key는 한 번만 기록
+        UniqueConstraint('scope', 'key', name='uq_idempotency_scope_key'),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    scope: str = Field(nullable=False)  # 로그인 방식:사용자 (예: "google:12")
+    key: str = Field(nullable=False)  # Idempotency-Key 헤더 값
+    fingerprint: str = Field(nullable=False)  # 경로 + 요청 본문 해시 (같은 키로 다른 요청을 보내면 거부)
+    status_code: int = Field(nullable=False)
+    response_body: bytes = Field(nullable=False)  # 처음 응답 JSON
+
+    created_at: datetime = Field(default_factory=utc_now_factory)
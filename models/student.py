@@ -2,6 +2,7 @@ from sqlmodel import SQLModel, Field
 from datetime import datetime, timezone
 from typing import Optional
 from pydantic import model_validator
+from sqlalchemy import Index
 
 
 def utc_now_factory(tz=timezone.utc):
@@ -9,6 +10,14 @@ def utc_now_factory(tz=timezone.utc):
 
 
 class Student(SQLModel, table=True):
+    __table_args__ = (
+        # 사용자 한 명당 학생 정보 하나 (NULL은 여러 개 가능)
+        Index('uq_student_user_email', 'user_email', unique=True),
+        Index('uq_student_google_user_id', 'google_user_id', unique=True),
+        Index('uq_student_naver_user_id', 'naver_user_id', unique=True),
+        Index('uq_student_kakao_user_id', 'kakao_user_id', unique=True),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     student_id: str = Field(index=True, unique=True, nullable=False)  # 학번
     name: str = Field(nullable=False)  # 이름
@@ -18,6 +27,9 @@ class Student(SQLModel, table=True):
     google_user_id: Optional[int] = Field(default=None, foreign_key="googleuser.id")
     naver_user_id: Optional[int] = Field(default=None, foreign_key="naveruser.id")
     kakao_user_id: Optional[int] = Field(default=None, foreign_key="kakaouser.id")
+
+    # 과목이 추가/수정될 때마다 1씩 증가 (졸업요건 평가 등 학생 단위 캐시의 키)
+    revision: int = Field(default=0, nullable=False)
     
     created_at: datetime = Field(default_factory=utc_now_factory)
     updated_at: datetime = Field(default_factory=utc_now_factory)
@@ -11,33 +11,53 @@ from models.naver_user import NaverUser
 from schemas.naver import NaverLoginSuccessResponse, NaverLoginErrorResponse
 from env import DATABASE_URL, NAVER_CLIENT_ID, NAVER_CLIENT_SECRET, NAVER_REDIRECT_URI
 from auth_utils import get_serializer, cookie_generate, get_engine
+from database import upsert_insert
+from metrics import OAUTH_REQUEST_SECONDS
+from resilience import NAVER
+from tracing import traced
 
 
 router = APIRouter(tags=["Naver OAuth2"], prefix="/auth/naver")
 
 
+@traced()
 def get_naver_user_by_naver_id(session: Session, naver_id: str) -> Optional[NaverUser]:
     """네이버 ID로 사용자 조회"""
     return session.exec(select(NaverUser).where(NaverUser.naver_id == naver_id)).first()
 
 
+@traced()
 def get_naver_user_by_email(session: Session, email: str) -> Optional[NaverUser]:
     """이메일로 네이버 사용자 조회"""
     return session.exec(select(NaverUser).where(NaverUser.email == email)).first()
 
 
+@traced()
 def create_naver_user(session: Session, naver_id: str, email: str, name: str, picture: str = None) -> NaverUser:
-    """새 네이버 사용자 생성"""
+    """
+    네이버 사용자 생성 (이미 있으면 기존 사용자 반환)
+
+    먼저 조회해서 이미 있는 사용자면 그대로 반환합니다 (SQLite 쓰기 잠금을 잡지 않도록, 처음 로그인할 때만 쓰기).
+    없을 때만 INSERT ... ON CONFLICT(naver_id) DO NOTHING ... RETURNING으로 생성하므로 같은 사용자의 첫 로그인이 동시에 들어와도 하나만 생성됩니다.
+    """
+    user = get_naver_user_by_naver_id(session, naver_id)
+    if user is not None:
+        return user
     user = NaverUser(
         naver_id=naver_id,
         email=email,
         name=name,
         picture=picture
     )
-    session.add(user)
+    statement = upsert_insert(session, NaverUser).values(**user.model_dump(exclude={"id"}))
+    statement = statement.on_conflict_do_nothing(index_elements=[NaverUser.naver_id])
+    created = session.scalars(statement.returning(NaverUser)).one_or_none()
+    if created is None:
+        # 조회한 뒤 동시에 들어온 첫 로그인이 먼저 생성함: 바뀐 것이 없으므로 트랜잭션을 끝내고 조회
+        session.rollback()
+        return get_naver_user_by_naver_id(session, naver_id)
     session.commit()
-    session.refresh(user)
-    return user
+    return created
 
 
 async def get_access_token(authorization_code: str, state: str) -> dict:
@@ -52,10 +72,15 @@ async def get_access_token(authorization_code: str, state: str) -> dict:
         "state": state
     }
     
-    async with httpx.AsyncClient() as client:
-        response = await client.post(token_url, data=data)
-        response.raise_for_status()
-        return response.json()
+    async def request() -> dict:
+        async with OAUTH_REQUEST_SECONDS.time(provider="naver", operation="token"):
+            async with httpx.AsyncClient(timeout=NAVER.timeout) as client:
+                response = await client.post(token_url, data=data)
+                response.raise_for_status()
+                return response.json()
+
+    # authorization code는 한 번만 쓸 수 있으므로 연결 실패만 재시도
+    return await NAVER.call("token", request)
 
 
 async def get_user_info(access_token: str) -> dict:
@@ -66,10 +91,14 @@ async def get_user_info(access_token: str) -> dict:
         "Authorization": f"Bearer {access_token}"
     }
     
-    async with httpx.AsyncClient() as client:
-        response = await client.get(user_info_url, headers=headers)
-        response.raise_for_status()
-        return response.json()
+    async def request() -> dict:
+        async with OAUTH_REQUEST_SECONDS.time(provider="naver", operation="user_info"):
+            async with httpx.AsyncClient(timeout=NAVER.timeout) as client:
+                response = await client.get(user_info_url, headers=headers)
+                response.raise_for_status()
+                return response.json()
+
+    return await NAVER.call("user_info", request, idempotent=True)
 
 
 @router.get("/login",
@@ -223,15 +252,12 @@ async def naver_callback(request: Request, response: Response, code: str = None,
         # 데이터베이스에서 사용자 확인 또는 생성
         engine = get_engine()
         with Session(engine) as session:
-            user = get_naver_user_by_naver_id(session, naver_id)
-            
-            if not user:
-                # 새 사용자 생성 (자동 회원가입)
-                user = create_naver_user(session, naver_id, email, name, picture)
+            # 사용자 조회 또는 생성 (자동 회원가입, 처음 로그인할 때만 쓰기)
+            create_naver_user(session, naver_id, email, name, picture)
             
             # auth-naver 쿠키 생성
             serializer = get_serializer()
-            cookie_value = cookie_generate(str(user.naver_id), serializer)
+            cookie_value = cookie_generate(str(naver_id), serializer)
             
             # 대시보드로 리다이렉트하면서 쿠키 설정
             redirect_response = RedirectResponse(url="/dashboard", status_code=302)
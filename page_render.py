@@ -0,0 +1,115 @@
+"""
+페이지 서버 렌더링 (SSR_PAGES = True일 때)
+
+정적 HTML 페이지는 로드된 뒤 `/me/bootstrap`을 호출하고, "OOO님" 텍스트를 찾아 이름으로 바꿉니다.
+서버 렌더링 모드에서는 같은 HTML 파일을 템플릿으로 사용해서 한 번의 응답에
+
+- "OOO님"을 학생 이름으로 바꾼 본문 (<script>, <style> 안은 그대로)
+- `</head>` 앞에 `window.__INITIAL_DATA__` (`/me/bootstrap` 응답과 같은 JSON)
+
+를 담아 보냅니다. 페이지 스크립트는 `window.__INITIAL_DATA__`가 있으면 API를 호출하지 않습니다.
+
+- 템플릿: 파일을 처음 사용할 때 한 번 읽어 (문자열 조각, 자리 이름) 목록으로 컴파일하고 메모리에 보관
+- 렌더링 결과: (페이지, 학생, Student.revision, 로그인 정보)로 캐시 (과목이 바뀌면 revision이 바뀌므로 무효화가 따로 필요 없음)
+"""
+# 내부 라이브러리
+import html
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+# 직접 작성한 모듈
+from settings import SSR_CACHE_SIZE
+
+NAME_PLACEHOLDER = "OOO님"
+NAME_SLOT, DATA_SLOT = "name", "data"
+_RAW_BLOCK = re.compile(r"<(script|style)\b.*?</\1\s*>", re.IGNORECASE | re.DOTALL)
+
+
+class PageTemplate:
+    """HTML 파일을 미리 쪼개 둔 템플릿 (literals[0] + slot[0] + literals[1] + ... )"""
+
+    def __init__(self, path: str):
+        self.path = path
+        source = Path(path).read_text(encoding="utf-8")
+        head_end = source.lower().index("</head>")
+
+        tokens: list[tuple[bool, str]] = []  # (자리인지, 문자열 또는 자리 이름)
+
+        def add_text(text: str) -> None:
+            # <script>, <style> 밖의 텍스트에서만 이름 자리를 찾음
+            position = 0
+            for block in _RAW_BLOCK.finditer(text):
+                add_markup(text[position:block.start()])
+                tokens.append((False, block.group(0)))
+                position = block.end()
+            add_markup(text[position:])
+
+        def add_markup(text: str) -> None:
+            for index, part in enumerate(text.split(NAME_PLACEHOLDER)):
+                if index:
+                    tokens.append((True, NAME_SLOT))
+                tokens.append((False, part))
+
+        add_text(source[:head_end])
+        tokens.append((True, DATA_SLOT))
+        add_text(source[head_end:])
+
+        self.literals: list[str] = [""]
+        self.slots: list[str] = []
+        for is_slot, value in tokens:
+            if is_slot:
+                self.slots.append(value)
+                self.literals.append("")
+            else:
+                self.literals[-1] += value
+
+    def render(self, values: dict[str, str]) -> bytes:
+        parts = [self.literals[0]]
+        for slot, literal in zip(self.slots, self.literals[1:]):
+            parts.append(values[slot])
+            parts.append(literal)
+        return "".join(parts).encode("utf-8")
+
+
+def initial_data_script(data_json: str) -> str:
+    """JSON을 <script> 안에 넣어도 안전하도록 ("</script>", "<!--" 방지)"""
+    escaped = data_json.replace("<", "\\u003c").replace("\u2028", "\\u2028").replace("\u2029", "\\u2029")
+    return f"<script>window.__INITIAL_DATA__ = {escaped};</script>\n"
+
+
+_templates: dict[str, PageTemplate] = {}
+_templates_lock = threading.Lock()
+# (페이지, Student.id, Student.revision, 로그인 정보) -> 렌더링된 HTML
+_render_cache: "OrderedDict[tuple, bytes]" = OrderedDict()
+_render_cache_lock = threading.Lock()
+
+
+def get_template(path: str) -> PageTemplate:
+    with _templates_lock:
+        template = _templates.get(path)
+        if template is None:
+            template = _templates[path] = PageTemplate(path)
+        return template
+
+
+def cached_page(key: tuple) -> Optional[bytes]:
+    with _render_cache_lock:
+        body = _render_cache.get(key)
+        if body is not None:
+            _render_cache.move_to_end(key)
+        return body
+
+
+def render_page(path: str, key: tuple, student_name: str, data_json: str) -> bytes:
+    """템플릿에 이름과 초기 데이터를 채우고 캐시에 저장"""
+    body = get_template(path).render({
+        NAME_SLOT: f"{html.escape(student_name)}님",
+        DATA_SLOT: initial_data_script(data_json),
+    })
+    with _render_cache_lock:
+        _render_cache[key] = body
+        while len(_render_cache) > SSR_CACHE_SIZE:
+            _render_cache.popitem(last=False)
+    return body
@@ -0,0 +1,149 @@
+"""
+요청 단위 SQL 모니터링
+
+SQLAlchemy 이벤트로 모든 SQL의 실행 시간을 재고, 현재 요청(ContextVar)에 쿼리 수와 DB 시간을 누적합니다.
+
+- 요청이 QUERY_BUDGET보다 많은 쿼리를 실행하면 경고
+- 같은 SQL이 한 요청 안에서 N_PLUS_ONE_THRESHOLD번 이상 반복되면 N+1 의심 경고
+- SLOW_QUERY_MS보다 느린 SQL은 SLOW_QUERY_SAMPLE_RATE 비율로 JSON 한 줄 로그를 남김 (파라미터 값은 기록하지 않음)
+- DEBUG 모드에서는 응답 헤더에 X-DB-Query-Count, X-DB-Time-Ms를 붙임
+"""
+# 외부 라이브러리
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Scope, Receive, Send, Message
+# 내부 라이브러리
+import json
+import logging
+import random
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Optional
+# 직접 작성한 모듈
+from metrics import route_template
+from settings import DEBUG, QUERY_BUDGET, N_PLUS_ONE_THRESHOLD, SLOW_QUERY_MS, SLOW_QUERY_SAMPLE_RATE
+
+logger = logging.getLogger("graduon.sql")
+
+
+class RequestQueryStats:
+    __slots__ = ("count", "seconds", "statements")
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.statements: Counter = Counter()
+
+
+_current: ContextVar[Optional[RequestQueryStats]] = ContextVar("graduon_query_stats", default=None)
+
+
+def current_stats() -> Optional[RequestQueryStats]:
+    return _current.get()
+
+
+def redact_parameters(parameters) -> object:
+    """파라미터 값은 버리고 타입만 남김 (이메일, 비밀번호 해시 등이 로그에 남지 않도록)"""
+    if isinstance(parameters, dict):
+        return {key: type(value).__name__ for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        if parameters and isinstance(parameters[0], (list, tuple, dict)):
+            # executemany
+            return {"rows": len(parameters), "row": redact_parameters(parameters[0])}
+        return [type(value).__name__ for value in parameters]
+    return type(parameters).__name__
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("graduon_query_started", []).append(time.perf_counter())
+
+
+def _record(statement: str, elapsed: float) -> None:
+    stats = _current.get()
+    if stats is not None:
+        stats.count += 1
+        stats.seconds += elapsed
+        stats.statements[statement] += 1
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["graduon_query_started"].pop()
+    _record(statement, elapsed)
+
+    if elapsed * 1000 >= SLOW_QUERY_MS and random.random() < SLOW_QUERY_SAMPLE_RATE:
+        logger.warning(json.dumps({
+            "event": "slow_query",
+            "duration_ms": round(elapsed * 1000, 3),
+            "statement": " ".join(statement.split()),
+            "parameters": redact_parameters(parameters),
+            "executemany": executemany,
+        }, ensure_ascii=False))
+
+
+def _handle_error(exception_context) -> None:
+    """실패한 SQL (IntegrityError 등)도 시작 시각을 꺼내고 요청의 쿼리 수/DB 시간에 포함"""
+    connection = exception_context.connection
+    if connection is None or not connection.info.get("graduon_query_started"):
+        return
+    elapsed = time.perf_counter() - connection.info["graduon_query_started"].pop()
+    if exception_context.statement is not None:
+        _record(exception_context.statement, elapsed)
+
+
+def install(engine: Engine) -> None:
+    """엔진에 쿼리 측정 이벤트 등록"""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+class QueryStatsMiddleware:
+    """요청별 쿼리 수/DB 시간을 모으고, 예산 초과와 N+1 의심 패턴을 경고하는 ASGI 미들웨어"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestQueryStats()
+        token = _current.set(stats)
+
+        async def send_wrapper(message: Message) -> None:
+            if DEBUG and message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"x-db-query-count", str(stats.count).encode()))
+                headers.append((b"x-db-time-ms", f"{stats.seconds * 1000:.3f}".encode()))
+                message["headers"] = headers
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current.reset(token)
+            self._report(scope, stats)
+
+    @staticmethod
+    def _report(scope: Scope, stats: RequestQueryStats) -> None:
+        if not stats.count:
+            return
+        route = f'{scope["method"]} {route_template(scope)}'
+        if stats.count > QUERY_BUDGET:
+            logger.warning(json.dumps({
+                "event": "query_budget_exceeded",
+                "route": route,
+                "queries": stats.count,
+                "budget": QUERY_BUDGET,
+                "db_time_ms": round(stats.seconds * 1000, 3),
+            }, ensure_ascii=False))
+        repeated = [(statement, n) for statement, n in stats.statements.items() if n >= N_PLUS_ONE_THRESHOLD]
+        for statement, n in repeated:
+            logger.warning(json.dumps({
+                "event": "n_plus_one_suspected",
+                "route": route,
+                "repeats": n,
+                "statement": " ".join(statement.split()),
+            }, ensure_ascii=False))
@@ -0,0 +1,170 @@
+"""
+외부 서비스 호출 보호 (타임아웃, 재시도, 차단기)
+
+OAuth provider(Google, 네이버, 카카오)와 SMTP 호출에는 제한 시간이 없어서, provider가 느려지면
+콜백 요청이 워커와 DB 세션을 잡은 채로 쌓입니다. 외부 서비스마다 `Dependency`를 두고 호출을 감쌉니다.
+
+- 타임아웃: 시도 한 번의 제한 시간 (넘으면 취소)
+- 재시도: 일시적인 오류(연결 실패, 타임아웃, 5xx, 429)에 한해 지터를 준 지수 백오프로 최대 OUTBOUND_MAX_RETRIES번
+  - 멱등하지 않은 호출(토큰 교환, 메일 송신)은 요청이 전달되지 않은 것이 확실한 연결 실패만 재시도
+- 차단기: 연속 CIRCUIT_FAILURE_THRESHOLD번 실패하면 CIRCUIT_RESET_SECONDS 동안 호출하지 않고 바로 503
+  - 시간이 지나면 한 요청만 시험 삼아 보내고(half-open), 성공하면 다시 정상, 실패하면 다시 차단
+  - 4xx(잘못된 code 등)는 서비스가 응답한 것이므로 실패로 세지 않음
+- 재시도/차단 후에도 실패하면 `DependencyUnavailable`(503 + Retry-After, HTTPException)로 바꿔서 올림
+- 상태는 /metrics의 graduon_circuit_state, graduon_outbound_retries_total, graduon_circuit_rejected_total로 확인
+
+호출할 함수는 인자 없는 코루틴 함수이므로, 지연을 넣은 로컬 대역(stand-in)으로 바꿔서 동작을 확인할 수 있습니다.
+"""
+# 외부 라이브러리
+import httpx
+from fastapi import HTTPException, status
+from fastapi_mail.errors import ConnectionErrors
+from google.auth.exceptions import TransportError as GoogleTransportError
+# 내부 라이브러리
+import asyncio
+import logging
+import math
+import random
+import time
+from typing import Awaitable, Callable, TypeVar
+# 직접 작성한 모듈
+from metrics import OUTBOUND_RETRIES, CIRCUIT_REJECTED, register_dependencies
+from settings import (OAUTH_TIMEOUT, SMTP_TIMEOUT, OUTBOUND_MAX_RETRIES, OUTBOUND_BACKOFF_BASE,
+                      CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_RESET_SECONDS)
+from tracing import span
+
+logger = logging.getLogger("graduon.resilience")
+
+T = TypeVar("T")
+
+CLOSED, HALF_OPEN, OPEN = "closed", "half_open", "open"
+
+# 요청이 상대에게 전달되지 않은 것이 확실한 오류 (멱등하지 않은 호출도 재시도 가능)
+NOT_SENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, ConnectionRefusedError, ConnectionErrors)
+# 일시적인 오류 (멱등한 호출만 재시도, requests의 오류는 OSError)
+TRANSIENT_ERRORS = NOT_SENT_ERRORS + (httpx.TransportError, GoogleTransportError, asyncio.TimeoutError, OSError)
+
+
+class DependencyUnavailable(HTTPException):
+    """외부 서비스를 사용할 수 없음 (차단 중이거나 재시도 후에도 실패)"""
+
+    def __init__(self, dependency: str, retry_after: float, reason: str):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"{dependency} 서비스에 연결할 수 없습니다. 잠시 후 다시 시도해 주세요. ({reason})",
+            headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+        )
+        self.dependency = dependency
+
+
+def is_transient(error: BaseException) -> bool:
+    """서비스 장애로 볼 오류인지 (차단기 실패 횟수, 재시도 대상)"""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code >= 500 or error.response.status_code == 429
+    return isinstance(error, TRANSIENT_ERRORS)
+
+
+class CircuitBreaker:
+    def __init__(self, failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD, reset_timeout: float = CIRCUIT_RESET_SECONDS):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._trial_running = False
+
+    def remaining(self) -> float:
+        """차단이 풀리기까지 남은 시간 (초)"""
+        return max(0.0, self.opened_at + self.reset_timeout - time.monotonic())
+
+    def allow(self) -> bool:
+        if self.state == OPEN:
+            if self.remaining() > 0:
+                return False
+            self.state = HALF_OPEN
+        if self.state == HALF_OPEN:
+            # 시험 요청은 한 번에 하나만
+            if self._trial_running:
+                return False
+            self._trial_running = True
+        return True
+
+    def record_success(self) -> None:
+        self.state = CLOSED
+        self.failures = 0
+        self._trial_running = False
+
+    def abandon(self) -> None:
+        """결과 없이 끝난 시도 (half-open 시험 요청이었으면 다음 요청이 다시 시험)"""
+        self._trial_running = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+            self.state = OPEN
+            self.opened_at = time.monotonic()
+        self._trial_running = False
+
+
+class Dependency:
+    """외부 서비스 하나 (타임아웃, 재시도, 차단기)"""
+
+    def __init__(self, name: str, timeout: float, max_retries: int = OUTBOUND_MAX_RETRIES,
+                 backoff_base: float = OUTBOUND_BACKOFF_BASE, breaker: CircuitBreaker = None):
+        self.name = name
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.breaker = breaker or CircuitBreaker()
+
+    def backoff(self, attempt: int) -> float:
+        """attempt번째 재시도 전 대기 시간 (full jitter)"""
+        return random.uniform(0, self.backoff_base * 2 ** attempt)
+
+    async def call(self, operation: str, function: Callable[[], Awaitable[T]], idempotent: bool = False) -> T:
+        """
+        function()을 타임아웃/재시도/차단기 안에서 실행
+
+        :param operation: 메트릭 라벨 (token, user_info, send 등)
+        :param idempotent: 여러 번 보내도 결과가 같은 호출인지 (False면 연결 실패만 재시도)
+        :raises DependencyUnavailable: 차단 중이거나, 일시적인 오류가 재시도 후에도 계속된 경우
+        """
+        with span(f"{self.name} {operation}", **{"peer.service": self.name}) as call_span:
+            return await self._call(operation, function, idempotent, call_span)
+
+    async def _call(self, operation: str, function: Callable[[], Awaitable[T]], idempotent: bool, call_span) -> T:
+        for attempt in range(self.max_retries + 1):
+            if call_span is not None:
+                call_span.set(attempts=attempt + 1)
+            if not self.breaker.allow():
+                CIRCUIT_REJECTED.inc(dependency=self.name)
+                raise DependencyUnavailable(self.name, self.breaker.remaining() or 1, "차단 중")
+            try:
+                result = await asyncio.wait_for(function(), self.timeout)
+            except asyncio.CancelledError:
+                # 요청이 취소됨: 결과를 알 수 없으므로 성공/실패로 세지 않음
+                self.breaker.abandon()
+                raise
+            except Exception as error:
+                if not is_transient(error):
+                    # 상대가 응답한 오류 (4xx 등): 서비스는 정상
+                    self.breaker.record_success()
+                    raise
+                self.breaker.record_failure()
+                retryable = idempotent or isinstance(error, NOT_SENT_ERRORS)
+                if not retryable or attempt == self.max_retries:
+                    logger.warning("%s %s 실패 (시도 %d번): %r", self.name, operation, attempt + 1, error)
+                    reason = "시간 초과" if isinstance(error, asyncio.TimeoutError) else type(error).__name__
+                    raise DependencyUnavailable(self.name, self.breaker.remaining() or 1, reason) from error
+                OUTBOUND_RETRIES.inc(dependency=self.name, operation=operation)
+                await asyncio.sleep(self.backoff(attempt))
+            else:
+                self.breaker.record_success()
+                return result
+
+
+GOOGLE = Dependency("google", OAUTH_TIMEOUT)
+NAVER = Dependency("naver", OAUTH_TIMEOUT)
+KAKAO = Dependency("kakao", OAUTH_TIMEOUT)
+SMTP = Dependency("smtp", SMTP_TIMEOUT)
+register_dependencies(GOOGLE, NAVER, KAKAO, SMTP)
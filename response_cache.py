@@ -0,0 +1,144 @@
+"""
+학생별 응답 캐시
+
+`/course/all`, `/courses/semester/{semester}`, `/student/status`는 학생이 과목을 바꾸기 전까지 같은 응답을 반환합니다.
+인코딩된 JSON 바이트를 (경로, 학생, Student.revision, 파라미터) 키로 저장해 두고 그대로 보냅니다.
+
+- 과목을 등록/수정/삭제하면 revision이 올라가서 이전 키는 더 이상 조회되지 않음 (무효화가 따로 필요 없음, 남은 항목은 LRU로 밀려남)
+- 메모리 상한: 저장한 바이트 합계가 RESPONSE_CACHE_MAX_BYTES를 넘으면 오래전에 사용한 항목부터 제거
+- RESPONSE_CACHE_REDIS_URL을 설정하면 Redis를 공유 저장소로 함께 사용 (여러 워커가 같은 항목을 재사용)
+  - 메모리 캐시에 없을 때만 Redis를 조회하고, Redis 항목은 RESPONSE_CACHE_SHARED_TTL 후 만료
+  - Redis 오류는 캐시 없음으로 처리 (응답은 DB에서 만듦)
+- 적중률은 /metrics의 graduon_response_cache_requests_total{route, result}로 확인
+"""
+# 외부 라이브러리
+import pydantic_core
+from fastapi import Response
+# 내부 라이브러리
+import json
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional
+# 직접 작성한 모듈
+from metrics import RESPONSE_CACHE_REQUESTS, register_response_cache
+from settings import RESPONSE_CACHE_MAX_BYTES, RESPONSE_CACHE_REDIS_URL, RESPONSE_CACHE_SHARED_TTL
+
+logger = logging.getLogger("graduon.response_cache")
+
+# 항목마다 키, OrderedDict 노드 등으로 더 쓰는 메모리 (대략)
+ENTRY_OVERHEAD = 256
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    body: bytes  # 인코딩된 JSON
+    headers: tuple[tuple[str, str], ...] = ()  # 함께 보낼 헤더 (예: ETag)
+
+    @property
+    def size(self) -> int:
+        return len(self.body) + sum(len(name) + len(value) for name, value in self.headers) + ENTRY_OVERHEAD
+
+    def response(self) -> Response:
+        return Response(self.body, media_type="application/json", headers=dict(self.headers))
+
+    def dumps(self) -> bytes:
+        """공유 저장소용 (헤더 JSON 한 줄 + 본문)"""
+        return json.dumps(self.headers).encode("utf-8") + b"\n" + self.body
+
+    @classmethod
+    def loads(cls, data: bytes) -> "CachedResponse":
+        headers, body = data.split(b"\n", 1)
+        return cls(body, tuple(tuple(header) for header in json.loads(headers)))
+
+
+class RedisBackend:
+    """여러 워커가 함께 쓰는 저장소 (redis 패키지가 필요)"""
+
+    def __init__(self, url: str, ttl: int):
+        try:
+            import redis
+        except ImportError as error:
+            raise RuntimeError("RESPONSE_CACHE_REDIS_URL을 사용하려면 redis 패키지를 설치해야 합니다.") from error
+        self.client = redis.Redis.from_url(url, socket_timeout=0.05, socket_connect_timeout=0.05)
+        self.ttl = ttl
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.client.get(key)
+
+    def set(self, key: str, value: bytes) -> None:
+        self.client.set(key, value, ex=self.ttl)
+
+
+class ResponseCache:
+    def __init__(self, max_bytes: int, shared: Optional[RedisBackend] = None):
+        self.max_bytes = max_bytes
+        self.shared = shared
+        self.bytes = 0
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(route: str, student, *params) -> str:
+        """(경로, 학생, revision, 파라미터) -> 문자열 키 (공유 저장소에서도 같은 키)"""
+        return "|".join(("graduon:response", route, str(student.id), str(student.revision), *map(str, params)))
+
+    def get(self, route: str, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+        if cached is None and self.shared is not None:
+            cached = self._shared_get(key)
+            if cached is not None:
+                self._put(key, cached)
+        RESPONSE_CACHE_REQUESTS.inc(route=route, result="miss" if cached is None else "hit")
+        return cached
+
+    def set(self, key: str, value: Any, headers: dict[str, str] | None = None) -> CachedResponse:
+        """응답 모델(또는 목록)을 JSON으로 인코딩해서 저장 (FastAPI의 JSONResponse와 같은 바이트)"""
+        cached = CachedResponse(pydantic_core.to_json(value), tuple((headers or {}).items()))
+        self._put(key, cached)
+        if self.shared is not None:
+            try:
+                self.shared.set(key, cached.dumps())
+            except Exception:
+                logger.warning("공유 응답 캐시 저장 실패", exc_info=True)
+        return cached
+
+    def _shared_get(self, key: str) -> Optional[CachedResponse]:
+        try:
+            data = self.shared.get(key)
+        except Exception:
+            logger.warning("공유 응답 캐시 조회 실패", exc_info=True)
+            return None
+        return CachedResponse.loads(data) if data else None
+
+    def _put(self, key: str, cached: CachedResponse) -> None:
+        if cached.size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.bytes -= previous.size
+            self._entries[key] = cached
+            self.bytes += cached.size
+            while self.bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.bytes -= evicted.size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+
+RESPONSE_CACHE = ResponseCache(
+    RESPONSE_CACHE_MAX_BYTES,
+    RedisBackend(RESPONSE_CACHE_REDIS_URL, RESPONSE_CACHE_SHARED_TTL) if RESPONSE_CACHE_REDIS_URL else None,
+)
+register_response_cache("response", RESPONSE_CACHE)
@@ -0,0 +1,36 @@
+from pydantic import BaseModel, Field
+from typing import List, Optional
+from schemas.student import StudentResponse
+from schemas.course import CourseResponse
+from schemas.graduation import GraduationStatusResponse
+
+
+class SemesterSummaryResponse(BaseModel):
+    semester: str
+    courses: int = Field(..., description="과목 수")
+    credits: int = Field(..., description="학점 합계 (재수강 포함)")
+
+
+class CourseSummaryResponse(BaseModel):
+    courses: int = Field(..., description="등록된 과목 수")
+    total_credits: int = Field(..., description="학점 합계 (재수강 포함, 졸업 인정 학점은 graduation)")
+    major_credits: int = Field(..., description="전공 학점 합계 (재수강 포함)")
+    semesters: List[SemesterSummaryResponse] = Field(..., description="학기별 합계 (학기명 순)")
+
+
+class VersionsResponse(BaseModel):
+    catalog_version: str = Field(..., description="이수체계도 버전")
+    catalog_etag: str = Field(..., description="GET /catalog의 ETag (같으면 다시 받을 필요 없음)")
+    requirement_id: Optional[str] = Field(default=None, description="적용되는 졸업요건 id (학생 미등록이면 null)")
+    course_revision: Optional[int] = Field(default=None, description="과목 revision (GET /courses/changes의 since)")
+
+
+class BootstrapResponse(BaseModel):
+    has_student_info: bool
+    auth_type: str
+    auth_user_info: dict = Field(..., description="로그인 방식별 사용자 정보 (이메일, 이름, 프로필 이미지)")
+    student: Optional[StudentResponse] = None
+    courses: Optional[List[CourseResponse]] = Field(default=None, description="include=courses")
+    course_summary: Optional[CourseSummaryResponse] = Field(default=None, description="include=course_summary")
+    graduation: Optional[GraduationStatusResponse] = Field(default=None, description="include=graduation")
+    versions: Optional[VersionsResponse] = Field(default=None, description="include=versions")
@@ -1,4 +1,6 @@
 from pydantic import BaseModel, Field
+from datetime import datetime
+from typing import List, Optional
 
 
 class CourseCreateRequest(BaseModel):
@@ -20,4 +22,43 @@ class CourseResponse(BaseModel):
     is_major: bool
     is_retake: bool
     created_at: str
-    updated_at: str
\ No newline at end of file
+    updated_at: str
+
+class CourseSuggestionResponse(BaseModel):
+    course_name: str = Field(..., description="추천 과목명")
+    in_catalog: bool = Field(..., description="전공 이수체계도에 있는 과목인지")
+    code: Optional[str] = Field(default=None, description="과목 코드 (카탈로그 과목만)")
+    credits: Optional[int] = Field(default=None, description="학점 수 (카탈로그 과목만)")
+    category: Optional[str] = Field(default=None, description="이수 구분 (카탈로그 과목만)")
+    is_major: Optional[bool] = Field(default=None, description="전공 과목 여부 (카탈로그 과목만)")
+
+
+class CourseSyncItem(BaseModel):
+    id: Optional[int] = Field(default=None, description="기존 과목 id (없으면 새로 등록)")
+    updated_at: Optional[datetime] = Field(default=None, description="조회했을 때의 updated_at (id가 있으면 필수)")
+    course_name: str = Field(..., description="과목명", min_length=1, max_length=100)
+    credits: int = Field(..., description="학점 수", ge=1, le=10)
+    grade: float = Field(..., description="등급 (0.0~4.5)", ge=0.0, le=4.5)
+    is_major: bool = Field(default=False, description="전공 과목 여부")
+    is_retake: bool = Field(default=False, description="재수강 여부")
+
+
+class SemesterSyncRequest(BaseModel):
+    courses: List[CourseSyncItem] = Field(..., description="이 학기에 있어야 하는 과목 전체 (빠진 기존 과목은 삭제)",
+                                          max_length=30)
+
+
+class SemesterSyncResponse(BaseModel):
+    semester: str
+    inserted: int = Field(..., description="새로 등록한 과목 수")
+    updated: int = Field(..., description="수정한 과목 수")
+    deleted: int = Field(..., description="삭제한 과목 수")
+    unchanged: int = Field(..., description="바뀌지 않은 과목 수")
+    courses: List[CourseResponse] = Field(..., description="반영 후 이 학기 과목 전체")
+
+
+class CourseChangesResponse(BaseModel):
+    revision: int = Field(..., description="다음 요청의 since로 보낼 값")
+    resync: bool = Field(..., description="true면 upserted가 과목 전체 (가지고 있던 목록을 버리고 교체)")
+    upserted: List[CourseResponse] = Field(..., description="since 이후 등록/수정된 과목 (resync면 전체)")
+    deleted: List[int] = Field(..., description="since 이후 삭제된 과목 id")
@@ -0,0 +1,52 @@
+from pydantic import BaseModel, Field
+from typing import List, Optional
+
+
+class GradeWeight(BaseModel):
+    grade: float = Field(..., description="등급 (0.0~4.5)", ge=0.0, le=4.5)
+    weight: float = Field(..., description="가중치 (합이 1이 아니어도 됨)", ge=0.0)
+
+
+class PlannedCourseRequest(BaseModel):
+    course_name: str = Field(..., description="과목명 (이미 들은 과목이면 재수강으로 계산)", min_length=1, max_length=100)
+    credits: Optional[int] = Field(default=None, description="학점 수 (생략하면 이수체계도 학점)", ge=1, le=10)
+    min_grade: float = Field(default=0.0, description="예상 최저 등급 (distribution이 없을 때)", ge=0.0, le=4.5)
+    max_grade: float = Field(default=4.5, description="예상 최고 등급 (distribution이 없을 때)", ge=0.0, le=4.5)
+    distribution: Optional[List[GradeWeight]] = Field(default=None, description="등급별 가중치 (있으면 범위 대신 사용)",
+                                                      min_length=1, max_length=20)
+
+
+class GpaProjectionRequest(BaseModel):
+    courses: List[PlannedCourseRequest] = Field(..., description="앞으로 들을 과목", min_length=1, max_length=30)
+    target_gpa: Optional[float] = Field(default=None, description="목표 평점", ge=0.0, le=4.5)
+    scenarios: int = Field(default=5000, description="시뮬레이션 횟수", ge=100, le=20000)
+    seed: Optional[int] = Field(default=None, description="난수 시드 (같은 값이면 같은 결과)")
+
+
+class PercentileResponse(BaseModel):
+    percentile: int = Field(..., description="백분위 (5, 25, 50, 75, 95)")
+    gpa: float
+
+
+class HistogramBinResponse(BaseModel):
+    lower: float = Field(..., description="구간 시작 (포함)")
+    upper: float = Field(..., description="구간 끝")
+    probability: float = Field(..., description="이 구간에 들어간 시나리오 비율")
+
+
+class GpaProjectionResponse(BaseModel):
+    current_gpa: float = Field(..., description="현재 평점 (재수강 중복 제외)")
+    current_credits: int = Field(..., description="현재 평점에 들어가는 학점")
+    projected_credits: int = Field(..., description="예정 과목을 모두 들은 뒤 평점에 들어가는 학점")
+    retakes: List[str] = Field(default_factory=list, description="재수강으로 계산된 과목")
+    min_gpa: float = Field(..., description="가능한 최저 평점")
+    max_gpa: float = Field(..., description="가능한 최고 평점")
+    mean_gpa: float = Field(..., description="시뮬레이션 평균")
+    std_gpa: float = Field(..., description="시뮬레이션 표준편차")
+    percentiles: List[PercentileResponse]
+    histogram: List[HistogramBinResponse] = Field(..., description="0.1 단위 평점 분포")
+    scenarios: int
+    target_gpa: Optional[float] = None
+    target_probability: Optional[float] = Field(default=None, description="목표 평점 이상일 확률")
+    required_grade: Optional[float] = Field(
+        default=None, description="모든 예정 과목에서 이 등급 이상을 받으면 목표 도달 (불가능하면 null)")
@@ -0,0 +1,48 @@
+from pydantic import BaseModel, Field
+from typing import List
+
+
+class RuleProgressResponse(BaseModel):
+    id: str = Field(..., description="규칙 id (예: total_credits)")
+    type: str = Field(..., description="규칙 종류 (total_credits, major_credits, category_credits, required_courses, min_gpa)")
+    title: str = Field(..., description="규칙 이름")
+    required: float = Field(..., description="기준 (학점, 과목 수 또는 평점)")
+    current: float = Field(..., description="현재 값")
+    ratio: float = Field(..., description="진행률 (0.0~1.0)")
+    satisfied: bool = Field(..., description="충족 여부")
+    missing: List[str] = Field(default_factory=list, description="아직 이수하지 않은 과목 (required_courses만)")
+    provisional: bool = Field(False, description="기준값이 확인되지 않은 규칙 (참고용, 전체 satisfied 판단에서 제외)")
+
+
+class GraduationStatusResponse(BaseModel):
+    requirement_id: str = Field(..., description="적용된 졸업요건 id")
+    title: str = Field(..., description="적용된 졸업요건 이름 (입학년도 기준)")
+    satisfied: bool = Field(..., description="모든 규칙 충족 여부 (provisional 규칙 제외)")
+    earned_credits: int = Field(..., description="이수 학점 (재수강 중복 제외, F 제외)")
+    major_credits: int = Field(..., description="전공 이수 학점")
+    gpa: float = Field(..., description="평점 (재수강 중복 제외)")
+    rules: List[RuleProgressResponse]
+
+
+class PlannedCourseResponse(BaseModel):
+    code: str = Field(..., description="과목 코드")
+    course_name: str
+    credits: int
+    category: str = Field(..., description="이수 구분")
+    recommended_semester: str = Field(..., description="이수체계도 권장 학기")
+
+
+class PlannedSemesterResponse(BaseModel):
+    semester: str = Field(..., description="학기 (예: '3-1', 8학기 이후는 '5-1')")
+    courses: List[PlannedCourseResponse]
+    filler_credits: int = Field(..., description="교양/일반선택 등 자유롭게 채울 학점")
+    credits: int = Field(..., description="이 학기 총 학점")
+
+
+class GraduationPlanResponse(BaseModel):
+    requirement_id: str = Field(..., description="적용된 졸업요건 id")
+    credit_cap: int = Field(..., description="학기당 최대 학점")
+    semesters: List[PlannedSemesterResponse] = Field(..., description="남은 학기별 계획 (요건을 모두 채웠으면 빈 목록)")
+    unplanned_courses: List[str] = Field(default_factory=list, description="이수체계도에 없어서 배치하지 못한 필수 과목")
+    optimal: bool = Field(..., description="더 빨리 끝나는 계획이 없음이 확인되었는지 (false면 시간 안에 찾은 가장 좋은 계획)")
+    lower_bound: int = Field(..., description="최소 필요 학기 수 (하한)")
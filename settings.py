@@ -0,0 +1,106 @@
+"""
+선택 설정값
+
+`env.py`에 값이 있으면 그 값을, 없으면 아래 기본값을 사용합니다.
+필수 설정(DATABASE_URL, COOKIE_KEY 등)은 지금처럼 `env.py`에서 직접 import하고,
+운영 중 조절하는 튜닝 값만 여기에 모읍니다.
+"""
+# 직접 작성한 모듈
+import env
+
+
+def _get(name: str, default):
+    return getattr(env, name, default)
+
+
+# 개발 모드: 응답 헤더에 요청별 DB 쿼리 수/시간(X-DB-Query-Count, X-DB-Time-Ms)을 붙임
+DEBUG: bool = _get("DEBUG", False)
+
+# SQL 로그
+SQL_ECHO: bool = _get("SQL_ECHO", False)  # True면 모든 SQL을 stdout으로 출력 (개발용)
+QUERY_BUDGET: int = _get("QUERY_BUDGET", 15)  # 요청 하나가 이 개수보다 많은 쿼리를 실행하면 경고
+N_PLUS_ONE_THRESHOLD: int = _get("N_PLUS_ONE_THRESHOLD", 5)  # 같은 SQL이 요청 안에서 이만큼 반복되면 경고
+SLOW_QUERY_MS: float = _get("SLOW_QUERY_MS", 100.0)  # 이 시간(ms)보다 오래 걸린 SQL을 느린 쿼리로 기록
+SLOW_QUERY_SAMPLE_RATE: float = _get("SLOW_QUERY_SAMPLE_RATE", 1.0)  # 느린 쿼리 중 로그로 남길 비율 (0.0~1.0)
+
+# SQLite 운영 프로필 (DATABASE_URL이 sqlite 파일일 때만 적용)
+SQLITE_TUNED: bool = _get("SQLITE_TUNED", True)  # False면 드라이버 기본값(롤백 저널, 프라그마 없음) 사용
+SQLITE_BUSY_TIMEOUT_MS: int = _get("SQLITE_BUSY_TIMEOUT_MS", 5000)  # 쓰기 잠금 대기 시간
+SQLITE_MMAP_SIZE: int = _get("SQLITE_MMAP_SIZE", 256 * 1024 * 1024)  # bytes
+SQLITE_CACHE_SIZE_KB: int = _get("SQLITE_CACHE_SIZE_KB", 32 * 1024)  # 커넥션당 페이지 캐시
+SQLITE_POOL_SIZE: int = _get("SQLITE_POOL_SIZE", 8)
+SQLITE_MAX_OVERFLOW: int = _get("SQLITE_MAX_OVERFLOW", 8)
+SQLITE_MAINTENANCE_INTERVAL: float = _get("SQLITE_MAINTENANCE_INTERVAL", 300.0)  # wal_checkpoint/optimize 주기 (초)
+
+# 전공 카탈로그 (이수체계도)
+CATALOG_PATH: str = _get("CATALOG_PATH", None)  # None이면 data/catalog/curriculum.json
+CATALOG_STRICT: bool = _get("CATALOG_STRICT", False)  # True면 카탈로그에 없는 과목을 전공 과목으로 등록할 수 없음
+
+# 과목명 자동완성
+AUTOCOMPLETE_MIN_STUDENTS: int = _get("AUTOCOMPLETE_MIN_STUDENTS", 2)  # 카탈로그에 없는 과목명은 이만큼의 학생이 등록해야 추천
+
+# 졸업요건
+GRADUATION_RULES_DIR: str = _get("GRADUATION_RULES_DIR", None)  # None이면 data/graduation
+GRADUATION_CACHE_SIZE: int = _get("GRADUATION_CACHE_SIZE", 10000)  # 캐시할 졸업요건 평가 결과 수 (학생 수 기준)
+
+# 남은 학기 수강 계획
+PLANNER_CREDIT_CAP: int = _get("PLANNER_CREDIT_CAP", 18)  # 기본 학기당 최대 학점
+PLANNER_TIME_BUDGET_MS: float = _get("PLANNER_TIME_BUDGET_MS", 200.0)  # 학기 배치 탐색 시간 (넘으면 그때까지 찾은 가장 좋은 계획)
+PLANNER_CACHE_SIZE: int = _get("PLANNER_CACHE_SIZE", 2000)  # 캐시할 계획 수
+
+# 과목 변경 기록 (GET /courses/changes)
+COURSE_CHANGE_RETENTION: int = _get("COURSE_CHANGE_RETENTION", 200)  # 학생마다 남길 최근 revision 수 (그 이전부터 요청하면 전체 목록)
+
+# 페이지 서버 렌더링 (/dashboard, /my, /graduation-calculator)
+SSR_PAGES: bool = _get("SSR_PAGES", False)  # True면 학생 이름과 초기 데이터를 채운 HTML을 반환 (API 호출 없이 첫 화면)
+SSR_CACHE_SIZE: int = _get("SSR_CACHE_SIZE", 2000)  # 렌더링 결과 캐시 항목 수 ((페이지, 학생, revision)별)
+
+# 학생별 응답 캐시 (/course/all, /courses/semester/{semester}, /student/status)
+RESPONSE_CACHE_MAX_BYTES: int = _get("RESPONSE_CACHE_MAX_BYTES", 32 * 1024 * 1024)  # 메모리 상한 (0이면 메모리에 저장하지 않음)
+RESPONSE_CACHE_REDIS_URL: str = _get("RESPONSE_CACHE_REDIS_URL", None)  # 설정하면 워커 간 공유 (예: redis://localhost:6379/0, redis 패키지 필요)
+RESPONSE_CACHE_SHARED_TTL: int = _get("RESPONSE_CACHE_SHARED_TTL", 3600)  # 공유 저장소 항목 만료 (초)
+SINGLEFLIGHT_TIMEOUT: float = _get("SINGLEFLIGHT_TIMEOUT", 10.0)  # 캐시에 없는 응답을 계산하는 동안 기다리는 최대 시간 (초, 넘으면 503)
+
+# POST 재시도 (Idempotency-Key, POST /courses, POST /students)
+IDEMPOTENCY_TTL_HOURS: float = _get("IDEMPOTENCY_TTL_HOURS", 24.0)  # 처음 응답을 보관하는 시간 (지나면 같은 키를 새 요청으로 처리)
+
+# 쓰기 배치 (group commit, POST /courses, POST /students, 회원가입/인증)
+WRITE_COORDINATOR: bool = _get("WRITE_COORDINATOR", False)  # True면 쓰기 요청을 모아 한 트랜잭션으로 커밋 (SQLite 쓰기 경합 완화)
+WRITE_BATCH_MAX_SIZE: int = _get("WRITE_BATCH_MAX_SIZE", 64)  # 한 트랜잭션에 넣을 최대 작업 수
+WRITE_BATCH_MAX_DELAY_MS: float = _get("WRITE_BATCH_MAX_DELAY_MS", 2.0)  # 첫 작업 뒤 더 모으기 위해 기다리는 최대 시간
+
+# 요청 수 제한 (admission control)
+ADMISSION_CONTROL: bool = _get("ADMISSION_CONTROL", True)  # False면 제한 없이 모든 요청을 처리
+# 경로 등급 -> (동시 처리 수, 대기열 길이, 대기 시간 한도(초)), 없는 등급(probe)은 제한하지 않음
+ADMISSION_BUDGETS: dict = _get("ADMISSION_BUDGETS", {
+    "page": (128, 512, 1.0),  # 정적 파일, HTML 페이지
+    "api": (64, 256, 2.0),  # 일반 API
+    "heavy": (8, 32, 5.0),  # 과목 일괄 반영, 수강 계획
+    "external": (4, 16, 10.0),  # 이메일 송신, OAuth 콜백
+})
+
+# 상태 확인 (/health/ready)
+HEALTH_CACHE_SECONDS: float = _get("HEALTH_CACHE_SECONDS", 2.0)  # 확인 결과 재사용 시간 (확인 요청이 많아도 DB 조회는 이 주기마다 한 번)
+HEALTH_DB_TIMEOUT: float = _get("HEALTH_DB_TIMEOUT", 1.0)  # DB 왕복 제한 시간 (초)
+HEALTH_POOL_SATURATION: float = _get("HEALTH_POOL_SATURATION", 0.9)  # 사용 중인 커넥션 비율이 이 이상이면 준비 안 됨
+
+# 외부 서비스 호출 (OAuth provider, SMTP)
+OAUTH_TIMEOUT: float = _get("OAUTH_TIMEOUT", 5.0)  # OAuth provider 호출 한 번의 제한 시간 (초)
+SMTP_TIMEOUT: float = _get("SMTP_TIMEOUT", 15.0)  # 메일 송신 한 번의 제한 시간 (초)
+OUTBOUND_MAX_RETRIES: int = _get("OUTBOUND_MAX_RETRIES", 2)  # 일시적인 오류 재시도 횟수
+OUTBOUND_BACKOFF_BASE: float = _get("OUTBOUND_BACKOFF_BASE", 0.2)  # 재시도 대기 (0 ~ base * 2^n초 사이 무작위)
+CIRCUIT_FAILURE_THRESHOLD: int = _get("CIRCUIT_FAILURE_THRESHOLD", 5)  # 연속 실패가 이만큼이면 차단
+CIRCUIT_RESET_SECONDS: float = _get("CIRCUIT_RESET_SECONDS", 30.0)  # 차단 후 시험 요청을 보내기까지 (초)
+
+# 요청 추적 (span, 느린 요청의 단계별 시간)
+TRACING: bool = _get("TRACING", False)  # True면 요청마다 span을 기록 (쿠키 확인, 사용자 조회, SQL, OAuth/SMTP 호출)
+TRACE_SAMPLE_RATE: float = _get("TRACE_SAMPLE_RATE", 0.01)  # 끝난 요청 중 파일로 기록할 비율 (0.0~1.0)
+TRACE_SLOW_MS: float = _get("TRACE_SLOW_MS", 500.0)  # 이 시간(ms)보다 오래 걸린 요청은 비율과 관계없이 기록
+TRACE_EXPORT_PATH: str = _get("TRACE_EXPORT_PATH", "traces.jsonl")  # 기록할 파일 (JSON 한 줄씩 추가)
+TRACE_EXPORT_FORMAT: str = _get("TRACE_EXPORT_FORMAT", "jsonl")  # jsonl: span 하나가 한 줄, otlp: trace 하나가 OTLP JSON 한 줄
+TRACE_MAX_SPANS: int = _get("TRACE_MAX_SPANS", 1000)  # 요청 하나에 기록할 최대 span 수 (넘으면 버리고 개수만 기록)
+
+# 이벤트 루프 지연 감시 (async 엔드포인트 안의 동기 호출 찾기)
+LOOP_MONITOR: bool = _get("LOOP_MONITOR", True)  # False면 측정하지 않음
+LOOP_MONITOR_INTERVAL_MS: float = _get("LOOP_MONITOR_INTERVAL_MS", 50.0)  # 루프 지연 측정 주기
+LOOP_BLOCK_THRESHOLD_MS: float = _get("LOOP_BLOCK_THRESHOLD_MS", 100.0)  # 루프가 이 시간 이상 멈추면 스택과 경로를 기록
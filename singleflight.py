@@ -0,0 +1,53 @@
+"""
+동시에 들어온 같은 읽기 요청 합치기 (single-flight)
+
+탭을 여러 개 열거나 프론트엔드가 같은 요청을 두 번 보내면 같은 학생의 `/course/all`이 동시에 여러 개 들어옵니다.
+같은 키(경로, 학생, revision, 파라미터)로 진행 중인 계산이 있으면 새로 실행하지 않고 그 결과를 함께 기다립니다.
+
+- 처음 요청한 쪽(leader)의 계산은 별도 Task로 실행하므로, leader 요청이 취소되어도 기다리는 쪽은 결과를 받음
+- 계산이 예외로 끝나면 기다리던 모든 요청에 같은 예외가 전달됨
+- 기다리는 시간은 요청마다 timeout으로 제한 (넘으면 asyncio.TimeoutError, 계산은 계속 진행)
+- 계산이 끝나면 키를 지우므로 결과를 오래 보관하지는 않음 (보관은 response_cache)
+"""
+# 내부 라이브러리
+import asyncio
+from typing import Awaitable, Callable, Hashable, TypeVar
+# 직접 작성한 모듈
+from metrics import SINGLEFLIGHT_REQUESTS
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    def __init__(self):
+        self._calls: dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, route: str, key: Hashable, function: Callable[[], Awaitable[T]], timeout: float) -> T:
+        """
+        key로 진행 중인 계산이 있으면 그 결과를, 없으면 function()을 실행한 결과를 반환
+
+        :param route: 메트릭 라벨
+        :raises asyncio.TimeoutError: timeout초 안에 계산이 끝나지 않은 경우
+        """
+        future = self._calls.get(key)
+        if future is None:
+            SINGLEFLIGHT_REQUESTS.inc(route=route, role="leader")
+            future = self._calls[key] = asyncio.ensure_future(function())
+            future.add_done_callback(lambda _: self._forget(key, future))
+        else:
+            SINGLEFLIGHT_REQUESTS.inc(route=route, role="follower")
+        # shield: 기다리던 요청이 취소되거나 시간이 지나도 다른 요청을 위해 계산은 계속
+        return await asyncio.wait_for(asyncio.shield(future), timeout)
+
+    def _forget(self, key: Hashable, future: asyncio.Future) -> None:
+        if self._calls.get(key) is future:
+            del self._calls[key]
+        # 기다리는 요청이 모두 시간 초과로 떠난 경우 "exception was never retrieved" 경고 방지
+        if not future.cancelled():
+            future.exception()
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+
+READ_FLIGHTS = SingleFlight()
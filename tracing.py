@@ -0,0 +1,321 @@
+"""
+요청 단위 span 추적 (TRACING = True일 때)
+
+로그인이 느릴 때 시간이 쿠키 확인, 사용자 테이블 조회, 사용자 생성, OAuth 토큰 교환, SMTP 중 어디에서 쓰였는지
+메트릭만으로는 알 수 없습니다. 요청마다 trace를 만들고 단계마다 span(시작/끝 시각, 부모 span)을 기록합니다.
+
+- 요청 전체: `TracingMiddleware`가 root span (`GET /course/all` 등)
+- 단계: `@traced()`를 붙인 함수 (쿠키 확인, 사용자 조회/생성), `with span("이름"):` 블록
+- SQL: 모든 SQL 실행마다 span (`install(engine)`, 파라미터 값은 기록하지 않음)
+- 외부 서비스: `resilience.Dependency.call` 한 번이 span 하나 (재시도 횟수 포함)
+- 현재 span은 ContextVar에 있으므로 await, asyncio Task, asyncio.to_thread/스레드풀로 실행한 동기 함수까지 이어짐
+  (쓰기 배치의 writer Task처럼 요청 밖에서 실행되는 작업은 포함되지 않음)
+
+끝난 요청 중 TRACE_SAMPLE_RATE 비율, 그리고 TRACE_SLOW_MS보다 오래 걸린 요청은 모두 TRACE_EXPORT_PATH에 JSON 한 줄씩 기록합니다.
+(느린 요청을 놓치지 않도록 요청이 끝난 뒤에 결정, 파일 쓰기는 별도 스레드)
+
+- TRACE_EXPORT_FORMAT = "jsonl": span 하나가 한 줄 (jq 등으로 바로 분석)
+- TRACE_EXPORT_FORMAT = "otlp": trace 하나가 OTLP JSON(ExportTraceServiceRequest) 한 줄 (OpenTelemetry Collector의 파일 수신기로 읽을 수 있음)
+- 요청에 W3C `traceparent` 헤더가 있으면 그 trace id를 이어 쓰고, sampled 플래그가 있으면 항상 기록
+"""
+# 외부 라이브러리
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Scope, Receive, Send, Message
+# 내부 라이브러리
+import asyncio
+import functools
+import json
+import logging
+import os
+import queue
+import random
+import re
+import threading
+import time
+from contextvars import ContextVar
+from typing import Callable, Optional
+# 직접 작성한 모듈
+from metrics import route_template
+from settings import (TRACING, TRACE_SAMPLE_RATE, TRACE_SLOW_MS, TRACE_EXPORT_PATH, TRACE_EXPORT_FORMAT,
+                      TRACE_MAX_SPANS)
+
+logger = logging.getLogger("graduon.tracing")
+
+SERVICE_NAME = "graduon"
+_TRACEPARENT = re.compile(r"00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})")
+
+
+class Trace:
+    """요청 하나의 span 목록 (요청이 끝날 때 기록할지 결정)"""
+    __slots__ = ("trace_id", "parent_id", "spans", "sampled", "dropped")
+
+    def __init__(self, trace_id: Optional[str] = None, parent_id: Optional[str] = None, sampled: bool = False):
+        self.trace_id = trace_id or os.urandom(16).hex()
+        self.parent_id = parent_id  # traceparent 헤더로 받은 호출한 쪽 span
+        self.spans: list[Span] = []
+        self.sampled = sampled
+        self.dropped = 0
+
+
+class Span:
+    __slots__ = ("trace", "span_id", "parent_id", "name", "start_ns", "end_ns", "attributes", "error")
+
+    def __init__(self, trace: Trace, name: str, parent_id: Optional[str], attributes: dict):
+        self.trace = trace
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent_id
+        self.name = name
+        self.start_ns = time.time_ns()
+        self.end_ns = 0
+        self.attributes = attributes
+        self.error: Optional[str] = None
+        # span 수 상한 (N+1 쿼리가 수천 번 도는 요청도 메모리를 일정하게)
+        if len(trace.spans) < TRACE_MAX_SPANS:
+            trace.spans.append(self)
+        else:
+            trace.dropped += 1
+
+    def set(self, **attributes) -> None:
+        self.attributes.update(attributes)
+
+    def finish(self, error: Optional[BaseException] = None) -> None:
+        self.end_ns = time.time_ns()
+        if error is not None:
+            self.error = f"{type(error).__name__}: {error}"
+
+    def to_dict(self) -> dict:
+        return {
+            "traceId": self.trace.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_id,
+            "name": self.name,
+            "startTimeUnixNano": self.start_ns,
+            "endTimeUnixNano": self.end_ns,
+            "durationMs": round((self.end_ns - self.start_ns) / 1e6, 3),
+            "attributes": self.attributes,
+            "error": self.error,
+        }
+
+
+_current: ContextVar[Optional[Span]] = ContextVar("graduon_span", default=None)
+
+
+def current_span() -> Optional[Span]:
+    return _current.get()
+
+
+class SpanContext:
+    """span()이 반환하는 컨텍스트 매니저 (동기/비동기 겸용, 요청 밖이면 아무것도 기록하지 않음)"""
+    __slots__ = ("name", "attributes", "span", "token")
+
+    def __init__(self, name: str, attributes: dict):
+        self.name = name
+        self.attributes = attributes
+        self.span: Optional[Span] = None
+        self.token = None
+
+    def __enter__(self) -> Optional[Span]:
+        parent = _current.get()
+        if parent is None:
+            return None
+        self.span = Span(parent.trace, self.name, parent.span_id, self.attributes)
+        self.token = _current.set(self.span)
+        return self.span
+
+    def __exit__(self, exc_type, exc, tb):
+        if self.span is not None:
+            _current.reset(self.token)
+            self.span.finish(exc)
+        return False
+
+    async def __aenter__(self) -> Optional[Span]:
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return self.__exit__(exc_type, exc, tb)
+
+
+def span(name: str, **attributes) -> SpanContext:
+    """`with span("이름"):` 블록을 현재 span의 자식 span으로 기록"""
+    return SpanContext(name, attributes)
+
+
+def traced(name: Optional[str] = None) -> Callable:
+    """함수 호출 한 번을 span으로 기록하는 데코레이터 (이름을 생략하면 함수 이름)"""
+    def decorator(function: Callable) -> Callable:
+        span_name = name or function.__name__
+        if asyncio.iscoroutinefunction(function):
+            @functools.wraps(function)
+            async def async_wrapper(*args, **kwargs):
+                with span(span_name):
+                    return await function(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with span(span_name):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+# SQL span
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    parent = _current.get()
+    if parent is None:
+        return
+    attributes = {"db.system": conn.dialect.name, "db.statement": " ".join(statement.split())}
+    if executemany:
+        attributes["db.rows"] = len(parameters)
+    conn.info.setdefault("graduon_spans", []).append(Span(parent.trace, "sql", parent.span_id, attributes))
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current.get() is not None and conn.info.get("graduon_spans"):
+        conn.info["graduon_spans"].pop().finish()
+
+
+def _handle_error(exception_context) -> None:
+    connection = exception_context.connection
+    if connection is not None and _current.get() is not None and connection.info.get("graduon_spans"):
+        connection.info["graduon_spans"].pop().finish(exception_context.original_exception)
+
+
+def install(engine: Engine) -> None:
+    """엔진에 SQL span 이벤트 등록 (TRACING = False면 아무것도 하지 않음)"""
+    if not TRACING:
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+# 기록
+
+def to_otlp(trace: Trace) -> dict:
+    """OTLP JSON (ExportTraceServiceRequest) 형식"""
+    def attribute(key, value) -> dict:
+        if isinstance(value, bool):
+            return {"key": key, "value": {"boolValue": value}}
+        if isinstance(value, int):
+            return {"key": key, "value": {"intValue": str(value)}}
+        if isinstance(value, float):
+            return {"key": key, "value": {"doubleValue": value}}
+        return {"key": key, "value": {"stringValue": str(value)}}
+
+    spans = []
+    for item in trace.spans:
+        otlp_span = {
+            "traceId": trace.trace_id,
+            "spanId": item.span_id,
+            "name": item.name,
+            "kind": 2 if item.parent_id == trace.parent_id else 1,  # SERVER (root) / INTERNAL
+            "startTimeUnixNano": str(item.start_ns),
+            "endTimeUnixNano": str(item.end_ns),
+            "attributes": [attribute(key, value) for key, value in item.attributes.items()],
+            "status": {"code": 2, "message": item.error} if item.error else {},
+        }
+        if item.parent_id:
+            otlp_span["parentSpanId"] = item.parent_id
+        spans.append(otlp_span)
+    return {"resourceSpans": [{
+        "resource": {"attributes": [attribute("service.name", SERVICE_NAME)]},
+        "scopeSpans": [{"scope": {"name": "graduon.tracing"}, "spans": spans}],
+    }]}
+
+
+class JsonLinesExporter:
+    """trace를 파일에 JSON 한 줄씩 추가 (파일 쓰기는 별도 스레드, 요청은 큐에 넣기만 함)"""
+
+    def __init__(self, path: str = TRACE_EXPORT_PATH, export_format: str = TRACE_EXPORT_FORMAT):
+        if export_format not in ("jsonl", "otlp"):
+            raise ValueError(f"TRACE_EXPORT_FORMAT은 jsonl 또는 otlp여야 합니다: {export_format!r}")
+        self.path = path
+        self.export_format = export_format
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def export(self, trace: Trace) -> None:
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._writer, name="trace-exporter", daemon=True)
+                    self._thread.start()
+        self._queue.put(trace)
+
+    def lines(self, trace: Trace) -> list[str]:
+        if self.export_format == "otlp":
+            return [json.dumps(to_otlp(trace), ensure_ascii=False)]
+        return [json.dumps(item.to_dict(), ensure_ascii=False) for item in trace.spans]
+
+    def _writer(self) -> None:
+        while True:
+            traces = [self._queue.get()]
+            # 밀려 있는 trace는 한 번에 씀
+            while len(traces) < 100:
+                try:
+                    traces.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                with open(self.path, "a", encoding="utf-8") as file:
+                    for trace in traces:
+                        file.writelines(line + "\n" for line in self.lines(trace))
+            except Exception:
+                logger.exception("trace 기록 실패 (%s)", self.path)
+
+
+class TracingMiddleware:
+    """요청마다 root span을 만들고, 끝난 요청 중 표본/느린 요청의 trace를 기록하는 ASGI 미들웨어"""
+
+    def __init__(self, app: ASGIApp, enabled: bool = TRACING, exporter: Optional[JsonLinesExporter] = None):
+        self.app = app
+        self.enabled = enabled
+        self.exporter = exporter or (JsonLinesExporter() if enabled else None)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if not self.enabled or scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        trace = self._start_trace(scope)
+        root = Span(trace, scope["method"], trace.parent_id, {"http.method": scope["method"], "http.target": scope["path"]})
+        token = _current.set(root)
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        error = None
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except BaseException as exception:
+            error = exception
+            raise
+        finally:
+            _current.reset(token)
+            root.finish(error)
+            route = route_template(scope)
+            root.name = f'{scope["method"]} {route}'
+            root.set(**{"http.route": route, "http.status_code": status_code})
+            if trace.dropped:
+                root.set(**{"trace.dropped_spans": trace.dropped})
+            slow = (root.end_ns - root.start_ns) / 1e6 >= TRACE_SLOW_MS
+            if trace.sampled or slow or random.random() < TRACE_SAMPLE_RATE:
+                self.exporter.export(trace)
+
+    @staticmethod
+    def _start_trace(scope: Scope) -> Trace:
+        for name, value in scope.get("headers", ()):
+            if name == b"traceparent":
+                match = _TRACEPARENT.fullmatch(value.decode("latin-1").strip())
+                if match:
+                    return Trace(match.group(1), match.group(2), sampled=bool(int(match.group(3), 16) & 1))
+                break
+        return Trace()
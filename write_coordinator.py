@@ -0,0 +1,157 @@
+"""
+쓰기 요청 모아서 커밋하기 (group commit, WRITE_COORDINATOR = True일 때)
+
+SQLite는 쓰기 잠금이 하나뿐이라 성적 입력 기간처럼 쓰기가 몰리면 `session.commit()`마다
+잠금을 차례로 기다리고, 커밋마다 WAL에 따로 기록합니다.
+켜 두면 쓰기 요청은 작업(unit of work)만 큐에 넣고, writer Task 하나가 여러 작업을 한 트랜잭션으로 실행합니다.
+
+- 큐에서 첫 작업을 꺼낸 뒤 WRITE_BATCH_MAX_DELAY_MS 동안, 또는 WRITE_BATCH_MAX_SIZE개가 찰 때까지 모아서 실행
+- 작업마다 SAVEPOINT 안에서 실행하므로 한 작업이 실패(IntegrityError, HTTPException 등)해도 그 작업만 되돌리고 예외는 그 요청에만 전달
+- 한 배치는 COMMIT 한 번 (SQLite는 BEGIN IMMEDIATE로 시작해서 배치 도중 잠금을 기다리지 않음), 커밋이 실패하면 배치의 모든 요청에 같은 예외
+- 배치는 스레드에서 실행하며, 그동안 들어온 요청은 다음 배치로 모임
+- 꺼져 있거나 writer가 시작되지 않았으면 (lifespan 밖) 요청의 세션에서 바로 실행하고 커밋
+
+작업은 `work(session) -> 결과` 함수이며 커밋하지 않습니다. 결과는 세션이 닫힌 뒤에 사용하므로
+ORM 객체 대신 응답 모델 등 값으로 반환합니다.
+"""
+# 외부 라이브러리
+import anyio.from_thread
+from sqlalchemy.engine import Engine
+from sqlmodel import Session
+# 내부 라이브러리
+import asyncio
+import logging
+import time
+from typing import Callable, Optional, TypeVar
+# 직접 작성한 모듈
+from database import engine
+from metrics import WRITE_BATCH_SIZE, WRITE_BATCH_SECONDS
+from settings import WRITE_COORDINATOR as ENABLED, WRITE_BATCH_MAX_SIZE, WRITE_BATCH_MAX_DELAY_MS
+
+logger = logging.getLogger("graduon.write_coordinator")
+
+T = TypeVar("T")
+Work = Callable[[Session], T]
+
+
+def run_in_session(session: Session, work: Work) -> T:
+    """작업을 session에서 실행하고 커밋 (실패하면 롤백 후 예외 전달)"""
+    try:
+        result = work(session)
+        session.commit()
+    except BaseException:
+        session.rollback()
+        raise
+    return result
+
+
+class WriteCoordinator:
+    def __init__(self, engine: Engine, enabled: bool = ENABLED, max_batch_size: int = WRITE_BATCH_MAX_SIZE,
+                 max_delay: float = WRITE_BATCH_MAX_DELAY_MS / 1000):
+        self.engine = engine
+        self.enabled = enabled
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    def start(self) -> None:
+        """writer Task 시작 (lifespan에서 호출, 꺼져 있으면 아무것도 하지 않음)"""
+        if not self.enabled:
+            return
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._writer())
+
+    async def stop(self) -> None:
+        """남은 작업을 처리한 뒤 writer Task 종료"""
+        if self._task is None:
+            return
+        task, self._task = self._task, None
+        await self._queue.join()
+        task.cancel()
+
+    async def run(self, session: Session, work: Work) -> T:
+        """작업 실행 (writer가 있으면 배치로, 없으면 session에서 바로)"""
+        if self._task is None:
+            return run_in_session(session, work)
+        # 기다리는 동안 요청의 커넥션을 풀에 돌려줌 (기다리는 요청들이 풀을 다 잡으면 writer가 커넥션을 얻지 못함)
+        # close()는 객체를 만료시키지 않으므로 이미 읽은 값(student.id 등)은 작업 안에서 그대로 사용 가능
+        session.close()
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((work, future))
+        return await future
+
+    def run_sync(self, session: Session, work: Work) -> T:
+        """동기(def) 엔드포인트용 run (FastAPI 스레드풀에서 이벤트 루프로 넘김)"""
+        if self._task is None:
+            return run_in_session(session, work)
+        return anyio.from_thread.run(self.run, session, work)
+
+    async def _writer(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_delay
+            while len(batch) < self.max_batch_size:
+                if not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                    continue
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            # 응답을 기다리지 않게 된 요청(연결 종료 등)의 작업은 실행하지 않음
+            pending = [(work, future) for work, future in batch if not future.done()]
+            outcomes = []
+            if pending:
+                try:
+                    outcomes = await asyncio.to_thread(self._commit_batch, [work for work, _ in pending])
+                except Exception as error:
+                    logger.exception("쓰기 배치 실행 실패")
+                    outcomes = [(None, error)] * len(pending)
+            for (_, future), (result, error) in zip(pending, outcomes):
+                if future.done():
+                    continue
+                if error is None:
+                    future.set_result(result)
+                else:
+                    future.set_exception(error)
+            for _ in batch:
+                self._queue.task_done()
+
+    def _commit_batch(self, works: list[Work]) -> list[tuple]:
+        """작업들을 한 트랜잭션에서 실행 -> 작업별 (결과, 예외)"""
+        outcomes = []
+        started = time.perf_counter()
+        with Session(self.engine, expire_on_commit=False) as session:
+            if self.engine.dialect.name == "sqlite":
+                # 첫 SAVEPOINT가 트랜잭션을 시작하면 RELEASE가 곧 커밋이 되므로 먼저 BEGIN
+                session.connection().exec_driver_sql("BEGIN IMMEDIATE")
+            for work in works:
+                try:
+                    # SAVEPOINT를 해제하면서 flush하므로 제약 위반도 이 작업의 예외가 됨
+                    with session.begin_nested():
+                        result = work(session)
+                    outcomes.append((result, None))
+                except Exception as error:
+                    outcomes.append((None, error))
+            try:
+                session.commit()
+                outcome = "success"
+            except Exception as error:
+                session.rollback()
+                outcomes = [(None, error)] * len(works)
+                outcome = "error"
+        WRITE_BATCH_SIZE.observe(len(works))
+        WRITE_BATCH_SECONDS.observe(time.perf_counter() - started, outcome=outcome)
+        return outcomes
+
+
+WRITE_COORDINATOR = WriteCoordinator(engine)